@@ -0,0 +1,363 @@
+"""
+End-to-end pipeline benchmark with regression gating.
+
+Generates a synthetic project tree and stub scanner executables
+(stub_scanner.py) that emit each tool's JSON schema, then measures
+throughput and peak Python memory of every pipeline stage:
+detect_languages, _execute_command and Parser.parse per tool,
+Scorer.score, Analyzer.analyze and Reporter.save_json_report.
+
+    python benchmarks/bench_pipeline.py --findings 1000,100000 --save-baseline
+    python benchmarks/bench_pipeline.py --findings 1000,100000 --threshold 0.2
+
+Without --save-baseline the run is compared against the baseline file
+and exits non-zero when a stage's throughput drops, or its peak memory
+grows, by more than the threshold. A missing baseline also fails (exit 2).
+"""
+import os
+import sys
+import json
+import stat
+import time
+import random
+import shutil
+import argparse
+import contextlib
+import platform
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from secureops.analyzer import Analyzer
+from secureops.parser import Parser
+from secureops.reporter import Reporter
+from secureops.rule_engine import RuleEngine
+from secureops.scanner import ScannerOrchestrator
+from secureops.scorer import Scorer
+
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+TOOLS = ["bandit", "semgrep", "trivy", "checkov"]
+
+TOOL_COMMANDS = {
+    "bandit": ["bandit", "-r", "{repo}", "-f", "json"],
+    "semgrep": ["semgrep", "--config=auto", "--json", "{repo}"],
+    "trivy": ["trivy", "config", "--format", "json", "{repo}"],
+    "checkov": ["checkov", "-d", "{repo}", "--output", "json"]
+}
+
+# Seconds below which a stage is too short to compare reliably
+MIN_COMPARABLE_SECONDS = 0.05
+
+# Peak memory growth below this many MB is ignored
+MIN_COMPARABLE_MB = 1.0
+
+
+# -------------------------
+# Fixtures
+# -------------------------
+def generate_repo(root: Path, files: int, mix: dict, seed: int = 0):
+    """
+    Writes `files` source files spread over projects of ~50 files, each
+    project carrying the marker of its language, plus a few vendored
+    directories that the inventory should prune.
+    """
+    random.seed(seed)
+    languages = list(mix)
+    weights = [mix[language] for language in languages]
+
+    project = 0
+    written = 0
+
+    while written < files:
+        language = random.choices(languages, weights)[0]
+        project_dir = root / f"{language}_project_{project}"
+        src = project_dir / "src"
+        src.mkdir(parents=True)
+        project += 1
+
+        if language == "node":
+            (project_dir / "package.json").write_text('{"name": "p"}\n')
+            (project_dir / "node_modules" / "dep").mkdir(parents=True)
+            (project_dir / "node_modules" / "dep" / "index.js").write_text("module.exports = 1;\n")
+            suffix = ".js"
+        elif language == "go":
+            (project_dir / "go.mod").write_text("module example.com/p\n")
+            suffix = ".go"
+        elif language == "docker":
+            (project_dir / "Dockerfile").write_text("FROM python:3.11\nRUN pip install app\n")
+            suffix = ".sh"
+        elif language == "terraform":
+            suffix = ".tf"
+        else:
+            suffix = ".py"
+
+        for i in range(min(50, files - written)):
+            (src / f"file_{i}{suffix}").write_text(f"# synthetic file {i}\nvalue = {i}\n")
+            written += 1
+
+
+def write_stub_bin(bin_dir: Path):
+    """
+    One wrapper per tool name that execs stub_scanner.py with the
+    current interpreter.
+    """
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    stub = BENCH_DIR / "stub_scanner.py"
+
+    for tool in TOOLS:
+        wrapper = bin_dir / tool
+        wrapper.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{stub}" {tool} "$@"\n')
+        wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+# -------------------------
+# Measurement
+# -------------------------
+class Bench:
+    def __init__(self, measure_memory: bool = True):
+        self.measure_memory = measure_memory
+        self.results = {}
+
+    def run(self, name: str, function, count=None):
+        """
+        Times `function`, then repeats it under tracemalloc for its peak
+        allocation. `count` maps the return value to the number of items
+        processed. Returns the result of the timed run.
+        """
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+
+        peak_mb = None
+        if self.measure_memory:
+            tracemalloc.start()
+            try:
+                function()
+                peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            finally:
+                tracemalloc.stop()
+
+        items = count(result) if count else None
+
+        self.results[name] = {
+            "seconds": round(seconds, 4),
+            "items": items,
+            "items_per_second": round(items / seconds, 1) if items and seconds else None,
+            "peak_mb": round(peak_mb, 2) if peak_mb is not None else None
+        }
+
+        rate = f"{self.results[name]['items_per_second']:>14,.0f}/s" if items else " " * 16
+        memory = f"{peak_mb:>10.1f} MB" if peak_mb is not None else ""
+        print(f"  {name:<34} {seconds:>9.3f}s {rate} {memory}")
+
+        return result
+
+
+def bench_case(bench: Bench, repo: Path, findings: int, report_dir: Path):
+    per_tool = max(1, findings // len(TOOLS))
+    os.environ["SECUREOPS_STUB_FINDINGS"] = str(per_tool)
+
+    orchestrator = ScannerOrchestrator(str(repo))
+    engine = RuleEngine.default()
+    prefix = f"{findings}:"
+
+    parsed = []
+
+    for tool in TOOLS:
+        cmd = [part.format(repo=repo) for part in TOOL_COMMANDS[tool]]
+
+        raw = bench.run(
+            f"{prefix}_execute_command.{tool}",
+            lambda: orchestrator._execute_command(cmd),
+            count=lambda raw: per_tool
+        )
+
+        result = {
+            "tool": tool,
+            "language": ScannerOrchestrator.TOOL_LANGUAGE_LABELS[tool],
+            "raw": raw
+        }
+
+        parsed.extend(bench.run(
+            f"{prefix}Parser.parse.{tool}",
+            lambda result=result: Parser([result]).parse(),
+            count=len
+        ))
+
+        del raw, result
+
+    score_data = bench.run(
+        f"{prefix}Scorer.score",
+        lambda: Scorer(parsed).score(),
+        count=lambda _: len(parsed)
+    )
+
+    analyzed = bench.run(
+        f"{prefix}Analyzer.analyze",
+        lambda: Analyzer(parsed, engine).analyze(),
+        count=len
+    )
+
+    reporter = Reporter(report_dir=str(report_dir))
+    metadata = {"languages_detected": [], "files_scanned": 0}
+
+    def save_report():
+        # Silence the per-report "saved to" line
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            path = reporter.save_json_report(analyzed, score_data, metadata)
+        os.unlink(path)
+
+    bench.run(
+        f"{prefix}Reporter.save_json_report",
+        save_report,
+        count=lambda _: len(analyzed)
+    )
+
+
+# -------------------------
+# Baseline
+# -------------------------
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+
+        long_enough = max(current["seconds"], previous["seconds"]) >= MIN_COMPARABLE_SECONDS
+
+        if long_enough and current["items_per_second"] and previous["items_per_second"]:
+            ratio = current["items_per_second"] / previous["items_per_second"]
+            if ratio < 1 - threshold:
+                regressions.append(
+                    f"{name}: throughput {current['items_per_second']:,.0f}/s vs "
+                    f"{previous['items_per_second']:,.0f}/s ({(ratio - 1) * 100:+.1f}%)"
+                )
+
+        if current["peak_mb"] is not None and previous.get("peak_mb") is not None:
+            growth = current["peak_mb"] - previous["peak_mb"]
+            if growth > MIN_COMPARABLE_MB and current["peak_mb"] > previous["peak_mb"] * (1 + threshold):
+                regressions.append(
+                    f"{name}: peak memory {current['peak_mb']:.1f} MB vs {previous['peak_mb']:.1f} MB"
+                )
+
+    return regressions
+
+
+def parse_mix(value: str) -> dict:
+    mix = {}
+
+    for part in value.split(","):
+        language, _, weight = part.partition("=")
+        mix[language.strip()] = float(weight or 1)
+
+    unknown = set(mix) - {"python", "node", "go", "docker", "terraform"}
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown language(s): {', '.join(sorted(unknown))}")
+
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline benchmark")
+    parser.add_argument("--files", type=int, default=20000, help="Files in the synthetic repo")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default="python=40,node=25,go=15,docker=5,terraform=15",
+        help="Language weights of the synthetic repo"
+    )
+    parser.add_argument(
+        "--findings",
+        default="1000,10000,100000",
+        help="Comma-separated total findings per case, split evenly across tools"
+    )
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed regression (default 0.25 = 25%%)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output", help="Also write the results JSON here")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.findings.split(",") if size.strip()]
+    bench = Bench(measure_memory=not args.no_memory)
+    workdir = Path(tempfile.mkdtemp(prefix="secureops_bench_"))
+
+    try:
+        repo = workdir / "repo"
+        report_dir = workdir / "reports"
+        report_dir.mkdir()
+
+        print(f"[*] Generating {args.files} files in {repo}")
+        generate_repo(repo, args.files, args.mix)
+
+        write_stub_bin(workdir / "bin")
+        os.environ["PATH"] = f"{workdir / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}"
+
+        bench.run(
+            "detect_languages",
+            lambda: ScannerOrchestrator(str(repo)).detect_languages(),
+            count=lambda _: args.files
+        )
+
+        for size in sizes:
+            print(f"[*] {size} findings")
+            bench_case(bench, repo, size, report_dir)
+
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    run = {
+        "config": {
+            "files": args.files,
+            "mix": args.mix,
+            "findings": sizes,
+            "python": platform.python_version(),
+            "machine": platform.machine()
+        },
+        "results": bench.results
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(run, f, indent=2)
+        print(f"[+] Baseline saved to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        # A gate without a baseline would pass every run
+        print(f"[!] No baseline at {args.baseline}; run with --save-baseline first.")
+        return 2
+
+    previous = dict(baseline.get("results", {}))
+    if baseline.get("config", {}).get("files") != args.files:
+        print("[!] Baseline was recorded with a different repo size; skipping detect_languages.")
+        previous.pop("detect_languages", None)
+
+    regressions = compare(bench.results, previous, args.threshold)
+
+    for regression in regressions:
+        print(f"[!] REGRESSION {regression}")
+
+    if regressions:
+        return 1
+
+    print(f"[+] No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Classification throughput of the Analyzer rule engine.
+
+Builds N synthetic findings drawn from a few hundred distinct
+rule/message pairs (the shape of a large real scan) and times
+RuleEngine.classify and Analyzer.analyze over them.
+
+    python benchmarks/bench_rules.py --findings 1000000
+"""
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from secureops.analyzer import Analyzer
+from secureops.finding import Finding
+from secureops.rule_engine import RuleEngine
+
+
+MESSAGES = [
+    ("B105", "Possible hardcoded password: '{}'"),
+    ("B602", "subprocess call with shell=True identified, security issue."),
+    ("B201", "A Flask app appears to be run with debug=True"),
+    ("B311", "Standard pseudo-random generators are not suitable for security/cryptographic purposes."),
+    ("javascript.lang.security.detect-child-process.detect-child-process", "Detected calls to child_process from a function argument {}"),
+    ("go.lang.security.audit.crypto.use_of_weak_crypto.use-of-md5", "Detected MD5 hash algorithm which is considered insecure."),
+    ("DS002", "Image user should not be 'root'"),
+    ("CKV_AWS_20", "S3 Bucket has an ACL defined which allows public READ access."),
+]
+
+
+def build_findings(count: int, distinct: int):
+    random.seed(0)
+    variants = []
+
+    for i in range(distinct):
+        rule_id, template = MESSAGES[i % len(MESSAGES)]
+        variants.append((rule_id, template.format(f"value_{i}")))
+
+    findings = []
+    for i in range(count):
+        rule_id, message = variants[random.randrange(distinct)]
+        findings.append(Finding(
+            file=f"src/module_{i % 500}/file_{i % 97}.py",
+            line=i % 400 + 1,
+            issue=message,
+            severity="MEDIUM",
+            rule_id=rule_id,
+            tool="bandit",
+            language="python"
+        ))
+
+    return findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule engine benchmark")
+    parser.add_argument("--findings", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=300)
+    args = parser.parse_args()
+
+    findings = build_findings(args.findings, args.distinct)
+
+    start = time.perf_counter()
+    engine = RuleEngine.default()
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for finding in findings:
+        engine.classify_finding(finding)
+    classify_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analyzed = Analyzer(findings, engine).analyze()
+    analyze_time = time.perf_counter() - start
+
+    print(f"findings          : {len(analyzed)}")
+    print(f"distinct messages : {args.distinct}")
+    print(f"compile (ms)      : {compile_time * 1000:.2f}")
+    print(f"classify (s)      : {classify_time:.3f}  ({len(findings) / classify_time:,.0f}/s)")
+    print(f"analyze (s)       : {analyze_time:.3f}  ({len(findings) / analyze_time:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
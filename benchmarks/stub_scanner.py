@@ -0,0 +1,208 @@
+"""
+Stub bandit/semgrep/trivy/checkov executable for benchmarks.
+
+Invoked through a wrapper named after the tool (see bench_pipeline.py),
+it ignores its arguments apart from --version and writes
+SECUREOPS_STUB_FINDINGS findings in that tool's JSON schema to stdout,
+with paths under the first existing directory argument.
+
+    python benchmarks/stub_scanner.py semgrep --json /path/to/repo
+"""
+import os
+import sys
+import json
+
+
+SEVERITIES = {
+    "bandit": ["LOW", "MEDIUM", "HIGH"],
+    "semgrep": ["INFO", "WARNING", "ERROR"],
+    "trivy": ["LOW", "MEDIUM", "HIGH", "CRITICAL"],
+    "checkov": [None, "LOW", "MEDIUM", "HIGH"]
+}
+
+BANDIT_TESTS = [
+    ("B105", "hardcoded_password_string", "Possible hardcoded password: 'secret'"),
+    ("B602", "subprocess_popen_with_shell_equals_true", "subprocess call with shell=True identified, security issue."),
+    ("B201", "flask_debug_true", "A Flask app appears to be run with debug=True"),
+    ("B311", "blacklist", "Standard pseudo-random generators are not suitable for security/cryptographic purposes.")
+]
+
+SEMGREP_RULES = [
+    ("javascript.lang.security.detect-child-process.detect-child-process", "Detected calls to child_process from a function argument"),
+    ("go.lang.security.audit.crypto.use_of_weak_crypto.use-of-md5", "Detected MD5 hash algorithm which is considered insecure."),
+    ("python.lang.security.audit.subprocess-shell-true.subprocess-shell-true", "Found 'subprocess' function with 'shell=True'."),
+    ("javascript.express.security.audit.xss.direct-response-write", "Detected directly writing to a Response object.")
+]
+
+TRIVY_CHECKS = [
+    ("DS002", "Image user should not be 'root'"),
+    ("DS026", "No HEALTHCHECK defined"),
+    ("DS001", "':latest' tag used")
+]
+
+CHECKOV_CHECKS = [
+    ("CKV_AWS_20", "S3 Bucket has an ACL defined which allows public READ access."),
+    ("CKV_AWS_19", "Ensure all data stored in the S3 bucket is securely encrypted at rest"),
+    ("CKV_AWS_24", "Ensure no security groups allow ingress from 0.0.0.0:0 to port 22")
+]
+
+
+def _path(root: str, i: int, suffix: str) -> str:
+    return f"{root}/project_{i % 400}/src/module_{i % 37}/file_{i % 211}{suffix}"
+
+
+def bandit_item(root: str, i: int) -> dict:
+    test_id, test_name, text = BANDIT_TESTS[i % len(BANDIT_TESTS)]
+    line = i % 500 + 1
+    return {
+        "code": f"{line} password = 'secret_{i}'\n{line + 1} connect(password)\n",
+        "col_offset": 4,
+        "end_col_offset": 24,
+        "filename": _path(root, i, ".py"),
+        "issue_confidence": "MEDIUM",
+        "issue_cwe": {"id": 259, "link": "https://cwe.mitre.org/data/definitions/259.html"},
+        "issue_severity": SEVERITIES["bandit"][i % 3],
+        "issue_text": text,
+        "line_number": line,
+        "line_range": [line],
+        "more_info": f"https://bandit.readthedocs.io/en/latest/plugins/{test_id.lower()}_{test_name}.html",
+        "test_id": test_id,
+        "test_name": test_name
+    }
+
+
+def semgrep_item(root: str, i: int) -> dict:
+    check_id, message = SEMGREP_RULES[i % len(SEMGREP_RULES)]
+    line = i % 500 + 1
+    return {
+        "check_id": check_id,
+        "path": _path(root, i, ".js"),
+        "start": {"line": line, "col": 5, "offset": line * 40},
+        "end": {"line": line, "col": 42, "offset": line * 40 + 37},
+        "extra": {
+            "message": message,
+            "severity": SEVERITIES["semgrep"][i % 3],
+            "lines": f"    child_process.exec(userInput_{i} + ' --flag', callback)",
+            "fingerprint": f"{i:064x}",
+            "is_ignored": False,
+            "metadata": {
+                "category": "security",
+                "confidence": "MEDIUM",
+                "cwe": ["CWE-78: Improper Neutralization of Special Elements used in an OS Command"],
+                "owasp": ["A01:2017 - Injection", "A03:2021 - Injection"],
+                "references": ["https://owasp.org/Top10/A03_2021-Injection"],
+                "technology": ["javascript"],
+                "likelihood": "LOW",
+                "impact": "HIGH",
+                "source": f"https://semgrep.dev/r/{check_id}"
+            },
+            "metavars": {},
+            "engine_kind": "OSS"
+        }
+    }
+
+
+def trivy_item(root: str, i: int) -> dict:
+    check_id, title = TRIVY_CHECKS[i % len(TRIVY_CHECKS)]
+    return {
+        "Type": "Dockerfile Security Check",
+        "ID": check_id,
+        "AVDID": f"AVD-{check_id[:2]}-{check_id[2:].zfill(4)}",
+        "Title": title,
+        "Description": "Running containers with 'root' user can lead to a container escape situation.",
+        "Message": f"Specify at least 1 USER command in Dockerfile ({i})",
+        "Namespace": "builtin.dockerfile." + check_id,
+        "Resolution": "Add 'USER <non root user name>' line to the Dockerfile",
+        "Severity": SEVERITIES["trivy"][i % 4],
+        "PrimaryURL": f"https://avd.aquasec.com/misconfig/{check_id.lower()}",
+        "Status": "FAIL",
+        "CauseMetadata": {"Provider": "Dockerfile", "Service": "general", "StartLine": i % 40 + 1, "EndLine": i % 40 + 1}
+    }
+
+
+def checkov_item(root: str, i: int) -> dict:
+    check_id, name = CHECKOV_CHECKS[i % len(CHECKOV_CHECKS)]
+    start = i % 300 + 1
+    return {
+        "check_id": check_id,
+        "bc_check_id": f"BC_{check_id}",
+        "check_name": name,
+        "check_result": {"result": "FAILED", "evaluated_keys": ["acl"]},
+        "file_path": "/" + _path("", i, ".tf").lstrip("/"),
+        "file_abs_path": _path(root, i, ".tf"),
+        "file_line_range": [start, start + 12],
+        "resource": f"aws_s3_bucket.bucket_{i}",
+        "severity": SEVERITIES["checkov"][i % 4],
+        "guideline": f"https://docs.prismacloud.io/policy-reference/{check_id.lower()}"
+    }
+
+
+ITEMS = {
+    "bandit": bandit_item,
+    "semgrep": semgrep_item,
+    "trivy": trivy_item,
+    "checkov": checkov_item
+}
+
+
+def write_items(out, tool: str, root: str, count: int):
+    make = ITEMS[tool]
+    batch = []
+
+    for i in range(count):
+        batch.append(json.dumps(make(root, i)))
+        if len(batch) == 1000:
+            out.write((",".join(batch) + ",").encode() if i + 1 < count else ",".join(batch).encode())
+            batch = []
+
+    if batch:
+        out.write(",".join(batch).encode())
+
+
+def main():
+    tool = os.path.basename(sys.argv[1] if len(sys.argv) > 1 else "")
+    args = sys.argv[2:]
+
+    if tool not in ITEMS:
+        sys.exit(f"usage: stub_scanner.py {{{','.join(ITEMS)}}} ARGS...")
+
+    if "--version" in args:
+        print(f"{tool} 0.0.0-stub")
+        return
+
+    count = int(os.environ.get("SECUREOPS_STUB_FINDINGS", "1000"))
+    root = next((a for a in args if os.path.isdir(a)), "/repo").rstrip("/")
+    out = sys.stdout.buffer
+
+    if tool == "bandit":
+        out.write(b'{"errors": [], "generated_at": "2024-01-01T00:00:00Z", "metrics": {}, "results": [')
+        write_items(out, tool, root, count)
+        out.write(b"]}")
+    elif tool == "semgrep":
+        out.write(b'{"version": "1.0.0", "results": [')
+        write_items(out, tool, root, count)
+        out.write(b'], "errors": [], "paths": {"scanned": []}}')
+    elif tool == "trivy":
+        # Group misconfigurations into one Result per Dockerfile
+        out.write(b'{"SchemaVersion": 2, "ArtifactType": "filesystem", "Results": [')
+        per_target = 50
+        for start in range(0, count, per_target):
+            if start:
+                out.write(b",")
+            target = f"project_{start // per_target}/Dockerfile"
+            out.write(f'{{"Target": "{target}", "Class": "config", "Type": "dockerfile", "Misconfigurations": ['.encode())
+            out.write(",".join(
+                json.dumps(trivy_item(root, i)) for i in range(start, min(start + per_target, count))
+            ).encode())
+            out.write(b"]}")
+        out.write(b"]}")
+    else:
+        out.write(b'{"check_type": "terraform", "results": {"passed_checks": [], "failed_checks": [')
+        write_items(out, tool, root, count)
+        out.write(f'], "parsing_errors": []}}, "summary": {{"failed": {count}}}}}'.encode())
+
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()
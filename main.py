@@ -1,17 +1,18 @@
 import argparse
 import sys
-import time
-from datetime import datetime, UTC
-
-from secureops.scanner import ScannerOrchestrator
-from secureops.parser import Parser
-from secureops.scorer import Scorer
-from secureops.reporter import Reporter
-from secureops.analyzer import Analyzer
+
+from secureops.baseline import Baseline
+from secureops.cli import SUBCOMMANDS, run_subcommand, add_scan_arguments, check_scan_arguments
+from secureops.pipeline import run_scan
+from secureops.profiler import Profiler
 from secureops.fixer import Fixer
+from secureops.rule_engine import RuleEngine
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        sys.exit(run_subcommand(sys.argv[1:]))
+
     parser = argparse.ArgumentParser(
         description="SecureOps AI - Local DevSecOps Security Scanner"
     )
@@ -21,72 +22,76 @@ def main():
         help="Path to target project directory"
     )
 
-    parser.add_argument(
-        "--auto-fix",
-        action="store_true",
-        help="Automatically apply safe fixes"
-    )
+    add_scan_arguments(parser)
 
     args = parser.parse_args()
-    target_path = args.path
-
-    scan_start_time = datetime.now(UTC)
-    start_timer = time.time()
 
-    # -------------------------
-    # Run Scanners
-    # -------------------------
-    orchestrator = ScannerOrchestrator(target_path)
-    raw_results = orchestrator.run()
+    check_scan_arguments(parser, args)
+    target_path = args.path
 
-    if not raw_results:
-        print("No supported languages detected or no findings.")
-        sys.exit(0)
+    engine = RuleEngine.load(args.rules) if args.rules else RuleEngine.default()
 
-    tools_used = [result["tool"] for result in raw_results]
+    # Loaded before scanning so a bad path fails fast in CI
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = Baseline.load(args.baseline, fail_on=args.fail_on)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read baseline {args.baseline}: {e}")
+        print(f"[*] Loaded baseline with {len(baseline.entries)} finding(s) from {args.baseline}")
 
-    # -------------------------
-    # Parse Results
-    # -------------------------
-    parsed = Parser(raw_results).parse()
-
-    # -------------------------
-    # Score Findings
-    # -------------------------
-    score_data = Scorer(parsed).score()
-
-    # -------------------------
-    # Analyze Findings
-    # -------------------------
-    analyzed = Analyzer(parsed).analyze()
+    profiler = Profiler(
+        enabled=bool(args.profile or args.profile_trace or args.profile_prometheus)
+    )
 
-    scan_end_time = datetime.now(UTC)
-    duration = round(time.time() - start_timer, 2)
+    try:
+        result = run_scan(target_path, args, engine, profiler, baseline)
+    except RuntimeError as e:
+        print(f"[!] {e}")
+        sys.exit(1)
 
-    metadata = orchestrator.get_metadata()
-    metadata.update({
-        "scan_started_at": scan_start_time.isoformat(),
-        "scan_completed_at": scan_end_time.isoformat(),
-        "duration_seconds": duration,
-        "tools_used": tools_used
-    })
+    if result is None:
+        print("No supported languages detected or no findings.")
+        sys.exit(0)
 
-    # -------------------------
-    # Reporting
-    # -------------------------
-    reporter = Reporter(analyzed, score_data, metadata)
-    reporter.print_summary()
-    reporter.save_json_report()
+    fixable = result["fixable"]
+    metadata = result["metadata"]
 
     # -------------------------
     # Optional Auto Fix
     # -------------------------
-    if args.auto_fix:
+    if args.auto_fix or args.fix_plan:
         print("\n[*] Auto-fix mode enabled.")
-        Fixer(analyzed).apply_fixes()
+        with profiler.span("fixer", findings=len(fixable)):
+            Fixer(
+                fixable,
+                engine,
+                assume_yes=args.yes,
+                plan_path=args.fix_plan
+            ).apply_fixes()
     else:
         print("\n[*] Run with --auto-fix to apply safe fixes.")
 
+    if args.profile_trace:
+        profiler.write_chrome_trace(args.profile_trace)
+        print(f"[+] Profile trace saved to {args.profile_trace}")
+
+    if args.profile_prometheus:
+        profiler.write_prometheus(args.profile_prometheus)
+        print(f"[+] Profile metrics saved to {args.profile_prometheus}")
+
+    if baseline:
+        print(
+            f"[*] Baseline: {baseline.counts['new']} new, {baseline.counts['existing']} existing, "
+            f"{metadata['baseline']['fixed']} fixed"
+        )
+
+        if baseline.failed:
+            print(f"[!] {len(baseline.blocking)} new finding(s) at or above {args.fail_on}:")
+            for finding in baseline.blocking[:20]:
+                print(f"    {finding.severity:<8} {finding.file}:{finding.line} {finding.rule_id or finding.issue}")
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,7 @@
-from typing import List, Dict
+from typing import List, Iterable, Iterator, Optional
+
+from secureops.finding import Finding
+from secureops.rule_engine import Rule, RuleEngine
 
 
 class Analyzer:
@@ -7,86 +10,26 @@ class Analyzer:
     Rule-based. Offline. Deterministic.
     """
 
-    def __init__(self, findings: List[Dict]):
+    def __init__(self, findings: Iterable[Finding], engine: Optional[RuleEngine] = None):
         self.findings = findings
+        self.engine = engine or RuleEngine.default()
 
-    def analyze(self) -> List[Dict]:
-        enriched = []
+    def analyze(self) -> List[Finding]:
+        return list(self.iter_analyze())
 
+    def iter_analyze(self) -> Iterator[Finding]:
+        # Findings are enriched in place with a reference to the shared
+        # rule; explanation text is serialized from it on output
         for finding in self.findings:
-            enriched_finding = finding.copy()
-
-            rule_data = self._apply_rules(finding)
-
-            enriched_finding.update(rule_data)
+            yield self.enrich(finding)
 
-            enriched.append(enriched_finding)
-
-        return enriched
+    def enrich(self, finding: Finding) -> Finding:
+        finding.rule = self._apply_rules(finding)
+        return finding
 
     # --------------------------------------------------
     # Rule Engine
     # --------------------------------------------------
 
-    def _apply_rules(self, finding: Dict) -> Dict:
-        issue_text = (finding.get("issue") or "").lower()
-
-        # Default values
-        explanation = "No detailed explanation available."
-        risk_reason = "Potential security weakness."
-        recommended_fix = "Review the code and apply secure coding practices."
-        auto_fix_possible = False
-
-        # -------------------------
-        # Hardcoded Secrets
-        # -------------------------
-        if "hardcoded" in issue_text or "password" in issue_text:
-            explanation = (
-                "Hardcoded secrets expose sensitive credentials directly "
-                "in source code."
-            )
-            risk_reason = (
-                "If repository is leaked or shared, attackers gain access "
-                "to credentials immediately."
-            )
-            recommended_fix = (
-                "Move secrets to environment variables or a secure vault."
-            )
-            auto_fix_possible = True
-
-        # -------------------------
-        # subprocess shell=True
-        # -------------------------
-        elif "shell=true" in issue_text or "subprocess" in issue_text:
-            explanation = (
-                "Using subprocess with shell=True can allow command injection."
-            )
-            risk_reason = (
-                "User-controlled input may execute arbitrary system commands."
-            )
-            recommended_fix = (
-                "Avoid shell=True. Pass command as list and validate inputs."
-            )
-            auto_fix_possible = True
-
-        # -------------------------
-        # Debug Mode Enabled
-        # -------------------------
-        elif "debug" in issue_text:
-            explanation = (
-                "Debug mode exposes internal application state."
-            )
-            risk_reason = (
-                "Attackers may retrieve sensitive stack traces or environment details."
-            )
-            recommended_fix = (
-                "Disable debug mode in production environments."
-            )
-            auto_fix_possible = True
-
-        return {
-            "explanation": explanation,
-            "risk_reason": risk_reason,
-            "recommended_fix": recommended_fix,
-            "auto_fix_possible": auto_fix_possible
-        }
+    def _apply_rules(self, finding: Finding) -> Rule:
+        return self.engine.classify_finding(finding)
@@ -0,0 +1,193 @@
+import os
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from datetime import datetime, UTC
+from typing import List, Dict, Iterable, Iterator, Optional
+
+from secureops.finding import Finding
+from secureops.scorer import Scorer
+from secureops.streaming import JsonArrayStream
+
+
+class Baseline:
+    """
+    Accepted findings, keyed by fingerprint.
+    Loads from a baseline file or any JSON/NDJSON report (optionally
+    gzipped) without reading the whole document, keeping only a compact
+    entry per fingerprint. Findings are classified as they stream out
+    of the pipeline and marked on the finding itself: "existing" if the
+    fingerprint is in the baseline, or failing that if an unclaimed
+    entry has the same line-insensitive match key (so an edit above a
+    legacy finding does not make it new), "new" otherwise. Baseline
+    entries never claimed are "fixed".
+    """
+
+    FORMAT = "secureops-baseline"
+    VERSION = 1
+
+    def __init__(self, entries: Optional[Dict[str, Dict]] = None, fail_on: str = "HIGH"):
+        self.entries = entries or {}
+        self.threshold = Scorer.SEVERITY_MAP[Scorer.normalize_severity(fail_on)]
+        self.seen = set()
+        # Fingerprints per match key, in file order, for the fallback
+        self.by_match_key: Dict[str, List[str]] = {}
+        for fingerprint, entry in sorted(
+            self.entries.items(),
+            key=lambda item: (item[1].get("file") or "", item[1].get("line") or 0)
+        ):
+            if entry.get("match_key"):
+                self.by_match_key.setdefault(entry["match_key"], []).append(fingerprint)
+        self.counts = {"new": 0, "existing": 0}
+        self.blocking: List[Finding] = []
+
+    # -------------------------
+    # Loading
+    # -------------------------
+    @staticmethod
+    def _open(path: str):
+        if str(path).endswith(".gz"):
+            return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+        return open(path, encoding="utf-8", errors="replace")
+
+    @classmethod
+    def iter_findings(cls, path: str) -> Iterator[Dict]:
+        """
+        Finding dicts from a baseline file or a JSON/NDJSON report.
+        """
+        with cls._open(path) as f:
+            if ".ndjson" in Path(path).name:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                yield from JsonArrayStream(f, ("findings",))
+
+    @staticmethod
+    def entry(finding: Dict) -> Dict:
+        return {
+            "file": finding.get("file"),
+            "line": finding.get("line"),
+            "rule_id": finding.get("rule_id"),
+            "severity": finding.get("severity"),
+            "match_key": finding.get("match_key")
+        }
+
+    @classmethod
+    def load(cls, path: str, fail_on: str = "HIGH") -> "Baseline":
+        entries = {}
+
+        for finding in cls.iter_findings(path):
+            fingerprint = finding.get("fingerprint")
+            if fingerprint:
+                entries[fingerprint] = cls.entry(finding)
+
+        return cls(entries, fail_on)
+
+    # -------------------------
+    # Classification
+    # -------------------------
+    def classify(self, finding: Finding) -> str:
+        matched = self._match(finding)
+
+        if matched is not None:
+            self.seen.add(matched)
+            self.counts["existing"] += 1
+            finding.baseline = "existing"
+            return "existing"
+
+        self.counts["new"] += 1
+        finding.baseline = "new"
+        if Scorer.SEVERITY_MAP[Scorer.normalize_severity(finding.severity)] >= self.threshold:
+            self.blocking.append(finding)
+        return "new"
+
+    def _match(self, finding: Finding) -> Optional[str]:
+        """
+        Fingerprint of the unclaimed baseline entry a finding matches,
+        if any: its own, or else the first with its match key. Every
+        entry is claimed once, so N copies of a line in the baseline
+        cover at most N findings.
+        """
+        if finding.fingerprint in self.entries and finding.fingerprint not in self.seen:
+            return finding.fingerprint
+
+        for fingerprint in self.by_match_key.get(finding.match_key, ()):
+            if fingerprint not in self.seen:
+                return fingerprint
+
+        return None
+
+    def iter_classify(self, findings: Iterable[Finding]) -> Iterator[Finding]:
+        for finding in findings:
+            self.classify(finding)
+            yield finding
+
+    def fixed(self) -> List[Dict]:
+        return [
+            dict(entry, fingerprint=fingerprint)
+            for fingerprint, entry in self.entries.items()
+            if fingerprint not in self.seen
+        ]
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.blocking)
+
+    def get_metadata(self, path: str) -> Dict:
+        fixed = self.fixed()
+
+        return {
+            "path": path,
+            "baseline_findings": len(self.entries),
+            "new": self.counts["new"],
+            "existing": self.counts["existing"],
+            "fixed": len(fixed),
+            "fixed_findings": fixed,
+            "blocking": len(self.blocking),
+            "failed": self.failed
+        }
+
+    # -------------------------
+    # Writing
+    # -------------------------
+    @classmethod
+    def write(cls, findings: Iterable[Dict], path: str) -> int:
+        """
+        Writes a compact baseline from finding dicts, one entry per
+        fingerprint, sorted for stable diffs. Returns the entry count.
+        """
+        entries = {}
+        for finding in findings:
+            fingerprint = finding.get("fingerprint")
+            if fingerprint:
+                entries[fingerprint] = cls.entry(finding)
+
+        document = {
+            "format": cls.FORMAT,
+            "version": cls.VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "findings": [
+                dict(entries[fingerprint], fingerprint=fingerprint)
+                for fingerprint in sorted(entries)
+            ]
+        }
+
+        directory = Path(path).resolve().parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=1)
+                f.write("\n")
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return len(entries)
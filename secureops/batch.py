@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import argparse
+import contextlib
+from pathlib import Path
+from datetime import datetime, UTC
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional
+
+from secureops.pipeline import run_scan
+from secureops.rule_engine import RuleEngine
+from secureops.scorer import Scorer
+
+
+# Rule engines loaded in this process, by rule pack path; batch and
+# server workers keep theirs (and its classification memo) across scans
+_ENGINES: Dict[Optional[str], RuleEngine] = {}
+
+
+def cached_engine(rules: Optional[str]) -> RuleEngine:
+    if rules not in _ENGINES:
+        _ENGINES[rules] = RuleEngine.load(rules) if rules else RuleEngine.default()
+    return _ENGINES[rules]
+
+
+def scan_repository(target: str, args: argparse.Namespace, report_dir: str) -> Dict:
+    """
+    Scans one repository of a batch inside a pool worker. Its console
+    output goes to scan.log beside its reports so concurrent scans do
+    not interleave.
+    """
+    Path(report_dir).mkdir(parents=True, exist_ok=True)
+    started = time.time()
+    row = {"target": target, "report_dir": report_dir}
+
+    with open(Path(report_dir) / "scan.log", "w") as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            result = run_scan(target, args, cached_engine(args.rules), report_dir=report_dir)
+        except Exception as e:
+            print(f"[!] Scan failed: {e}")
+            row.update({"status": "error", "error": str(e)})
+            result = None
+        else:
+            row["status"] = "ok" if result else "empty"
+
+    row["duration_seconds"] = round(time.time() - started, 2)
+
+    if result:
+        summary = dict(result["score_data"])
+        summary.pop("rollup", None)
+        row.update({
+            "summary": summary,
+            "report_paths": result["report_paths"],
+            "tools_used": result["metadata"].get("tools_used", []),
+            "files_scanned": result["metadata"].get("files_scanned")
+        })
+
+    return row
+
+
+class BatchScanner:
+    """
+    Scans many repositories over one shared process pool.
+    Each worker process pays interpreter startup and imports once and
+    keeps its rule engine and scanner version cache across the
+    repositories it is handed, so wall time is bounded by the number of
+    cores rather than the number of repositories. Every repository gets
+    its own report directory; one aggregated summary covers the batch.
+    """
+
+    def __init__(
+        self,
+        repos: List[str],
+        args: argparse.Namespace,
+        report_dir: str = "reports",
+        workers: Optional[int] = None
+    ):
+        self.repos = repos
+        self.args = args
+        self.report_dir = Path(report_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.rows: List[Dict] = []
+
+    @staticmethod
+    def read_manifest(path: str) -> List[str]:
+        """
+        One repository path per line; blank lines and # comments are
+        skipped, relative paths are resolved against the manifest.
+        """
+        base = Path(path).resolve().parent
+        repos = []
+
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    repos.append(str((base / line).resolve()))
+
+        return repos
+
+    def _report_dirs(self) -> List[str]:
+        """
+        reports/<repo name>, suffixed when two repositories share a name.
+        """
+        used = {}
+        dirs = []
+
+        for repo in self.repos:
+            name = Path(repo).resolve().name or "root"
+            used[name] = used.get(name, 0) + 1
+            if used[name] > 1:
+                name = f"{name}-{used[name]}"
+            dirs.append(str(self.report_dir / name))
+
+        return dirs
+
+    def run(self) -> Dict:
+        started = time.time()
+        total = len(self.repos)
+
+        print(f"[*] Scanning {total} repositories with {self.workers} worker process(es)")
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, total)) as pool:
+            futures = [
+                pool.submit(scan_repository, repo, self.args, report_dir)
+                for repo, report_dir in zip(self.repos, self._report_dirs())
+            ]
+
+            for done, future in enumerate(as_completed(futures), 1):
+                row = future.result()
+                self.rows.append(row)
+                self._print_row(done, total, row)
+
+        return self.aggregate(round(time.time() - started, 2))
+
+    @staticmethod
+    def _print_row(done: int, total: int, row: Dict):
+        prefix = f"[{done}/{total}] {row['target']}"
+
+        if row["status"] == "error":
+            print(f"[!] {prefix}: failed ({row['error']}), see {row['report_dir']}/scan.log")
+        elif row["status"] == "empty":
+            print(f"[*] {prefix}: nothing to scan ({row['duration_seconds']}s)")
+        else:
+            summary = row["summary"]
+            print(
+                f"[+] {prefix}: {summary['total_findings']} finding(s), "
+                f"grade {summary['risk_grade']} ({row['duration_seconds']}s)"
+            )
+
+    # -------------------------
+    # Aggregation
+    # -------------------------
+    def aggregate(self, duration: float) -> Dict:
+        breakdown = dict.fromkeys(Scorer.SEVERITY_MAP, 0)
+        total = 0
+        weight = 0
+
+        for row in self.rows:
+            summary = row.get("summary")
+            if not summary:
+                continue
+            total += summary["total_findings"]
+            for severity, count in summary["severity_breakdown"].items():
+                breakdown[severity] += count
+                weight += count * Scorer.SEVERITY_MAP[severity]
+
+        risk_score = round(weight / total, 2) if total else 0
+
+        repositories = sorted(
+            self.rows,
+            key=lambda row: (row.get("summary") or {}).get("risk_score", -1),
+            reverse=True
+        )
+
+        return {
+            "batch_completed_at": datetime.now(UTC).isoformat(),
+            "duration_seconds": duration,
+            "workers": self.workers,
+            "repositories_scanned": len(self.rows),
+            "repositories_failed": sum(row["status"] == "error" for row in self.rows),
+            "summary": {
+                "total_findings": total,
+                "severity_breakdown": breakdown,
+                "risk_score": risk_score,
+                "risk_grade": Scorer.calculate_grade(risk_score)
+            },
+            "repositories": repositories
+        }
+
+    def save(self, aggregate: Dict) -> str:
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        path = self.report_dir / f"batch_{timestamp}.json"
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(aggregate, f, indent=2)
+
+        return str(path)
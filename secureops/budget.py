@@ -0,0 +1,120 @@
+import os
+import json
+import time
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from secureops.scheduler import ToolScheduler
+
+
+class Deadline:
+    """
+    Latency budget for one scan, measured from construction.
+    """
+
+    def __init__(self, seconds: Optional[float]):
+        self.seconds = seconds
+        self.started = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> Optional[float]:
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - self.elapsed())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, tool_timeout: Optional[float]) -> Optional[float]:
+        """
+        Seconds a command may run: the tool's own timeout, capped by
+        what is left of the budget. None means no limit.
+        """
+        limits = [limit for limit in (tool_timeout, self.remaining()) if limit is not None]
+        return min(limits) if limits else None
+
+
+class RuntimeHistory:
+    """
+    Exponentially weighted runtimes and finding counts per tool,
+    persisted between scans. Used to run the tools expected to find the
+    most per second of runtime first when a deadline is set.
+    """
+
+    ALPHA = 0.3
+
+    # Used when a deadline is set without an explicit --history
+    DEFAULT_PATH = ".secureops_history.json"
+
+    # Assumed seconds per unit of scheduler weight for tools never seen
+    DEFAULT_SECONDS_PER_WEIGHT = 10.0
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.tools: Dict[str, Dict] = {}
+
+        if self.path:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.tools = json.load(f).get("tools", {})
+            except (OSError, ValueError):
+                self.tools = {}
+
+    def expected_seconds(self, tool: str) -> float:
+        entry = self.tools.get(tool)
+        if entry:
+            return max(entry["seconds"], 0.01)
+        return ToolScheduler.TOOL_WEIGHTS.get(tool, 1) * self.DEFAULT_SECONDS_PER_WEIGHT
+
+    def expected_findings(self, tool: str) -> float:
+        entry = self.tools.get(tool)
+        return entry["findings"] if entry else 1.0
+
+    def value_per_second(self, tool: str) -> float:
+        # +1 keeps tools with no findings so far ordered by speed
+        return (self.expected_findings(tool) + 1) / self.expected_seconds(tool)
+
+    def order(self, tools: List[str]) -> List[str]:
+        return sorted(tools, key=self.value_per_second, reverse=True)
+
+    def record(self, tool: str, seconds: float, findings: int, complete: bool = True):
+        """
+        Folds one run into the averages. A run cut short only shows the
+        tool takes at least that long, so it can raise the expected
+        runtime but not lower it, and its finding count is ignored.
+        """
+        entry = self.tools.get(tool)
+
+        if entry is None:
+            self.tools[tool] = {"seconds": seconds, "findings": float(findings) if complete else 1.0, "runs": 1}
+            return
+
+        if complete:
+            entry["seconds"] += self.ALPHA * (seconds - entry["seconds"])
+            entry["findings"] += self.ALPHA * (findings - entry["findings"])
+        else:
+            entry["seconds"] = max(entry["seconds"], seconds)
+        entry["runs"] += 1
+
+    def save(self):
+        if not self.path:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"tools": self.tools}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[!] Could not save runtime history {self.path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
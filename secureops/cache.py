@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Optional
+
+
+class ScanCache:
+    """
+    Persistent, content-addressed store of normalized findings.
+    Entries are keyed by (file hash, tool, tool version, rule config)
+    and evicted by age and total size.
+    """
+
+    # Bump when the normalized finding schema changes
+    SCHEMA_VERSION = "2"
+
+    def __init__(
+        self,
+        cache_dir: str = ".secureops_cache",
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age_days: float = 30
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / "entries"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------
+    # Keys
+    # -------------------------
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    @classmethod
+    def make_key(cls, file_hash: str, tool: str, version: str, rule_config: str) -> str:
+        material = "\0".join([cls.SCHEMA_VERSION, file_hash, tool, version, rule_config])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / key[:2] / f"{key}.json"
+
+    # -------------------------
+    # Lookup / Store
+    # -------------------------
+    def get(self, key: str) -> Optional[List[Dict]]:
+        path = self._entry_path(key)
+
+        try:
+            with open(path) as f:
+                findings = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        # Refresh mtime so eviction treats the entry as recently used
+        os.utime(path)
+        self.hits += 1
+        return findings
+
+    def put(self, key: str, findings: List[Dict]):
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "w") as f:
+            json.dump(findings, f)
+
+        os.replace(tmp_path, path)
+
+    # -------------------------
+    # Eviction
+    # -------------------------
+    def evict(self) -> int:
+        """
+        Drops entries older than the age limit, then the least recently
+        used entries until the cache fits within the size limit.
+        Returns the number of entries removed.
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+
+        for path in self.entries_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            if now - stat.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        return removed
+
+    def get_metadata(self) -> Dict:
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses
+        }
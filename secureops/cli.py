@@ -0,0 +1,818 @@
+import os
+import argparse
+import json
+import time
+import signal
+from pathlib import Path
+from typing import Iterable, List
+
+from secureops.baseline import Baseline
+from secureops.budget import RuntimeHistory
+from secureops.batch import BatchScanner
+from secureops.fixer import Fixer
+from secureops.scanner import ScannerOrchestrator
+from secureops.semgrep_rules import SemgrepRulePack
+from secureops.server import ScanServer, make_http_server
+from secureops.shards import drain_queue
+from secureops.store import FindingStore
+from secureops.writers import WRITERS
+
+
+# --------------------------------------------------
+# Scan Options
+# --------------------------------------------------
+
+def add_scan_arguments(parser: argparse.ArgumentParser):
+    """
+    Options shared by `main.py <path>` and `main.py batch`.
+    """
+    parser.add_argument(
+        "--auto-fix",
+        action="store_true",
+        help="Automatically apply safe fixes"
+    )
+
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="With --auto-fix, apply all fixes without prompting"
+    )
+
+    parser.add_argument(
+        "--fix-plan",
+        metavar="PATCH",
+        help="Write all safe fixes as one unified diff instead of applying them"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Core budget for running scanners concurrently (0 = all cores)"
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse findings for unchanged files from the incremental scan cache"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        default=".secureops_cache",
+        help="Directory holding the scan cache (default: .secureops_cache)"
+    )
+
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=512,
+        help="Evict least recently used cache entries above this size"
+    )
+
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=30,
+        help="Evict cache entries unused for this many days"
+    )
+
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only scan files changed since this git ref"
+    )
+
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only scan files with uncommitted changes (same as --since HEAD)"
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Spool scanner output to disk and parse it incrementally to bound memory use"
+    )
+
+    parser.add_argument(
+        "--shard-queue",
+        metavar="DIR",
+        help="Split the target into per-project shards queued under DIR "
+             "(may be shared; other machines can join with `main.py worker DIR`)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Local worker processes draining the shard queue, scanning repositories "
+             "in `main.py batch` or serving `main.py serve` (default: all cores)"
+    )
+
+    parser.add_argument(
+        "--shard-lease",
+        type=float,
+        default=3600,
+        help="Seconds before a claimed shard is handed to another worker"
+    )
+
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Process each tool's output as soon as it finishes and show running totals "
+             "(profiling then covers the scan as a whole, not individual tools)"
+    )
+
+    parser.add_argument(
+        "--no-secrets",
+        action="store_true",
+        help="Skip the built-in secrets scanner"
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Latency budget for the scan: tools run in order of expected findings per second "
+             "and are killed or skipped when it runs out; partial results are still reported"
+    )
+
+    parser.add_argument(
+        "--tool-timeout",
+        metavar="[TOOL=]SECONDS",
+        help="Per-command timeout, for all tools or per tool, e.g. 300 or semgrep=120,checkov=60"
+    )
+
+    parser.add_argument(
+        "--history",
+        metavar="FILE",
+        help="Tool runtime history used to order tools under --deadline "
+             "(default with --deadline: .secureops_history.json; not kept otherwise)"
+    )
+
+    parser.add_argument(
+        "--rules",
+        metavar="PACK",
+        help="Analyzer/Fixer rule pack (JSON or YAML); defaults to the built-in pack"
+    )
+
+    parser.add_argument(
+        "--semgrep-rules",
+        metavar="DIR",
+        default=SemgrepRulePack.DEFAULT_DIR,
+        help="Local semgrep rule pack created by `main.py rules update` "
+             f"(default: {SemgrepRulePack.DEFAULT_DIR})"
+    )
+
+    parser.add_argument(
+        "--format",
+        default="json",
+        help="Report format(s), comma-separated: json, ndjson, sarif (default: json)"
+    )
+
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Gzip report files"
+    )
+
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON and SARIF reports (compact by default)"
+    )
+
+    parser.add_argument(
+        "--store",
+        metavar="DB",
+        help="Also record findings in this SQLite store (see `main.py query`)"
+    )
+
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="Baseline file or previous report; only findings not in it count as new (see `main.py baseline`)"
+    )
+
+    parser.add_argument(
+        "--fail-on",
+        default="HIGH",
+        choices=["LOW", "MEDIUM", "HIGH", "CRITICAL"],
+        help="With --baseline, exit non-zero if a new finding is at or above this severity (default: HIGH)"
+    )
+
+    parser.add_argument(
+        "--rollup-depth",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Directory levels in the per-directory risk rollup (default: 2, 0 for the repo root only)"
+    )
+
+    parser.add_argument(
+        "--codeowners",
+        metavar="FILE",
+        help="CODEOWNERS file for per-owner rollups (default: CODEOWNERS, .github/ or docs/ in the target)"
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage and per-tool timings, CPU, memory and output size in report metadata"
+    )
+
+    parser.add_argument(
+        "--profile-trace",
+        metavar="FILE",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of the run; implies --profile"
+    )
+
+    parser.add_argument(
+        "--profile-prometheus",
+        metavar="FILE",
+        help="Write profiling metrics in Prometheus textfile format; implies --profile"
+    )
+
+
+def check_scan_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    args.format = [fmt.strip() for fmt in args.format.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in args.format if fmt not in WRITERS]
+    if unknown:
+        parser.error(f"unknown report format(s): {', '.join(unknown)}")
+    if args.shard_queue and (args.since or args.changed_only):
+        parser.error("--shard-queue cannot be combined with --since/--changed-only")
+    if args.shard_queue and args.live:
+        parser.error("--shard-queue cannot be combined with --live")
+    if args.shard_queue and (args.deadline or args.tool_timeout):
+        parser.error("--shard-queue cannot be combined with --deadline/--tool-timeout")
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline must be positive")
+
+    try:
+        args.tool_timeout = parse_tool_timeouts(args.tool_timeout)
+    except ValueError as e:
+        parser.error(f"invalid --tool-timeout: {e}")
+
+
+# Options that write one shared file or prompt per run, so cannot apply
+# to the many scans of batch or serve
+PER_RUN_OPTIONS = (
+    "--auto-fix",
+    "--fix-plan",
+    "--shard-queue",
+    "--store",
+    "--baseline",
+    "--profile-trace",
+    "--profile-prometheus"
+)
+
+
+def reject_scan_arguments(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    options: Iterable[str],
+    command: str
+):
+    """
+    Errors out if any of `options` (scan flags, e.g. "--store") was given.
+    """
+    unsupported = [
+        option for option in options
+        if getattr(args, option.lstrip("-").replace("-", "_"))
+    ]
+    if unsupported:
+        parser.error(f"{', '.join(unsupported)} cannot be used with {command}")
+
+
+def parse_tool_timeouts(value: str) -> dict:
+    """
+    "300" applies to every external tool; "semgrep=120,checkov=60" sets
+    them per tool. In-process tools (the secrets scanner) have no
+    timeout.
+    """
+    timeouts = {}
+    if not value:
+        return timeouts
+
+    for part in value.split(","):
+        tool, _, seconds = part.strip().rpartition("=")
+        tools = [tool] if tool else [name for name, _ in ScannerOrchestrator.TOOL_LANGUAGES]
+
+        if tool and tool not in ScannerOrchestrator.TOOL_LANGUAGE_LABELS:
+            raise ValueError(f"unknown tool {tool}")
+        if tool in ScannerOrchestrator.IN_PROCESS_TOOLS:
+            raise ValueError(f"{tool} runs in process and cannot be timed out")
+        if float(seconds) <= 0:
+            raise ValueError(f"timeout must be positive: {part}")
+
+        for name in tools:
+            timeouts[name] = float(seconds)
+
+    return timeouts
+
+
+# --------------------------------------------------
+# Subcommands
+# --------------------------------------------------
+
+def rollback_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py rollback",
+        description="Restore files changed by an auto-fix run"
+    )
+
+    parser.add_argument(
+        "run",
+        help="Backup run directory or run id under .secureops_backups/"
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        restored = Fixer.rollback(args.run)
+    except (OSError, ValueError) as e:
+        print(f"[!] Rollback failed: {e}")
+        return 1
+
+    print(f"[+] Restored {restored} file(s) from {args.run}")
+    return 0
+
+
+def query_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py query",
+        description="Query findings recorded with --store"
+    )
+
+    parser.add_argument(
+        "db",
+        help="SQLite findings store"
+    )
+
+    parser.add_argument(
+        "--target",
+        help="Restrict to scans of this target directory"
+    )
+
+    parser.add_argument(
+        "--scan",
+        type=int,
+        help="Scan id to query (default: latest completed scan)"
+    )
+
+    parser.add_argument(
+        "--severity",
+        help="Comma-separated severities, e.g. HIGH,CRITICAL"
+    )
+
+    parser.add_argument(
+        "--path",
+        metavar="PREFIX",
+        help="Only findings under this target-relative path"
+    )
+
+    parser.add_argument(
+        "--tool",
+        help="Only findings reported by this tool"
+    )
+
+    parser.add_argument(
+        "--rule-id",
+        help="Only findings with this rule id"
+    )
+
+    parser.add_argument(
+        "--min-age-days",
+        type=float,
+        help="Only findings first seen at least this many days ago"
+    )
+
+    parser.add_argument(
+        "--trend",
+        action="store_true",
+        help="Show per-scan severity counts instead of findings"
+    )
+
+    parser.add_argument(
+        "--last",
+        type=int,
+        default=20,
+        help="Number of recent scans in --trend output (default: 20)"
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=1000,
+        help="Maximum findings to return (default: 1000)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON"
+    )
+
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).is_file():
+        print(f"[!] Findings store not found: {args.db}")
+        return 1
+
+    target = str(Path(args.target).resolve()) if args.target else None
+    severity = [s.strip() for s in args.severity.split(",")] if args.severity else None
+
+    start = time.perf_counter()
+    store = FindingStore(args.db)
+
+    try:
+        if args.trend:
+            rows = store.trend(
+                target=target,
+                severity=severity,
+                path_prefix=args.path,
+                tool=args.tool,
+                rule_id=args.rule_id,
+                last=args.last
+            )
+        else:
+            rows = store.query(
+                scan_id=args.scan,
+                target=target,
+                severity=severity,
+                path_prefix=args.path,
+                tool=args.tool,
+                rule_id=args.rule_id,
+                min_age_days=args.min_age_days,
+                limit=args.limit
+            )
+    finally:
+        store.close()
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    if args.trend:
+        for row in rows:
+            breakdown = ", ".join(
+                f"{severity}={count}"
+                for severity, count in sorted(row["severity_breakdown"].items())
+            )
+            print(
+                f"#{row['scan_id']:<5} {row['started_at'][:19]}  "
+                f"total={row['total']:<6} grade={row['risk_grade']}  {breakdown}"
+            )
+    else:
+        for row in rows:
+            print(
+                f"{row['severity']:<8} {row['file']}:{row['line']}  "
+                f"[{row['tools']}] {row['rule_id']}  first seen {(row['first_seen'] or '-')[:10]}"
+            )
+
+    print(f"[*] {len(rows)} row(s) in {elapsed_ms:.1f} ms")
+    return 0
+
+
+def rules_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py rules",
+        description="Manage the offline semgrep rule pack"
+    )
+
+    parser.add_argument(
+        "action",
+        choices=["update", "list", "use"],
+        help="update: snapshot rules; list: show versions; use: activate a version"
+    )
+
+    parser.add_argument(
+        "version",
+        nargs="?",
+        help="Version to activate (for `use`)"
+    )
+
+    parser.add_argument(
+        "--source",
+        default=SemgrepRulePack.DEFAULT_SOURCE,
+        help="Registry config (e.g. p/default) or local rule file/directory "
+             f"(default: {SemgrepRulePack.DEFAULT_SOURCE})"
+    )
+
+    parser.add_argument(
+        "--dir",
+        default=SemgrepRulePack.DEFAULT_DIR,
+        help=f"Rule pack directory (default: {SemgrepRulePack.DEFAULT_DIR})"
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.action == "update":
+            pack = SemgrepRulePack.snapshot(args.dir, args.source)
+            print(f"[+] Semgrep rules {pack.version} from {args.source} active in {pack.path}")
+
+        elif args.action == "use":
+            if not args.version:
+                parser.error("`use` requires a version")
+            SemgrepRulePack.activate(args.dir, args.version)
+            print(f"[+] Semgrep rules {args.version} active")
+
+        else:
+            current = SemgrepRulePack.current(args.dir)
+            for manifest in SemgrepRulePack.versions(args.dir):
+                marker = "*" if current and current.version == manifest["version"] else " "
+                print(
+                    f"{marker} {manifest['version']}  {manifest.get('created_at', '')[:19]}  "
+                    f"{manifest.get('source')}"
+                )
+
+    except (OSError, ValueError) as e:
+        print(f"[!] Rule pack {args.action} failed: {e}")
+        return 1
+
+    return 0
+
+
+def worker_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py worker",
+        description="Drain shards queued by `main.py <path> --shard-queue DIR`"
+    )
+
+    parser.add_argument(
+        "queue",
+        help="Shared shard queue directory"
+    )
+
+    parser.add_argument(
+        "--target",
+        help="Local checkout of the scanned repository, if not at the planned path"
+    )
+
+    parser.add_argument(
+        "--poll",
+        type=float,
+        default=0,
+        help="Keep waiting for new shards, checking every N seconds (default: exit when idle)"
+    )
+
+    args = parser.parse_args(argv)
+
+    if not Path(args.queue).is_dir():
+        print(f"[!] Shard queue not found: {args.queue}")
+        return 1
+
+    completed = 0
+
+    try:
+        while True:
+            completed += drain_queue(args.queue, args.target)
+            if not args.poll:
+                break
+            time.sleep(args.poll)
+    except KeyboardInterrupt:
+        pass
+
+    print(f"[+] Worker completed {completed} shard(s)")
+    return 0
+
+
+def baseline_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py baseline",
+        description="Write a baseline for --baseline from an existing report, without rescanning"
+    )
+
+    parser.add_argument(
+        "report",
+        nargs="?",
+        help="JSON or NDJSON report, optionally gzipped (default: newest in reports/)"
+    )
+
+    parser.add_argument(
+        "-o", "--output",
+        default=".secureops_baseline.json",
+        help="Baseline file to write (default: .secureops_baseline.json)"
+    )
+
+    parser.add_argument(
+        "--report-dir",
+        default="reports",
+        help="Directory searched for the newest report"
+    )
+
+    args = parser.parse_args(argv)
+
+    report = args.report
+    if not report:
+        candidates = [
+            path for pattern in ("report_*.json*", "report_*.ndjson*")
+            for path in Path(args.report_dir).glob(pattern)
+            if ".summary." not in path.name
+        ]
+        if not candidates:
+            print(f"[!] No reports found in {args.report_dir}")
+            return 1
+        report = str(max(candidates, key=lambda path: path.stat().st_mtime))
+
+    try:
+        count = Baseline.write(Baseline.iter_findings(report), args.output)
+    except (OSError, ValueError) as e:
+        print(f"[!] Could not build baseline from {report}: {e}")
+        return 1
+
+    print(f"[+] Baseline with {count} finding(s) from {report} written to {args.output}")
+    return 0
+
+
+def batch_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Scan many repositories over one shared worker pool"
+    )
+
+    parser.add_argument(
+        "repos",
+        nargs="*",
+        help="Repository directories to scan"
+    )
+
+    parser.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help="File listing one repository path per line (# comments allowed)"
+    )
+
+    parser.add_argument(
+        "--report-dir",
+        default="reports",
+        help="Reports go to <report-dir>/<repo name>/, the aggregate to <report-dir>/batch_*.json"
+    )
+
+    add_scan_arguments(parser)
+
+    args = parser.parse_args(argv)
+    check_scan_arguments(parser, args)
+
+    reject_scan_arguments(parser, args, PER_RUN_OPTIONS, "batch")
+
+    repos = list(args.repos)
+    if args.manifest:
+        try:
+            repos.extend(BatchScanner.read_manifest(args.manifest))
+        except OSError as e:
+            parser.error(f"cannot read manifest {args.manifest}: {e}")
+
+    missing = [repo for repo in repos if not os.path.isdir(repo)]
+    for repo in missing:
+        print(f"[!] Not a directory, skipping: {repo}")
+    repos = [repo for repo in repos if repo not in missing]
+
+    if not repos:
+        parser.error("no repositories to scan")
+
+    # Workers reopen their own file handles; keep relative options stable
+    args.cache_dir = os.path.abspath(args.cache_dir)
+    args.semgrep_rules = os.path.abspath(args.semgrep_rules)
+
+    batch = BatchScanner(repos, args, report_dir=args.report_dir, workers=args.workers)
+    aggregate = batch.run()
+    path = batch.save(aggregate)
+
+    summary = aggregate["summary"]
+    print(
+        f"[+] {aggregate['repositories_scanned']} repositories in {aggregate['duration_seconds']}s: "
+        f"{summary['total_findings']} finding(s), grade {summary['risk_grade']}"
+    )
+    print(f"[+] Aggregated report saved to {path}")
+
+    return 1 if aggregate["repositories_failed"] or missing else 0
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve_command(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py serve",
+        description="Serve scans over local HTTP or a Unix socket from a warm worker pool"
+    )
+
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (default: 127.0.0.1; there is no authentication)"
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="TCP port to listen on (default: 8765)"
+    )
+
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Listen on this Unix socket instead of TCP"
+    )
+
+    parser.add_argument(
+        "--result-cache",
+        type=int,
+        default=64,
+        metavar="N",
+        help="Recent scan results kept, keyed by tree state (default: 64)"
+    )
+
+    parser.add_argument(
+        "--report-dir",
+        help="Also write each scan's reports to <report-dir>/<job id>/ "
+             "(default: none, findings are returned in the response)"
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every request"
+    )
+
+    add_scan_arguments(parser)
+
+    args = parser.parse_args(argv)
+    check_scan_arguments(parser, args)
+
+    reject_scan_arguments(parser, args, PER_RUN_OPTIONS, "serve")
+
+    if args.result_cache < 1:
+        parser.error("--result-cache must be at least 1")
+
+    if not args.report_dir:
+        args.format = []
+
+    # Workers reopen their own file handles; keep relative options stable
+    args.cache_dir = os.path.abspath(args.cache_dir)
+    args.semgrep_rules = os.path.abspath(args.semgrep_rules)
+    if args.history or args.deadline:
+        args.history = os.path.abspath(args.history or RuntimeHistory.DEFAULT_PATH)
+
+    scan_server = ScanServer(
+        args,
+        workers=args.workers,
+        cache_entries=args.result_cache,
+        report_dir=args.report_dir
+    )
+
+    try:
+        httpd = make_http_server(scan_server, args.host, args.port, args.socket, args.verbose)
+    except OSError as e:
+        print(f"[!] Cannot listen on {args.socket or f'{args.host}:{args.port}'}: {e}")
+        return 1
+
+    scan_server.start()
+
+    # Stop cleanly under service managers too; set after the workers
+    # are forked so they keep the default handler
+    signal.signal(signal.SIGTERM, _interrupt)
+
+    address = args.socket or f"http://{args.host}:{httpd.server_address[1]}"
+    print(f"[+] Serving scans on {address} with {scan_server.workers} warm worker(s)")
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        scan_server.close()
+
+    status = scan_server.status()
+    print(
+        f"[+] Served {status['requests']} request(s): {status['scans']} scan(s), "
+        f"{status['cache_hits']} cache hit(s), {status['joined']} joined in flight"
+    )
+    return 0
+
+
+SUBCOMMANDS = {
+    "rollback": rollback_command,
+    "query": query_command,
+    "rules": rules_command,
+    "worker": worker_command,
+    "baseline": baseline_command,
+    "batch": batch_command,
+    "serve": serve_command
+}
+
+
+def run_subcommand(argv: List[str]) -> int:
+    """
+    Dispatches `main.py <subcommand> ...`; argv starts with the
+    subcommand name.
+    """
+    return SUBCOMMANDS[argv[0]](argv[1:])
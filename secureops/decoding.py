@@ -0,0 +1,156 @@
+import gc
+import os
+import json
+import contextlib
+from typing import Dict, List, Iterable, Iterator, Optional, Tuple
+
+from secureops.finding import Finding
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Items of an already decoded report projected per batch
+BATCH_SIZE = 4096
+
+
+# -------------------------
+# Field Extractors
+# -------------------------
+# Each returns (file, line, issue, severity, rule_id) from one item of a
+# tool's findings array. Nothing else is read: semgrep's extra.lines and
+# metadata, bandit's code snippets and the like are dropped with the item.
+
+def _bandit_fields(item: Dict) -> Tuple:
+    return (
+        item.get("filename"),
+        item.get("line_number"),
+        item.get("issue_text"),
+        item.get("issue_severity"),
+        item.get("test_id")
+    )
+
+
+def _semgrep_fields(item: Dict) -> Tuple:
+    extra = item.get("extra") or {}
+    return (
+        item.get("path"),
+        (item.get("start") or {}).get("line"),
+        extra.get("message"),
+        extra.get("severity"),
+        item.get("check_id")
+    )
+
+
+def _trivy_fields(misconf: Dict, target: Optional[str]) -> Tuple:
+    return (
+        target,
+        misconf.get("StartLine"),
+        misconf.get("Title"),
+        misconf.get("Severity"),
+        misconf.get("ID")
+    )
+
+
+def _checkov_fields(item: Dict) -> Tuple:
+    # file_path is relative to the -d module directory, so two modules'
+    # main.tf would collide
+    return (
+        item.get("file_abs_path") or item.get("file_path"),
+        (item.get("file_line_range") or [None])[0],
+        item.get("check_name"),
+        item.get("severity"),
+        item.get("check_id")
+    )
+
+
+FIELD_EXTRACTORS = {
+    "bandit": _bandit_fields,
+    "semgrep": _semgrep_fields,
+    "checkov": _checkov_fields
+}
+
+# Tools whose items group several findings: the list key, with the item
+# field passed along to each finding's extractor
+GROUPED_EXTRACTORS = {
+    "trivy": ("Misconfigurations", "Target", _trivy_fields)
+}
+
+DECODED_TOOLS = frozenset(FIELD_EXTRACTORS) | frozenset(GROUPED_EXTRACTORS)
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Suspends the cyclic garbage collector. Decoding allocates nothing
+    but fresh acyclic containers, yet each allocation burst triggers
+    collections that traverse every live object; on large scanner
+    outputs that costs more than the decoding itself.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def loads(data):
+    """
+    Decodes a JSON document with orjson when installed, the stdlib
+    otherwise. Both raise json.JSONDecodeError on invalid input.
+    """
+    with gc_paused():
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class FindingDecoder:
+    """
+    Projects one tool's decoded JSON items straight into Findings,
+    reading only the fields its extractor needs. `root` is the directory
+    the report's relative paths are based on, when the tool was run on
+    a subdirectory.
+    """
+
+    def __init__(self, tool: str, language: Optional[str], root: Optional[str] = None):
+        self.tool = tool
+        self.language = language
+        self.root = root
+
+    def decode(self, items: Iterable[Dict]) -> List[Finding]:
+        tool = self.tool
+        language = self.language
+        findings = []
+
+        with gc_paused():
+            if tool in GROUPED_EXTRACTORS:
+                key, parent_field, extract = GROUPED_EXTRACTORS[tool]
+                for item in items:
+                    if isinstance(item, dict):
+                        parent = item.get(parent_field)
+                        if self.root and parent:
+                            # Re-rooted on the scanned directory, so the
+                            # Dockerfiles of two directories stay apart
+                            parent = os.path.join(self.root, parent)
+                        for entry in item.get(key) or []:
+                            findings.append(Finding(*extract(entry, parent), tool, language))
+            else:
+                extract = FIELD_EXTRACTORS[tool]
+                for item in items:
+                    if isinstance(item, dict):
+                        findings.append(Finding(*extract(item), tool, language))
+
+        return findings
+
+    def iter_decode(self, batches: Iterable[List[Dict]]) -> Iterator[Finding]:
+        """
+        decode() over each batch of items as it arrives; streamed items
+        are dropped batch by batch once their fields are extracted.
+        """
+        for batch in batches:
+            yield from self.decode(batch)
@@ -0,0 +1,165 @@
+import re
+import hashlib
+from pathlib import Path
+from collections import OrderedDict
+from typing import List, Dict, Iterable, Optional
+
+from secureops.finding import Finding
+from secureops.rule_engine import RuleEngine
+from secureops.scorer import Scorer
+
+
+class Deduplicator:
+    """
+    Fingerprints findings and merges cross-tool duplicates in one pass.
+    A fingerprint combines the target-relative path, line, a hash of the
+    source line and the canonical rule category, so bandit and semgrep
+    (or trivy and checkov) reporting the same weakness collapse into one
+    finding that lists every contributing tool. Each finding also gets a
+    match key, the same material without the line, so a baseline still
+    recognizes it after unrelated edits shift it up or down the file.
+    """
+
+    SOURCE_CACHE_SIZE = 256
+
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(self, target_path: Optional[str] = None, engine: Optional[RuleEngine] = None):
+        self.target_path = Path(target_path).resolve() if target_path else None
+        self.engine = engine or RuleEngine.default()
+        self.findings_before = 0
+        self.findings_after = 0
+        self._sources = OrderedDict()
+        self._index: Dict[str, Finding] = {}
+
+    # -------------------------
+    # Fingerprinting
+    # -------------------------
+    def normalize_path(self, file: Optional[str]) -> str:
+        """
+        Target-relative POSIX path. Tools report absolute paths,
+        target-relative paths, or paths with a leading slash relative
+        to their scan root.
+        """
+        if not file:
+            return ""
+
+        path = Path(file)
+
+        if self.target_path:
+            if path.is_absolute() and path.is_relative_to(self.target_path):
+                return path.relative_to(self.target_path).as_posix()
+
+            relative = file.lstrip("/")
+            if (self.target_path / relative).exists():
+                return Path(relative).as_posix()
+
+        return path.as_posix().lstrip("/")
+
+    def _source_line(self, relative_path: str, line: Optional[int]) -> str:
+        if not line or not self.target_path:
+            return ""
+
+        lines = self._sources.get(relative_path)
+
+        if lines is None:
+            try:
+                text = (self.target_path / relative_path).read_text(errors="replace")
+                lines = text.splitlines()
+            except (OSError, ValueError):
+                lines = []
+
+            self._sources[relative_path] = lines
+            if len(self._sources) > self.SOURCE_CACHE_SIZE:
+                self._sources.popitem(last=False)
+        else:
+            self._sources.move_to_end(relative_path)
+
+        if 0 < line <= len(lines):
+            return self._WHITESPACE.sub(" ", lines[line - 1]).strip()
+
+        return ""
+
+    def _material(self, finding: Finding):
+        relative_path = self.normalize_path(finding.file)
+        context = self._source_line(relative_path, finding.line)
+        context_hash = hashlib.sha1(context.encode()).hexdigest()[:16]
+
+        # Without a canonical category, only same-tool duplicates merge
+        category = self.engine.category(finding.rule_id, finding.issue)
+        if category is None:
+            category = f"{finding.tool}:{finding.rule_id or finding.issue}"
+
+        return relative_path, context_hash, category
+
+    def fingerprint(self, finding: Finding) -> str:
+        return self._keys(finding)[0]
+
+    def _keys(self, finding: Finding):
+        """
+        (fingerprint, match key) of a finding. The match key leaves out
+        the line number.
+        """
+        relative_path, context_hash, category = self._material(finding)
+
+        material = "\0".join([relative_path, str(finding.line or 0), context_hash, category])
+        match = "\0".join([relative_path, context_hash, category])
+
+        return (
+            hashlib.sha1(material.encode()).hexdigest(),
+            hashlib.sha1(match.encode()).hexdigest()
+        )
+
+    # -------------------------
+    # Hash Index Stage
+    # -------------------------
+    def dedupe(self, findings: Iterable[Finding]) -> List[Finding]:
+        """
+        Merges findings with equal fingerprints in O(n), keeping the
+        first occurrence, the highest severity and every contributing tool.
+        """
+        for finding in findings:
+            self.merge(finding)
+
+        return list(self._index.values())
+
+    def merge(self, finding: Finding) -> Optional[Finding]:
+        """
+        Adds one finding to the index. Returns None if its fingerprint
+        is new, otherwise the earlier finding it was folded into.
+        """
+        self.findings_before += 1
+
+        fingerprint, match_key = self._keys(finding)
+        existing = self._index.get(fingerprint)
+
+        if existing is None:
+            finding.fingerprint = fingerprint
+            finding.match_key = match_key
+            finding.tools = [finding.tool]
+            self._index[fingerprint] = finding
+            self.findings_after += 1
+            return None
+
+        if finding.tool not in existing.tools:
+            existing.tools.append(finding.tool)
+
+        if self._rank(finding.severity) > self._rank(existing.severity):
+            existing.severity = finding.severity
+
+        return existing
+
+    @staticmethod
+    def _rank(severity: Optional[str]) -> int:
+        return Scorer.SEVERITY_MAP[Scorer.normalize_severity(severity)]
+
+    def get_metadata(self) -> Dict:
+        merged = self.findings_before - self.findings_after
+        ratio = round(merged / self.findings_before, 4) if self.findings_before else 0
+
+        return {
+            "findings_before": self.findings_before,
+            "findings_after": self.findings_after,
+            "duplicates_merged": merged,
+            "dedup_ratio": ratio
+        }
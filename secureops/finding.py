@@ -0,0 +1,108 @@
+import sys
+from typing import Dict, Optional
+
+from secureops.rule_engine import Rule
+
+
+class Finding:
+    """
+    Compact normalized finding.
+    Slots instead of a per-finding dict, interned repeated strings
+    (paths, tools, severities, rule IDs) and a reference to the shared
+    analysis Rule instead of copies of its explanation text.
+    Serializes to the same schema as the previous dict findings.
+    """
+
+    __slots__ = (
+        "file",
+        "line",
+        "issue",
+        "severity",
+        "rule_id",
+        "tool",
+        "language",
+        "rule",
+        "fingerprint",
+        "match_key",
+        "tools",
+        "baseline"
+    )
+
+    def __init__(
+        self,
+        file: Optional[str],
+        line: Optional[int],
+        issue: Optional[str],
+        severity: Optional[str],
+        rule_id: Optional[str] = None,
+        tool: Optional[str] = None,
+        language: Optional[str] = None
+    ):
+        self.file = _intern(file)
+        self.line = line
+        self.issue = issue
+        self.severity = _intern(severity)
+        self.rule_id = _intern(rule_id)
+        self.tool = _intern(tool)
+        self.language = _intern(language)
+        self.rule = None
+        self.fingerprint = None
+        self.match_key = None
+        self.tools = None
+        self.baseline = None
+
+    @property
+    def auto_fix_possible(self) -> bool:
+        return self.rule is not None and self.rule.fix is not None
+
+    # -------------------------
+    # Serialization
+    # -------------------------
+    def to_dict(self) -> Dict:
+        data = {
+            "file": self.file,
+            "line": self.line,
+            "issue": self.issue,
+            "severity": self.severity,
+            "rule_id": self.rule_id,
+            "tool": self.tool,
+            "language": self.language
+        }
+
+        if self.fingerprint is not None:
+            data["fingerprint"] = self.fingerprint
+            data["match_key"] = self.match_key
+            data["tools"] = self.tools
+
+        if self.baseline is not None:
+            data["baseline"] = self.baseline
+
+        if self.rule is not None:
+            data.update(self.rule.analysis)
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict, rule: Optional[Rule] = None) -> "Finding":
+        finding = cls(
+            data.get("file"),
+            data.get("line"),
+            data.get("issue"),
+            data.get("severity"),
+            data.get("rule_id"),
+            data.get("tool"),
+            data.get("language")
+        )
+        finding.rule = rule
+        finding.fingerprint = data.get("fingerprint")
+        finding.match_key = data.get("match_key")
+        finding.tools = data.get("tools")
+        finding.baseline = data.get("baseline")
+        return finding
+
+    def __repr__(self) -> str:
+        return f"Finding({self.tool}:{self.rule_id} {self.file}:{self.line} {self.severity})"
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
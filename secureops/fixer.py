@@ -1,21 +1,46 @@
+import os
+import re
+import json
 import shutil
-import difflib
+import tempfile
 from pathlib import Path
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, UTC
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from secureops.finding import Finding
+from secureops.patch import FilePatch
+from secureops.rule_engine import RuleEngine
 
 
 class Fixer:
     """
     Hardened structured auto-fix engine.
-    - Groups fixes per file
-    - Single backup per file
-    - Diff preview before apply
+    - Groups fixes per file and computes them in a worker pool
+    - Minimal byte-span edits that keep encoding and line endings
+    - One backup directory per run, with rollback
+    - Atomic temp-file-then-rename writes, undone if any write fails
+    - Interactive per-file confirmation, or batch mode (--yes)
+    - Fix plan mode writes one combined diff without touching files
     - Tracks statistics
     """
 
-    def __init__(self, findings: List[Dict]):
+    BACKUP_ROOT = ".secureops_backups"
+
+    def __init__(
+        self,
+        findings: List[Finding],
+        engine: Optional[RuleEngine] = None,
+        assume_yes: bool = False,
+        plan_path: Optional[str] = None,
+        workers: Optional[int] = None
+    ):
         self.findings = findings
+        self.engine = engine or RuleEngine.default()
+        self.assume_yes = assume_yes
+        self.plan_path = plan_path
+        self.workers = workers
+        self.run_dir = None
         self.stats = {
             "auto_fixable": 0,
             "files_modified": 0,
@@ -27,95 +52,236 @@ class Fixer:
         file_map = {}
 
         for f in self.findings:
-            if f.get("auto_fix_possible"):
+            if f.auto_fix_possible:
                 self.stats["auto_fixable"] += 1
-                file_map.setdefault(f["file"], []).append(f)
+                file_map.setdefault(f.file, []).append(f)
 
         if not file_map:
             print("No auto-fixable issues found.")
             return
 
-        for file_path, issues in file_map.items():
-            self._process_file(file_path, issues)
+        changes = self._compute_changes(file_map)
+
+        if self.plan_path:
+            self._write_plan(changes, self.plan_path)
+        elif self.assume_yes:
+            self._commit(changes)
+        else:
+            self._commit([c for c in changes if self._confirm(c)])
 
         self._print_stats()
 
     # --------------------------------------------------
-    # Process Per File
+    # Compute Fixes
     # --------------------------------------------------
 
-    def _process_file(self, file_path: str, issues: List[Dict]):
-        path = Path(file_path)
+    def _compute_changes(self, file_map: Dict[str, List[Finding]]) -> List[Dict]:
+        """
+        Computes the edits to every file in a process pool.
+        Workers receive only plain (line, fix spec) pairs and return a
+        FilePatch of byte-span edits rather than the file content.
+        """
+        jobs = []
 
-        if not path.exists():
-            print(f"[!] File not found: {file_path}")
-            return
+        for file_path, issues in file_map.items():
+            edits = []
+            for issue in issues:
+                rule = issue.rule or self.engine.classify_finding(issue)
+                fix = rule.fix
 
-        original_lines = path.read_text().splitlines()
-        modified_lines = original_lines.copy()
+                # e.g. os.getenv() only makes sense in Python sources
+                if fix and fix.get("extensions") and Path(file_path).suffix not in fix["extensions"]:
+                    fix = None
 
-        modified = False
+                edits.append((issue.line, fix))
+            jobs.append((file_path, edits))
 
-        for issue in issues:
-            line_index = issue["line"] - 1
-            issue_text = issue["issue"].lower()
+        if len(jobs) == 1:
+            results = [_compute_file_fix(*jobs[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_compute_file_fix, *zip(*jobs)))
 
-            if line_index < 0 or line_index >= len(modified_lines):
-                continue
+        changes = []
 
-            original_line = modified_lines[line_index]
-            new_line = original_line
+        for file_path, result in zip(file_map, results):
+            if result is None:
+                print(f"[!] File not found: {file_path}")
+                continue
 
-            # Hardcoded secret
-            if "hardcoded" in issue_text or "password" in issue_text:
-                new_line = 'password = os.getenv("PASSWORD")'
+            patch, applied, skipped = result
+            self.stats["fixes_applied"] += applied
+            self.stats["fixes_skipped"] += skipped
 
-            # subprocess shell=True
-            elif "shell=true" in issue_text or "subprocess" in issue_text:
-                new_line = original_line.replace("shell=True", "shell=False")
+            if patch.edits:
+                changes.append({
+                    "path": file_path,
+                    "patch": patch,
+                    "fixes": applied
+                })
 
-            # debug mode
-            elif "debug" in issue_text:
-                new_line = original_line.replace("debug=True", "debug=False")
+        return changes
 
-            if new_line != original_line:
-                modified_lines[line_index] = new_line
-                modified = True
-                self.stats["fixes_applied"] += 1
-            else:
-                self.stats["fixes_skipped"] += 1
+    # --------------------------------------------------
+    # Review
+    # --------------------------------------------------
 
-        if not modified:
-            return
+    @staticmethod
+    def _diff(change: Dict) -> List[str]:
+        path = Path(change["path"])
+        try:
+            label = path.resolve().relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            label = path.resolve().as_posix().lstrip("/")
 
-        diff = difflib.unified_diff(
-            original_lines,
-            modified_lines,
-            fromfile="before",
-            tofile="after",
-            lineterm=""
-        )
+        return change["patch"].diff(label)
 
-        print("\n".join(diff))
+    def _confirm(self, change: Dict) -> bool:
+        print("\n".join(self._diff(change)))
 
         confirm = input("Apply these fixes? (Y/N): ").strip().lower()
 
         if confirm != "y":
             print("Skipped file.")
-            self.stats["fixes_skipped"] += 1
+            self.stats["fixes_skipped"] += change["fixes"]
+            self.stats["fixes_applied"] -= change["fixes"]
+            return False
+
+        return True
+
+    def _combined_diff(self, changes: List[Dict]) -> str:
+        lines = []
+        for change in changes:
+            lines.extend(self._diff(change))
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _write_plan(self, changes: List[Dict], plan_path: str):
+        Path(plan_path).write_text(self._combined_diff(changes))
+
+        # Nothing was written, so nothing counts as applied
+        self.stats["fixes_skipped"] += self.stats["fixes_applied"]
+        self.stats["fixes_applied"] = 0
+
+        print(f"[+] Fix plan for {len(changes)} file(s) written to {plan_path}")
+
+    # --------------------------------------------------
+    # Transactional Apply
+    # --------------------------------------------------
+
+    def _commit(self, changes: List[Dict]):
+        """
+        Backs up every target into one run directory, then writes all
+        files atomically. If any write fails, every file already written
+        in this run is restored from its backup.
+        """
+        if not changes:
+            return
+
+        run_id = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")
+        self.run_dir = Path(self.BACKUP_ROOT) / run_id
+        files_dir = self.run_dir / "files"
+        files_dir.mkdir(parents=True)
+
+        manifest = {"run_id": run_id, "files": []}
+
+        for index, change in enumerate(changes):
+            backup = files_dir / str(index)
+            shutil.copy2(change["path"], backup)
+            manifest["files"].append({
+                "path": str(Path(change["path"]).resolve()),
+                "backup": f"files/{index}"
+            })
+
+        (self.run_dir / "manifest.json").write_text(json.dumps(manifest, indent=4))
+        (self.run_dir / "changes.patch").write_text(self._combined_diff(changes))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            writes = [
+                pool.submit(change["patch"].write)
+                for change in changes
+            ]
+            errors = [w.exception() for w in writes if w.exception()]
+
+        if errors:
+            # Backups cover every file in the run, so restoring all of
+            # them also undoes writes that completed before the failure
+            print(f"[!] Write failed ({errors[0]}); rolling back {len(changes)} file(s).")
+            self.rollback(self.run_dir)
+            self.stats["fixes_skipped"] += self.stats["fixes_applied"]
+            self.stats["fixes_applied"] = 0
             return
 
-        # Unique timestamped backup
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        backup_path = path.with_suffix(path.suffix + f".bak_{timestamp}")
-        shutil.copy(path, backup_path)
+        self.stats["files_modified"] += len(changes)
+
+        print(f"[+] Fixes applied to {len(changes)} file(s)")
+        print(f"[+] Combined diff: {self.run_dir / 'changes.patch'}")
+        print(f"[+] Backups saved in {self.run_dir}")
+        print(f"[+] Undo with: python main.py rollback {self.run_dir}")
 
-        path.write_text("\n".join(modified_lines))
+    @classmethod
+    def rollback(cls, run_dir: str) -> int:
+        """
+        Restores every file recorded in a run's manifest.
+        Accepts a run directory or a bare run id.
+        Returns the number of files restored.
+        """
+        run_path = Path(run_dir)
+        if not run_path.exists():
+            run_path = Path(cls.BACKUP_ROOT) / run_dir
 
-        print(f"[+] Backup created: {backup_path}")
-        print(f"[+] Fixes applied to {file_path}")
+        manifest = json.loads((run_path / "manifest.json").read_text())
+        restored = 0
 
-        self.stats["files_modified"] += 1
+        for entry in manifest["files"]:
+            backup = run_path / entry["backup"]
+            target = Path(entry["path"])
+
+            _atomic_write_bytes(target, backup.read_bytes())
+            shutil.copymode(backup, target)
+            restored += 1
+
+        return restored
+
+    # --------------------------------------------------
+    # Fix Specs
+    # --------------------------------------------------
+
+    @staticmethod
+    def _apply_fix(fix: Optional[Dict], line: str) -> str:
+        if not fix:
+            return line
+
+        if fix["type"] == "replace_line":
+            return fix["line"]
+
+        if fix["type"] == "replace":
+            return line.replace(fix["old"], fix["new"])
+
+        if fix["type"] == "replace_value":
+            return Fixer._replace_value(fix, line)
+
+        return line
+
+    ASSIGNMENT = re.compile(
+        r"""^(?P<head>\s*(?:export\s+)?(?P<name>[A-Za-z_][\w.]*)\s*(?::[^=]*)?[:=]\s*)"""
+        r"""(?P<value>[rbuRBU]?(?P<quote>["'])(?:\\.|(?!(?P=quote)).)*(?P=quote))"""
+    )
+
+    @staticmethod
+    def _replace_value(fix: Dict, line: str) -> str:
+        """
+        Replaces only the string literal assigned on this line, keeping
+        the variable name: `api_key = "abc"` becomes
+        `api_key = os.getenv("API_KEY")` with the default template.
+        """
+        match = Fixer.ASSIGNMENT.match(line)
+        if not match:
+            return line
+
+        name = match.group("name").rsplit(".", 1)[-1]
+        value = fix.get("template", 'os.getenv("{NAME}")').format(name=name, NAME=name.upper())
+
+        return line[:match.start("value")] + value + line[match.end("value"):]
 
     # --------------------------------------------------
     # Stats
@@ -126,3 +292,51 @@ class Fixer:
         for k, v in self.stats.items():
             print(f"{k.replace('_',' ').title():<20}: {v}")
         print("=================================\n")
+
+
+# --------------------------------------------------
+# Worker / IO Helpers
+# --------------------------------------------------
+
+def _compute_file_fix(
+    file_path: str,
+    edits: List[Tuple[int, Optional[Dict]]]
+) -> Optional[Tuple[FilePatch, int, int]]:
+    """
+    Computes the byte-span edits for one file's line fixes.
+    Returns (patch, applied, skipped) or None if missing.
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        return None
+
+    line_fixes = {}
+    for line_number, fix in edits:
+        line_fixes.setdefault(line_number or 0, []).append(fix)
+
+    patch = FilePatch(path)
+    applied, skipped = patch.compute(line_fixes, Fixer._apply_fix)
+
+    return patch, applied, skipped
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
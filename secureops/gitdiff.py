@@ -0,0 +1,76 @@
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+
+
+def _git(repo_path: Path, args: List[str]) -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path)] + args,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except OSError as e:
+        print(f"[!] Git execution error: {e}")
+        return None
+
+    if result.returncode != 0:
+        print(f"[!] git {' '.join(args)} failed: {result.stderr.strip()}")
+        return None
+
+    return result.stdout
+
+
+def merge_base(target_path: str, ref: str) -> Optional[str]:
+    """
+    Commit a diff-scoped scan against `ref` compares with: where the
+    current branch forked from it, or None if it cannot be resolved.
+    """
+    commit = _git(Path(target_path).resolve(), ["merge-base", ref, "HEAD"])
+    return commit.strip() if commit else None
+
+
+def changed_files(target_path: str, base_ref: str = "HEAD") -> Optional[List[Path]]:
+    """
+    Returns files under target_path that were added, copied, modified or
+    renamed on this branch since it forked from base_ref (base_ref...HEAD),
+    plus uncommitted and untracked files. Changes made upstream on
+    base_ref after the fork are not included. Returns None if the target
+    is not inside a git repository or the ref cannot be resolved.
+    """
+    target = Path(target_path).resolve()
+
+    toplevel = _git(target, ["rev-parse", "--show-toplevel"])
+    if toplevel is None:
+        return None
+
+    repo_root = Path(toplevel.strip())
+
+    # -z keeps paths with spaces or non-ASCII characters unquoted
+    listings = [
+        ["diff", "--name-only", "-z", "--diff-filter=ACMR", f"{base_ref}...HEAD", "--"],
+        ["diff", "--name-only", "-z", "--diff-filter=ACMR", "HEAD", "--"],
+        ["ls-files", "-z", "--others", "--exclude-standard", "--full-name"]
+    ]
+
+    names = []
+    for args in listings:
+        output = _git(target, args)
+        if output is None:
+            return None
+        names.extend(output.split("\0"))
+
+    files = []
+    seen = set()
+
+    for name in names:
+        if not name or name in seen:
+            continue
+        seen.add(name)
+
+        path = repo_root / name
+        if path.is_file() and path.is_relative_to(target):
+            files.append(path)
+
+    return sorted(files)
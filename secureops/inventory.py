@@ -0,0 +1,330 @@
+import os
+import re
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterable, Tuple
+
+
+def compile_glob(pattern: str) -> "re.Pattern":
+    """
+    Compiles a gitignore-style glob to a regex over a POSIX path.
+    `*`, `?` and `[...]` stay within one path segment; `**` crosses
+    segments, and `**/` also matches no directory at all.
+    """
+    parts = []
+    i = 0
+
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"(?!/)[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+
+    return re.compile("".join(parts) + r"\Z")
+
+
+class IgnoreRules:
+    """
+    gitignore-style patterns loaded from one directory.
+    Supports comments, negation (!), directory-only (trailing /)
+    and anchored (leading or inner /) patterns.
+    """
+
+    IGNORE_FILES = (".gitignore", ".secureopsignore")
+
+    def __init__(self, base: Path, patterns: List[str]):
+        self.base = base
+        self.rules = []
+
+        for pattern in patterns:
+            pattern = pattern.rstrip()
+            if not pattern or pattern.startswith("#"):
+                continue
+
+            negate = pattern.startswith("!")
+            if negate:
+                pattern = pattern[1:]
+
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+
+            anchored = "/" in pattern
+            pattern = pattern.lstrip("/")
+
+            if pattern:
+                self.rules.append((compile_glob(pattern), negate, dir_only, anchored))
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["IgnoreRules"]:
+        patterns = []
+
+        for name in cls.IGNORE_FILES:
+            try:
+                with open(directory / name, encoding="utf-8", errors="replace") as f:
+                    patterns.extend(f.read().splitlines())
+            except OSError:
+                continue
+
+        rules = cls(directory, patterns)
+        return rules if rules.rules else None
+
+    def match(self, path: Path, is_dir: bool) -> Optional[bool]:
+        """
+        Returns True if ignored, False if re-included by a negated
+        pattern, or None if no pattern applies. Last match wins.
+        """
+        relative = path.relative_to(self.base).as_posix()
+        name = path.name
+        result = None
+
+        for pattern, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+
+            target = relative if anchored else name
+            if pattern.match(target):
+                result = not negate
+
+        return result
+
+
+class FileInventory:
+    """
+    Single-pass, pruned file inventory of a target directory.
+    Built once with os.scandir and shared by language detection
+    and every scanner.
+    """
+
+    # Version control, dependency and cache directories only, which are
+    # never project code. Directories like env/, build/ or vendor/ may
+    # hold Terraform stacks or vendored code and are left to ignore files
+    DEFAULT_EXCLUDES = {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "bower_components",
+        "venv",
+        ".venv",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".terraform",
+        ".secureops_cache"
+    }
+
+    # Pruned directories listed by name in the metadata
+    PRUNED_LISTED = 50
+
+    NODE_EXTENSIONS = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx")
+
+    def __init__(self, root: str, workers: int = 8):
+        self.root = Path(root).resolve()
+        self.workers = workers
+        self.files = []
+        self.pruned = []
+        self.by_language = {}
+
+    # -------------------------
+    # Classification
+    # -------------------------
+    @classmethod
+    def classify(cls, path: Path) -> Optional[str]:
+        name = path.name
+
+        if name.endswith(".py"):
+            return "python"
+        if name == "package.json" or name.endswith(cls.NODE_EXTENSIONS):
+            return "node"
+        if name == "go.mod" or name.endswith(".go"):
+            return "go"
+        if name == "Dockerfile":
+            return "docker"
+        if name.endswith(".tf"):
+            return "terraform"
+
+        return None
+
+    def _index(self, files: Iterable[Path]):
+        self.files = sorted(files)
+        self.by_language = {}
+
+        for path in self.files:
+            language = self.classify(path)
+            if language:
+                self.by_language.setdefault(language, []).append(path)
+
+    # -------------------------
+    # Full Walk
+    # -------------------------
+    def build(self) -> "FileInventory":
+        """
+        Walks the target once. Top-level subdirectories are walked in
+        parallel so very wide trees do not serialize on one thread.
+        """
+        root_rules = self._rules_for(self.root, [])
+        files, pruned, subdirs = self._scan(self.root, root_rules)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            walks = [
+                pool.submit(self._walk, subdir, root_rules)
+                for subdir in subdirs
+            ]
+            for walk in walks:
+                sub_files, sub_pruned = walk.result()
+                files.extend(sub_files)
+                pruned.extend(sub_pruned)
+
+        self.pruned = sorted(pruned)
+        self._index(files)
+        return self
+
+    def _walk(self, directory: Path, parent_rules: List[IgnoreRules]) -> Tuple[List[Path], List[Path]]:
+        files = []
+        pruned = []
+        pending = [(directory, parent_rules)]
+
+        while pending:
+            current, inherited = pending.pop()
+            rules = self._rules_for(current, inherited)
+
+            dir_files, dir_pruned, subdirs = self._scan(current, rules)
+            files.extend(dir_files)
+            pruned.extend(dir_pruned)
+            pending.extend((subdir, rules) for subdir in subdirs)
+
+        return files, pruned
+
+    def _scan(self, directory: Path, rules: List[IgnoreRules]) -> Tuple[List[Path], List[Path], List[Path]]:
+        files = []
+        pruned = []
+        subdirs = []
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return files, pruned, subdirs
+
+        for entry in entries:
+            path = Path(entry.path)
+
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = entry.is_file(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if is_dir:
+                if entry.name in self.DEFAULT_EXCLUDES or self._ignored(path, True, rules):
+                    pruned.append(path)
+                else:
+                    subdirs.append(path)
+            elif is_file and not self._ignored(path, False, rules):
+                files.append(path)
+
+        return files, pruned, subdirs
+
+    # -------------------------
+    # Restricted Build
+    # -------------------------
+    def build_from(self, paths: Iterable[Path]) -> "FileInventory":
+        """
+        Builds the inventory from an explicit file list (e.g. a git diff),
+        applying the same excludes and ignore files as a full walk.
+        """
+        rules_cache = {}
+        kept = []
+
+        def cached_rules(directory: Path, inherited: List[IgnoreRules]) -> List[IgnoreRules]:
+            if directory not in rules_cache:
+                rules_cache[directory] = self._rules_for(directory, inherited)
+            return rules_cache[directory]
+
+        for path in paths:
+            path = Path(path).resolve()
+            try:
+                relative = path.relative_to(self.root)
+            except ValueError:
+                continue
+
+            if any(part in self.DEFAULT_EXCLUDES for part in relative.parts[:-1]):
+                continue
+
+            rules = []
+            directory = self.root
+            ignored = False
+
+            for part in relative.parts[:-1]:
+                rules = cached_rules(directory, rules)
+                directory = directory / part
+                if self._ignored(directory, True, rules):
+                    ignored = True
+                    break
+
+            if ignored:
+                continue
+
+            rules = cached_rules(directory, rules)
+            if not self._ignored(path, False, rules):
+                kept.append(path)
+
+        self._index(kept)
+        return self
+
+    # -------------------------
+    # Ignore Rules
+    # -------------------------
+    @staticmethod
+    def _rules_for(directory: Path, inherited: List[IgnoreRules]) -> List[IgnoreRules]:
+        rules = IgnoreRules.load(directory)
+        return inherited + [rules] if rules else inherited
+
+    @staticmethod
+    def _ignored(path: Path, is_dir: bool, rules: List[IgnoreRules]) -> bool:
+        ignored = False
+
+        for rule_set in rules:
+            result = rule_set.match(path, is_dir)
+            if result is not None:
+                ignored = result
+
+        return ignored
+
+    # -------------------------
+    # Manifest
+    # -------------------------
+    def files_for(self, *languages: str) -> List[Path]:
+        files = []
+        for language in languages:
+            files.extend(self.by_language.get(language, []))
+        return sorted(files)
+
+    def get_metadata(self) -> Dict:
+        return {
+            "files_indexed": len(self.files),
+            "directories_pruned": len(self.pruned),
+            "pruned": [
+                path.relative_to(self.root).as_posix()
+                for path in self.pruned[:self.PRUNED_LISTED]
+            ]
+        }
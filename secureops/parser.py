@@ -1,4 +1,8 @@
-from typing import List, Dict
+from typing import List, Dict, Iterator, Iterable, Optional, Tuple
+
+from secureops.decoding import BATCH_SIZE, DECODED_TOOLS, FindingDecoder
+from secureops.finding import Finding
+from secureops.streaming import iter_json_batches
 
 
 class Parser:
@@ -6,92 +10,66 @@ class Parser:
     Converts raw scanner outputs into standardized schema.
     """
 
+    # Location of the findings array in each tool's JSON output
+    RESULT_PATHS = {
+        "bandit": ("results",),
+        "semgrep": ("results",),
+        "trivy": ("Results",),
+        "checkov": ("results", "failed_checks")
+    }
+
     def __init__(self, scanner_results: List[Dict]):
         self.scanner_results = scanner_results
 
-    def parse(self) -> List[Dict]:
-        standardized = []
+    def parse(self) -> List[Finding]:
+        return list(self.iter_parse())
 
+    def iter_parse(self) -> Iterator[Finding]:
+        """
+        Yields standardized findings one at a time. Spooled scanner
+        output is read item by item rather than loaded whole.
+        """
         for result in self.scanner_results:
             tool = result.get("tool")
             language = result.get("language")
-            raw = result.get("raw")
-
-            if tool == "bandit":
-                standardized.extend(self._parse_bandit(raw, language))
-
-            elif tool == "semgrep":
-                standardized.extend(self._parse_semgrep(raw, language))
-
-            elif tool == "trivy":
-                standardized.extend(self._parse_trivy(raw, language))
-
-            elif tool == "checkov":
-                standardized.extend(self._parse_checkov(raw, language))
-
-        return standardized
-
-    # -------------------------
-    # Tool Parsers
-    # -------------------------
-
-    def _parse_bandit(self, raw: Dict, language: str) -> List[Dict]:
-        findings = []
-
-        for issue in raw.get("results", []):
-            findings.append({
-                "file": issue.get("filename"),
-                "line": issue.get("line_number"),
-                "issue": issue.get("issue_text"),
-                "severity": issue.get("issue_severity"),
-                "tool": "bandit",
-                "language": language
-            })
-
-        return findings
-
-    def _parse_semgrep(self, raw: Dict, language: str) -> List[Dict]:
-        findings = []
-
-        for issue in raw.get("results", []):
-            findings.append({
-                "file": issue.get("path"),
-                "line": issue.get("start", {}).get("line"),
-                "issue": issue.get("extra", {}).get("message"),
-                "severity": issue.get("extra", {}).get("severity"),
-                "tool": "semgrep",
-                "language": language
-            })
-
-        return findings
-
-    def _parse_trivy(self, raw: Dict, language: str) -> List[Dict]:
-        findings = []
-
-        for result in raw.get("Results", []):
-            for misconf in result.get("Misconfigurations", []):
-                findings.append({
-                    "file": result.get("Target"),
-                    "line": misconf.get("StartLine"),
-                    "issue": misconf.get("Title"),
-                    "severity": misconf.get("Severity"),
-                    "tool": "trivy",
-                    "language": language
-                })
-
-        return findings
-
-    def _parse_checkov(self, raw: Dict, language: str) -> List[Dict]:
-        findings = []
-
-        for issue in raw.get("results", {}).get("failed_checks", []):
-            findings.append({
-                "file": issue.get("file_path"),
-                "line": issue.get("file_line_range", [None])[0],
-                "issue": issue.get("check_name"),
-                "severity": issue.get("severity"),
-                "tool": "checkov",
-                "language": language
-            })
 
-        return findings
+            # Findings served from the scan cache are already normalized
+            if "findings" in result:
+                yield from result["findings"]
+                continue
+
+            if tool not in DECODED_TOOLS:
+                continue
+
+            for root, batches in self._iter_reports(result, tool):
+                decoder = FindingDecoder(tool, language, root)
+                yield from decoder.iter_decode(batches)
+
+    def _iter_reports(self, result: Dict, tool: str) -> Iterator[Tuple[Optional[str], Iterable[List[Dict]]]]:
+        """
+        (root, batches of items) per report of a result entry, the root
+        being the directory its paths are relative to, if known.
+        """
+        path = self.RESULT_PATHS[tool]
+        roots = iter(result.get("roots") or [])
+
+        for raw_path in result.get("raw_paths", []):
+            yield next(roots, None), iter_json_batches(raw_path, path, remove=True)
+
+        raw = result.get("raw")
+        if raw is None:
+            return
+
+        # checkov emits a list of reports when several frameworks run
+        reports = raw if isinstance(raw, list) else [raw]
+        for report in reports:
+            yield next(roots, None), self._report_batches(report, path)
+
+    @staticmethod
+    def _report_batches(report: Dict, path: Tuple[str, ...]) -> Iterator[List[Dict]]:
+        node = report
+        for key in path:
+            node = node.get(key) or {}
+        items = node or []
+        for start in range(0, len(items), BATCH_SIZE):
+            yield items[start:start + BATCH_SIZE]
@@ -0,0 +1,269 @@
+import os
+import mmap
+import shutil
+import tempfile
+from pathlib import Path
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple, Union
+
+
+# Files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 1024 * 1024
+
+UTF8_BOM = b"\xef\xbb\xbf"
+UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+
+@contextmanager
+def open_source(path: Path):
+    """
+    Yields the file's bytes: a read-only mmap for large files, a bytes
+    object otherwise. Both support len(), find() and slicing.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+class LineIndex:
+    """
+    Byte offsets of line starts, extended lazily up to the highest line
+    requested, so fixing line 10 of a 2 GB file only scans 10 lines.
+    Spans exclude the line terminator (\\n or \\r\\n), so edits never
+    touch the file's newline style or its trailing newline.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        self.data = data
+        self.size = len(data)
+        self.starts = [0]
+        self.complete = False
+
+    def _extend(self, line_number: int):
+        while len(self.starts) < line_number and not self.complete:
+            newline = self.data.find(b"\n", self.starts[-1])
+
+            if newline == -1 or newline + 1 >= self.size:
+                self.complete = True
+            else:
+                self.starts.append(newline + 1)
+
+    def span(self, line_number: int) -> Optional[Tuple[int, int]]:
+        if line_number < 1:
+            return None
+
+        self._extend(line_number)
+        if line_number > len(self.starts):
+            return None
+
+        start = self.starts[line_number - 1]
+        end = self.data.find(b"\n", start)
+        if end == -1:
+            end = self.size
+
+        if end > start and self.data[end - 1:end] == b"\r":
+            end -= 1
+
+        return start, end
+
+    def line(self, line_number: int) -> Optional[bytes]:
+        span = self.span(line_number)
+        return self.data[span[0]:span[1]] if span else None
+
+
+class FilePatch:
+    """
+    Minimal byte-span edits to one file.
+    Each edited line is reduced to the span that actually changed, and
+    the patched file is produced in one streaming pass that copies the
+    untouched bytes straight from the source.
+    """
+
+    CONTEXT = 3
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.encoding = "utf-8"
+        self.edits: List[Tuple[int, int, bytes]] = []
+        self.lines: Dict[int, Tuple[str, str]] = {}
+        self.hunks: List[Tuple[int, List[str], List[str]]] = []
+        self.stat = None
+
+    def compute(self, line_fixes: Dict[int, List], apply_fix) -> Tuple[int, int]:
+        """
+        `line_fixes` maps line numbers to fix specs, `apply_fix(fix,
+        line) -> line` applies one spec. Returns (applied, skipped).
+        """
+        applied = 0
+        skipped = 0
+
+        with open_source(self.path) as data:
+            stat = os.stat(self.path)
+            self.stat = (stat.st_size, stat.st_mtime_ns)
+
+            if data[:2] in UTF16_BOMS:
+                # Line offsets assume an ASCII-compatible encoding
+                return 0, sum(len(fixes) for fixes in line_fixes.values())
+
+            index = LineIndex(data)
+            self.encoding = self._detect_encoding(index, line_fixes)
+
+            for line_number in sorted(line_fixes):
+                span = index.span(line_number)
+                if span is None:
+                    continue
+
+                start, end = span
+                if start == 0 and data[:3] == UTF8_BOM:
+                    start = 3
+
+                old = data[start:end].decode(self.encoding)
+                new = old
+
+                for fix in line_fixes[line_number]:
+                    fixed = apply_fix(fix, new)
+                    if fixed != new:
+                        new = fixed
+                        applied += 1
+                    else:
+                        skipped += 1
+
+                if new != old:
+                    self.lines[line_number] = (old, new)
+                    self.edits.append(self._minimal_edit(start, old, new))
+
+            self.hunks = self._build_hunks(index)
+
+        return applied, skipped
+
+    def _detect_encoding(self, index: LineIndex, line_fixes: Dict[int, List]) -> str:
+        for line_number in line_fixes:
+            line = index.line(line_number)
+            if line is None:
+                continue
+            try:
+                line.decode("utf-8")
+            except UnicodeDecodeError:
+                # Latin-1 round-trips any byte unchanged
+                return "latin-1"
+        return "utf-8"
+
+    def _minimal_edit(self, offset: int, old: str, new: str) -> Tuple[int, int, bytes]:
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+
+        suffix = 0
+        limit -= prefix
+        while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+
+        start = offset + len(old[:prefix].encode(self.encoding))
+        end = offset + len(old[:len(old) - suffix].encode(self.encoding))
+
+        return start, end, new[prefix:len(new) - suffix].encode(self.encoding)
+
+    def _build_hunks(self, index: LineIndex) -> List[Tuple[int, List[str], List[str]]]:
+        """
+        Unified-diff hunks with CONTEXT lines around each edited line,
+        merging hunks that overlap.
+        """
+        ranges = []
+
+        for line_number in sorted(self.lines):
+            first = max(1, line_number - self.CONTEXT)
+            last = line_number + self.CONTEXT
+
+            if ranges and first <= ranges[-1][1] + 1:
+                ranges[-1][1] = last
+            else:
+                ranges.append([first, last])
+
+        hunks = []
+
+        for first, last in ranges:
+            before = []
+            after = []
+
+            for line_number in range(first, last + 1):
+                if line_number in self.lines:
+                    old, new = self.lines[line_number]
+                    before.append(old)
+                    after.append(new)
+                    continue
+
+                line = index.line(line_number)
+                if line is None:
+                    break
+
+                if line_number == 1 and line.startswith(UTF8_BOM):
+                    line = line[3:]
+
+                text = line.decode(self.encoding, errors="replace")
+                before.append(text)
+                after.append(text)
+
+            hunks.append((first, before, after))
+
+        return hunks
+
+    def diff(self, label: str) -> List[str]:
+        lines = [f"--- a/{label}", f"+++ b/{label}"]
+
+        for first, before, after in self.hunks:
+            lines.append(f"@@ -{first},{len(before)} +{first},{len(after)} @@")
+
+            for old, new in zip(before, after):
+                if old == new:
+                    lines.append(f" {old}")
+                else:
+                    lines.append(f"-{old}")
+                    lines.append(f"+{new}")
+
+        return lines
+
+    def write(self):
+        """
+        Streams source bytes and edits into a temp file beside the
+        target, then renames it into place. Refuses to write if the file
+        changed since the edits were computed.
+        """
+        stat = os.stat(self.path)
+        if (stat.st_size, stat.st_mtime_ns) != self.stat:
+            raise RuntimeError(f"{self.path} changed since fixes were computed")
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as out, open_source(self.path) as data:
+                with memoryview(data) as view:
+                    position = 0
+
+                    for start, end, replacement in sorted(self.edits):
+                        out.write(view[position:start])
+                        out.write(replacement)
+                        position = end
+
+                    out.write(view[position:])
+
+                out.flush()
+                os.fsync(out.fileno())
+
+            shutil.copymode(self.path, tmp_path)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
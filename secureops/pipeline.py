@@ -0,0 +1,322 @@
+import os
+import time
+import asyncio
+import argparse
+from datetime import datetime, UTC
+from typing import List, Dict, Optional
+
+from secureops.analyzer import Analyzer
+from secureops.baseline import Baseline
+from secureops.budget import RuntimeHistory
+from secureops.cache import ScanCache
+from secureops.dedup import Deduplicator
+from secureops.finding import Finding
+from secureops.gitdiff import changed_files
+from secureops.parser import Parser
+from secureops.profiler import Profiler, NULL_PROFILER
+from secureops.reporter import Reporter
+from secureops.rollup import CodeOwners, RiskTree
+from secureops.rule_engine import RuleEngine
+from secureops.scanner import ScannerOrchestrator
+from secureops.scorer import Scorer
+from secureops.shards import ShardedScanner
+from secureops.store import FindingStore
+
+
+class LivePipeline:
+    """
+    Progressive scan pipeline (--live).
+    Tools run as asyncio subprocesses and each result is parsed,
+    deduplicated, analyzed and scored the moment it arrives, so running
+    counts and the severity breakdown are shown while slower tools are
+    still working. Returns the deduplicated, analyzed findings.
+    """
+
+    def __init__(
+        self,
+        orchestrator: ScannerOrchestrator,
+        deduplicator: Deduplicator,
+        scorer: Scorer,
+        analyzer: Analyzer
+    ):
+        self.orchestrator = orchestrator
+        self.deduplicator = deduplicator
+        self.scorer = scorer
+        self.analyzer = analyzer
+        self.findings: List[Finding] = []
+        self.started = None
+        self.first_finding_at = None
+        self.tool_seconds: Dict[str, float] = {}
+        self.tool_findings: Dict[str, int] = {}
+        # Severity each finding was counted with, by fingerprint
+        self._counted: Dict[str, str] = {}
+
+    def run(self) -> List[Finding]:
+        self.started = time.perf_counter()
+        asyncio.run(self.orchestrator.run_async(self._on_result))
+        return self.findings
+
+    # -------------------------
+    # Incremental Stages
+    # -------------------------
+    def _on_result(self, tool: str, result: Dict):
+        count = 0
+
+        for finding in Parser([result]).iter_parse():
+            count += 1
+            existing = self.deduplicator.merge(finding)
+
+            if existing is None:
+                self.analyzer.enrich(finding)
+                self.scorer.add(finding)
+                self.findings.append(finding)
+                self._counted[finding.fingerprint] = finding.severity
+                continue
+
+            # A duplicate from another tool may have raised the severity
+            previous = self._counted[existing.fingerprint]
+            self.scorer.rescore(existing, previous)
+            self._counted[existing.fingerprint] = existing.severity
+
+        now = time.perf_counter()
+        if count and self.first_finding_at is None:
+            self.first_finding_at = now
+
+        self.tool_seconds[tool] = round(now - self.started, 3)
+        self.tool_findings[tool] = self.tool_findings.get(tool, 0) + count
+
+        self._print_progress(tool, count)
+
+    def _print_progress(self, tool: str, count: int):
+        breakdown = " ".join(
+            f"{severity}={total}"
+            for severity, total in self.scorer.breakdown.items()
+        )
+
+        print(
+            f"[+] {tool}: {count} finding(s) at {self.tool_seconds[tool]:.2f}s | "
+            f"total {self.scorer.total} | {breakdown}"
+        )
+
+    def get_metadata(self) -> Dict:
+        first = None
+        if self.first_finding_at is not None:
+            first = round(self.first_finding_at - self.started, 3)
+
+        return {
+            "time_to_first_finding_seconds": first,
+            "tool_completed_seconds": self.tool_seconds,
+            "tool_findings": self.tool_findings
+        }
+
+
+def run_scan(
+    target_path: str,
+    args: argparse.Namespace,
+    engine: RuleEngine,
+    profiler: Profiler = NULL_PROFILER,
+    baseline: Optional[Baseline] = None,
+    report_dir: str = "reports",
+    keep_findings: bool = False
+) -> Optional[Dict]:
+    """
+    One full scan of `target_path` with the command-line options in
+    `args`: scanners, parse, dedup, score, analyze, reports and the
+    optional store. Shared by `main.py <path>` and `main.py batch`.
+    Returns the summary, metadata, report paths and auto-fixable
+    findings (plus every finding as a dict with keep_findings), or None
+    when nothing was scanned. Raises RuntimeError
+    if the --since/--changed-only diff cannot be computed.
+    """
+    scan_start_time = datetime.now(UTC)
+    start_timer = time.time()
+
+    # -------------------------
+    # Run Scanners
+    # -------------------------
+    cache = None
+    if args.cache:
+        cache = ScanCache(
+            args.cache_dir,
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+            max_age_days=args.cache_max_age
+        )
+
+    diff_base = args.since or ("HEAD" if args.changed_only else None)
+    changed = None
+
+    if diff_base:
+        changed = changed_files(target_path, diff_base)
+        if changed is None:
+            raise RuntimeError(f"Could not determine files changed since {diff_base}.")
+
+    if args.shard_queue:
+        orchestrator = ShardedScanner(
+            target_path,
+            args.shard_queue,
+            workers=args.workers,
+            lease_seconds=args.shard_lease,
+            options={
+                "jobs": args.jobs,
+                "cache_dir": str(os.path.abspath(args.cache_dir)) if args.cache else None,
+                "cache_max_bytes": args.cache_max_mb * 1024 * 1024,
+                "cache_max_age": args.cache_max_age,
+                "stream": args.stream,
+                "semgrep_rules": os.path.abspath(args.semgrep_rules),
+                "secrets": not args.no_secrets
+            }
+        )
+    else:
+        orchestrator = ScannerOrchestrator(
+            target_path,
+            jobs=args.jobs,
+            cache=cache,
+            changed_files=changed,
+            diff_base=diff_base,
+            stream=args.stream,
+            semgrep_rules=args.semgrep_rules,
+            profiler=profiler,
+            deadline=args.deadline,
+            tool_timeouts=args.tool_timeout,
+            history=RuntimeHistory(
+                args.history or (RuntimeHistory.DEFAULT_PATH if args.deadline else None)
+            ),
+            secrets=not args.no_secrets
+        )
+
+    deduplicator = Deduplicator(target_path, engine)
+
+    owners = CodeOwners.load(target_path, args.codeowners)
+    if args.codeowners and owners is None:
+        print(f"[!] Could not read CODEOWNERS file {args.codeowners}; skipping owner rollup.")
+
+    rollup = RiskTree(deduplicator.normalize_path, owners, max_depth=args.rollup_depth)
+    scorer = Scorer(rollup=rollup)
+    live = None
+
+    if args.live:
+        # Each tool's findings are parsed, deduplicated, analyzed and
+        # scored as soon as the tool finishes
+        live = LivePipeline(orchestrator, deduplicator, scorer, Analyzer((), engine))
+        with profiler.span("scan", "scanner"):
+            analyzed = live.run()
+        raw_results = orchestrator.results
+    else:
+        with profiler.span("scan", "scanner"):
+            raw_results = orchestrator.run()
+
+    if not raw_results:
+        return None
+
+    tools_used = list(dict.fromkeys(result["tool"] for result in raw_results))
+
+    # -------------------------
+    # Parse, Deduplicate, Score and Analyze
+    # -------------------------
+    # Parsing, scoring and analysis are generators; deduplication is the
+    # one barrier, holding a single finding per fingerprint
+    if not live:
+        parsed = profiler.wrap(
+            "parser",
+            Parser(raw_results).iter_parse(),
+            key=lambda finding: finding.tool
+        )
+        with profiler.span("dedup") as span:
+            deduped = deduplicator.dedupe(parsed)
+            if span:
+                span.attrs["findings"] = len(deduped)
+        scored = profiler.wrap("scorer", scorer.iter_score(deduped))
+        analyzed = profiler.wrap("analyzer", Analyzer(scored, engine).iter_analyze())
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    # Findings stream straight into the report writers; only
+    # auto-fixable findings are kept in memory for the Fixer
+    reporter = Reporter(
+        report_dir=report_dir,
+        formats=args.format,
+        compress=args.compress,
+        pretty=args.pretty,
+        target_path=str(deduplicator.target_path)
+    )
+    profiler.timed("reporter", reporter.open)()
+    write_report = profiler.timed("reporter", reporter.write)
+
+    store = None
+    if args.store:
+        store = FindingStore(args.store)
+        store.begin_scan(
+            str(deduplicator.target_path),
+            scan_start_time.isoformat()
+        )
+        add_to_store = profiler.timed("store", store.add)
+
+    if baseline:
+        analyzed = baseline.iter_classify(analyzed)
+
+    fixable = []
+    kept = []
+    findings_by_tool = {}
+    for finding in analyzed:
+        write_report(finding)
+        if keep_findings:
+            kept.append(finding.to_dict())
+        findings_by_tool[finding.tool] = findings_by_tool.get(finding.tool, 0) + 1
+        if store:
+            add_to_store(finding, deduplicator.normalize_path(finding.file))
+        if finding.auto_fix_possible:
+            fixable.append(finding)
+
+    score_data = scorer.summary()
+
+    # History is only kept for deadline ordering or when asked for; a
+    # plain scan leaves no state behind
+    if isinstance(orchestrator, ScannerOrchestrator) and orchestrator.history.path:
+        orchestrator.record_history(findings_by_tool)
+
+    scan_end_time = datetime.now(UTC)
+    duration = round(time.time() - start_timer, 2)
+
+    metadata = orchestrator.get_metadata()
+    metadata.update({
+        "scan_started_at": scan_start_time.isoformat(),
+        "scan_completed_at": scan_end_time.isoformat(),
+        "duration_seconds": duration,
+        "tools_used": tools_used,
+        "deduplication": deduplicator.get_metadata()
+    })
+
+    if live:
+        metadata["live"] = live.get_metadata()
+
+    if baseline:
+        metadata["baseline"] = baseline.get_metadata(args.baseline)
+
+    # Report closing and fixing happen after this snapshot; the trace
+    # and Prometheus exports include them
+    if profiler.enabled:
+        metadata["profile"] = profiler.get_metadata()
+
+    if store:
+        metadata["store"] = {"path": args.store, "scan_id": store.scan_id}
+        store.finish_scan(score_data, metadata)
+        store.close()
+
+    with profiler.span("reporter.close"):
+        report_paths = reporter.close(score_data, metadata)
+    reporter.print_summary()
+
+    result = {
+        "target": target_path,
+        "score_data": score_data,
+        "metadata": metadata,
+        "report_paths": report_paths,
+        "fixable": fixable
+    }
+
+    if keep_findings:
+        result["findings"] = kept
+
+    return result
+
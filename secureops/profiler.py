@@ -0,0 +1,313 @@
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Callable, Iterable, Iterator
+
+
+class Span:
+    """
+    Timing record for one span, or for every call of a streaming stage.
+    Wall and CPU time are exclusive of nested spans on the same thread.
+    """
+
+    __slots__ = ("name", "category", "thread", "start", "end", "wall", "cpu", "calls", "attrs")
+
+    def __init__(self, name: str, category: str, attrs: Optional[Dict] = None):
+        self.name = name
+        self.category = category
+        self.thread = threading.current_thread().name
+        self.start = None
+        self.end = None
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.calls = 0
+        self.attrs = dict(attrs or {})
+
+    def add(self, key: str, value: float):
+        self.attrs[key] = self.attrs.get(key, 0) + value
+
+    def maximum(self, key: str, value: float):
+        self.attrs[key] = max(self.attrs.get(key, 0), value)
+
+    def to_dict(self, origin: float) -> Dict:
+        data = {
+            "name": self.name,
+            "category": self.category,
+            "thread": self.thread,
+            "start_seconds": round(self.start - origin, 6) if self.start else None,
+            "elapsed_seconds": round(self.end - self.start, 6) if self.start else 0,
+            "wall_seconds": round(self.wall, 6),
+            "cpu_seconds": round(self.cpu, 6),
+            "calls": self.calls
+        }
+        data.update(self.attrs)
+        return data
+
+
+class Profiler:
+    """
+    Lightweight pipeline instrumentation (--profile).
+    `span()` times a block such as a tool run; `wrap()` and `timed()`
+    time the calls into a streaming stage (generator or function) and
+    fold them into one record. Child process CPU, peak RSS and output
+    size are attached to the innermost span of the calling thread.
+    Disabled profilers return iterables and functions unchanged.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self._stages: Dict[str, Span] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # -------------------------
+    # Measurement
+    # -------------------------
+    def _stack(self) -> List:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _begin(self, span: Span) -> List:
+        # frame: span, start wall, start cpu, nested wall, nested cpu
+        frame = [span, time.perf_counter(), time.thread_time(), 0.0, 0.0]
+        self._stack().append(frame)
+
+        if span.start is None:
+            span.start = frame[1]
+        return frame
+
+    def _finish(self, frame: List):
+        now = time.perf_counter()
+        wall = now - frame[1]
+        cpu = time.thread_time() - frame[2]
+
+        stack = self._stack()
+        stack.pop()
+        if stack:
+            stack[-1][3] += wall
+            stack[-1][4] += cpu
+
+        span = frame[0]
+        span.wall += wall - frame[3]
+        span.cpu += cpu - frame[4]
+        span.calls += 1
+        span.end = now
+
+    def _register(self, name: str, category: str, attrs: Optional[Dict] = None) -> Span:
+        span = Span(name, category, attrs)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def _stage(self, name: str, category: str) -> Span:
+        # Every wrap()/timed() use of a name folds into one record
+        with self._lock:
+            span = self._stages.get(name)
+        if span is None:
+            span = self._stages[name] = self._register(name, category)
+        return span
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **attrs) -> Iterator[Optional[Span]]:
+        if not self.enabled:
+            yield None
+            return
+
+        span = self._register(name, category, attrs)
+        frame = self._begin(span)
+        try:
+            yield span
+        finally:
+            self._finish(frame)
+
+    def wrap(
+        self,
+        name: str,
+        iterable: Iterable,
+        key: Optional[Callable] = None,
+        category: str = "stage"
+    ) -> Iterable:
+        """
+        Times each step of an iterable and counts the items it yields,
+        optionally tallied by `key` (e.g. findings per tool).
+        """
+        if not self.enabled:
+            return iterable
+        return self._wrap(self._stage(name, category), iter(iterable), key)
+
+    def _wrap(self, span: Span, iterator: Iterator, key: Optional[Callable]) -> Iterator:
+        counts = {}
+        items = 0
+
+        try:
+            while True:
+                frame = self._begin(span)
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    self._finish(frame)
+
+                items += 1
+                if key is not None:
+                    label = key(item)
+                    counts[label] = counts.get(label, 0) + 1
+
+                yield item
+        finally:
+            span.attrs["findings"] = items
+            if key is not None:
+                span.attrs["findings_by_tool"] = counts
+
+    def timed(self, name: str, function: Callable, category: str = "stage", **attrs) -> Callable:
+        """
+        Times every call of `function` into a single record.
+        """
+        if not self.enabled:
+            return function
+
+        span = self._stage(name, category)
+        span.attrs.update(attrs)
+
+        def timed_call(*args, **kwargs):
+            frame = self._begin(span)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._finish(frame)
+
+        return timed_call
+
+    def record_child(self, rusage, output_bytes: int = 0):
+        """
+        Attaches a reaped child process's resource usage and output size
+        to the innermost open span of the calling thread.
+        """
+        stack = self._stack() if self.enabled else None
+        if not stack:
+            return
+
+        span = stack[-1][0]
+        span.add("output_bytes", output_bytes)
+
+        if rusage is not None:
+            # ru_maxrss is kilobytes on Linux, bytes on macOS
+            peak = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+            span.add("child_cpu_seconds", round(rusage.ru_utime + rusage.ru_stime, 6))
+            span.maximum("child_peak_rss_bytes", peak)
+            span.add("child_processes", 1)
+
+    # -------------------------
+    # Export
+    # -------------------------
+    def get_metadata(self) -> Dict:
+        with self._lock:
+            spans = [span.to_dict(self.origin) for span in self.spans if span.calls]
+
+        return {
+            "spans": spans,
+            "wall_seconds": round(time.perf_counter() - self.origin, 6),
+            "cpu_seconds": round(time.process_time(), 6)
+        }
+
+    def write_chrome_trace(self, path: str):
+        """
+        Trace Event JSON for chrome://tracing or Perfetto. Streaming
+        stages interleave, so each gets its own lane spanning its first
+        to last call.
+        """
+        events = []
+        lanes = {}
+
+        with self._lock:
+            spans = [span for span in self.spans if span.calls]
+
+        for span in spans:
+            lane = span.thread if span.calls == 1 else f"stage:{span.name}"
+            tid = lanes.setdefault(lane, len(lanes) + 1)
+
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "pid": os.getpid(),
+                "tid": tid,
+                "ts": round((span.start - self.origin) * 1e6, 3),
+                "dur": round((span.end - span.start) * 1e6, 3),
+                "args": span.to_dict(self.origin)
+            })
+
+        for lane, tid in lanes.items():
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": lane}
+            })
+
+        self._atomic_write(path, json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+    PROMETHEUS_METRICS = [
+        ("wall_seconds", "Exclusive wall-clock seconds spent in a span.", "wall", sum),
+        ("cpu_seconds", "Exclusive CPU seconds of this process spent in a span.", "cpu", sum),
+        ("child_cpu_seconds", "CPU seconds used by scanner processes.", "child_cpu_seconds", sum),
+        ("child_peak_rss_bytes", "Peak resident set size of scanner processes.", "child_peak_rss_bytes", max),
+        ("output_bytes", "Bytes of scanner output.", "output_bytes", sum),
+        ("findings", "Findings passing through a stage.", "findings", sum)
+    ]
+
+    def write_prometheus(self, path: str):
+        """
+        Prometheus textfile-collector format, one gauge per metric
+        labelled by span name and category.
+        """
+        grouped = {}
+
+        with self._lock:
+            for span in self.spans:
+                if span.calls:
+                    grouped.setdefault((span.name, span.category), []).append(span)
+
+        lines = []
+
+        for metric, help_text, field, combine in self.PROMETHEUS_METRICS:
+            samples = []
+
+            for (name, category), spans in grouped.items():
+                if field in ("wall", "cpu"):
+                    values = [getattr(span, field) for span in spans]
+                else:
+                    values = [span.attrs[field] for span in spans if field in span.attrs]
+
+                if values:
+                    samples.append(
+                        f'secureops_span_{metric}{{span="{name}",category="{category}"}} '
+                        f"{round(combine(values), 6)}"
+                    )
+
+            if samples:
+                lines.append(f"# HELP secureops_span_{metric} {help_text}")
+                lines.append(f"# TYPE secureops_span_{metric} gauge")
+                lines.extend(samples)
+
+        self._atomic_write(path, "\n".join(lines) + "\n")
+
+    @staticmethod
+    def _atomic_write(path: str, content: str):
+        # Collectors may read the file at any time
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+NULL_PROFILER = Profiler(enabled=False)
@@ -1,20 +1,118 @@
-import json
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, Union
+
+from secureops.finding import Finding
+from secureops.writers import WRITERS, serialize
 
 
 class Reporter:
     """
-    Handles terminal output and JSON report generation.
+    Handles terminal output and report generation.
+    Findings are streamed to one or more report writers as they are
+    produced; summary and metadata are written when the scan ends.
     """
 
-    def __init__(self, findings: List[Dict], score_data: Dict, metadata: Dict):
-        self.findings = findings
+    def __init__(
+        self,
+        formats: Iterable[str] = ("json",),
+        compress: bool = False,
+        pretty: bool = False,
+        report_dir: str = "reports",
+        target_path: Optional[str] = None
+    ):
+        self.formats = list(formats)
+        self.target_path = target_path
+        self.compress = compress
+        self.pretty = pretty
+        self.score_data = {}
+        self.metadata = {}
+        self.report_dir = Path(report_dir)
+        self.writers = []
+        self.report_paths = []
+
+    # -------------------------
+    # Streaming Output
+    # -------------------------
+    def open(self):
+        if self.formats:
+            self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        base_path = self.report_dir / f"report_{timestamp}"
+
+        header = {
+            "schema_version": "2.0",
+            "generated_at": timestamp
+        }
+
+        self.writers = [
+            WRITERS[fmt](
+                base_path,
+                compress=self.compress,
+                pretty=self.pretty,
+                target_path=self.target_path
+            )
+            for fmt in self.formats
+        ]
+
+        for writer in self.writers:
+            writer.open(header)
+
+    def write(self, finding: Union[Finding, Dict]):
+        data = serialize(finding)
+        for writer in self.writers:
+            writer.write(data)
+
+    def close(self, score_data: Dict, metadata: Dict) -> List[str]:
         self.score_data = score_data
         self.metadata = metadata
-        self.report_dir = Path("reports")
-        self.report_dir.mkdir(exist_ok=True)
+
+        self.report_paths = []
+        for writer in self.writers:
+            self.report_paths.extend(writer.close(metadata, score_data))
+
+        for path in self.report_paths:
+            print(f"[+] Report saved to {path}")
+
+        return self.report_paths
+
+    def save_json_report(
+        self,
+        findings: Iterable[Union[Finding, Dict]],
+        score_data: Dict,
+        metadata: Dict
+    ) -> Optional[str]:
+        """
+        Convenience wrapper for callers that already hold all findings.
+        Returns the path of the first report written.
+        """
+        self.open()
+        for finding in findings:
+            self.write(finding)
+        paths = self.close(score_data, metadata)
+
+        return paths[0] if paths else None
+
+    # -------------------------
+    # Terminal Output
+    # -------------------------
+    def _print_rollup(self, title: str, rows: List[Dict], key: str, limit: int = 5):
+        rows = sorted(
+            (row for row in rows if row.get(key) != "."),
+            key=lambda row: row["risk_weight"],
+            reverse=True
+        )[:limit]
+
+        if not rows:
+            return
+
+        print(f"\n{title}:")
+        for row in rows:
+            print(
+                f"  {row[key]:<40} {row['risk_grade']} "
+                f"score={row['risk_score']:<5} findings={row['total_findings']}"
+            )
 
     def print_summary(self):
         print("\n========== SecureOps AI Report ==========")
@@ -27,29 +125,14 @@ class Reporter:
         print(f"Risk Score      : {self.score_data['risk_score']}")
         print(f"Risk Grade      : {self.score_data['risk_grade']}")
 
+        rollup = self.score_data.get("rollup")
+        if rollup:
+            self._print_rollup("Riskiest Directories", rollup["directories"], "path")
+            if rollup.get("owners"):
+                self._print_rollup("Riskiest Owners", rollup["owners"], "owner")
+
         print("\nScan Metadata:")
         print(f"  Files Scanned : {self.metadata.get('files_scanned')}")
         print(f"  Languages     : {', '.join(self.metadata.get('languages_detected', []))}")
         print(f"  Duration (s)  : {self.metadata.get('duration_seconds')}")
         print("=========================================\n")
-
-    def save_json_report(self) -> str:
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-
-        report_data = {
-            "schema_version": "2.0",
-            "generated_at": timestamp,
-            "metadata": self.metadata,
-            "summary": self.score_data,
-            "findings": self.findings
-        }
-
-        report_path = self.report_dir / f"report_{timestamp}.json"
-
-        with open(report_path, "w") as f:
-            json.dump(report_data, f, indent=4)
-
-        print(f"[+] Report saved to {report_path}")
-
-        return str(report_path)
-
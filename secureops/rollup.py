@@ -0,0 +1,208 @@
+from pathlib import Path
+from typing import List, Dict, Optional, Callable
+
+from secureops.finding import Finding
+from secureops.inventory import compile_glob
+from secureops.scorer import Scorer
+
+
+class CodeOwners:
+    """
+    CODEOWNERS file (GitHub/GitLab syntax).
+    Patterns follow gitignore rules and the last matching line wins,
+    except that a trailing `/*` owns only the files directly inside
+    that directory, not its subdirectories.
+    """
+
+    LOCATIONS = ("CODEOWNERS", ".github/CODEOWNERS", "docs/CODEOWNERS", ".gitlab/CODEOWNERS")
+
+    def __init__(self, lines: List[str]):
+        self.rules = []
+        self._cache = {}
+
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if not line or line.startswith("["):
+                continue
+
+            pattern, *owners = line.split()
+
+            anchored = "/" in pattern.rstrip("/")
+            pattern = pattern.strip("/")
+            shallow = pattern.endswith("/*")
+
+            if pattern:
+                self.rules.append((compile_glob(pattern), anchored, shallow, owners))
+
+    @classmethod
+    def load(cls, root: str, path: Optional[str] = None) -> Optional["CodeOwners"]:
+        candidates = [Path(path)] if path else [Path(root) / location for location in cls.LOCATIONS]
+
+        for candidate in candidates:
+            try:
+                with open(candidate, encoding="utf-8", errors="replace") as f:
+                    return cls(f.read().splitlines())
+            except OSError:
+                continue
+
+        return None
+
+    def owners_for(self, relative_path: str) -> List[str]:
+        owners = self._cache.get(relative_path)
+        if owners is not None:
+            return owners
+
+        # A pattern matching a directory owns everything below it
+        candidates = [relative_path]
+        parent = relative_path
+        while "/" in parent:
+            parent = parent.rsplit("/", 1)[0]
+            candidates.append(parent)
+
+        owners = []
+        for pattern, anchored, shallow, rule_owners in self.rules:
+            for candidate in candidates[:1] if shallow else candidates:
+                target = candidate if anchored else candidate.rsplit("/", 1)[-1]
+                if pattern.match(target):
+                    owners = rule_owners
+                    break
+
+        self._cache[relative_path] = owners
+        return owners
+
+
+class _Node:
+    __slots__ = ("children", "breakdown", "weight", "total")
+
+    def __init__(self):
+        self.children = {}
+        self.breakdown = dict.fromkeys(Scorer.SEVERITY_MAP, 0)
+        self.weight = 0
+        self.total = 0
+
+    def update(self, severity: str, sign: int):
+        self.breakdown[severity] += sign
+        self.weight += sign * Scorer.SEVERITY_MAP[severity]
+        self.total += sign
+
+    def summary(self) -> Dict:
+        score = round(self.weight / self.total, 2) if self.total else 0
+
+        return {
+            "total_findings": self.total,
+            "severity_breakdown": dict(self.breakdown),
+            "risk_weight": self.weight,
+            "risk_score": score,
+            "risk_grade": Scorer.calculate_grade(score)
+        }
+
+
+class RiskTree:
+    """
+    Per-directory risk rollup built in one pass.
+    Each finding updates the counters of every directory on its path
+    (O(depth)), so any subtree's score and grade are available without
+    refiltering the findings, and findings can be added or removed
+    incrementally. With a CODEOWNERS file, totals are also kept per
+    owner.
+    """
+
+    def __init__(
+        self,
+        path_key: Optional[Callable[[Optional[str]], str]] = None,
+        owners: Optional[CodeOwners] = None,
+        max_depth: int = 2
+    ):
+        self.path_key = path_key or (lambda file: (file or "").lstrip("/"))
+        self.owners = owners
+        self.max_depth = max_depth
+        self.root = _Node()
+        self.by_owner: Dict[str, _Node] = {}
+
+    # -------------------------
+    # Incremental Updates
+    # -------------------------
+    def add(self, finding: Finding, severity: Optional[str] = None):
+        self._update(finding, severity or finding.severity, 1)
+
+    def remove(self, finding: Finding, severity: Optional[str] = None):
+        self._update(finding, severity or finding.severity, -1)
+
+    def _update(self, finding: Finding, severity: str, sign: int):
+        severity = Scorer.normalize_severity(severity)
+        relative_path = self.path_key(finding.file)
+
+        node = self.root
+        node.update(severity, sign)
+
+        for part in relative_path.split("/")[:-1]:
+            child = node.children.get(part)
+
+            if child is None:
+                if sign < 0:
+                    break
+                child = node.children[part] = _Node()
+
+            child.update(severity, sign)
+
+            if child.total <= 0:
+                del node.children[part]
+                break
+
+            node = child
+
+        if self.owners:
+            for owner in self.owners.owners_for(relative_path) or ["(unowned)"]:
+                owner_node = self.by_owner.get(owner)
+
+                if owner_node is None:
+                    if sign < 0:
+                        continue
+                    owner_node = self.by_owner[owner] = _Node()
+
+                owner_node.update(severity, sign)
+                if owner_node.total <= 0:
+                    del self.by_owner[owner]
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def node(self, path: str) -> Optional[Dict]:
+        node = self.root
+
+        for part in path.strip("/").split("/"):
+            if part in ("", "."):
+                continue
+            node = node.children.get(part)
+            if node is None:
+                return None
+
+        return node.summary()
+
+    def directories(self, max_depth: Optional[int] = None) -> List[Dict]:
+        max_depth = self.max_depth if max_depth is None else max_depth
+        rows = []
+        pending = [(".", self.root, 0)]
+
+        while pending:
+            path, node, depth = pending.pop()
+            rows.append(dict(node.summary(), path=path))
+
+            if depth < max_depth:
+                for name, child in node.children.items():
+                    child_path = name if path == "." else f"{path}/{name}"
+                    pending.append((child_path, child, depth + 1))
+
+        return sorted(rows, key=lambda row: row["path"])
+
+    def owner_summary(self) -> List[Dict]:
+        return [
+            dict(node.summary(), owner=owner)
+            for owner, node in sorted(self.by_owner.items())
+        ]
+
+    def summary(self) -> Dict:
+        summary = {"directories": self.directories()}
+        if self.owners:
+            summary["owners"] = self.owner_summary()
+        return summary
@@ -0,0 +1,166 @@
+import re
+import json
+import fnmatch
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class Rule:
+    """
+    One compiled analysis rule: explanation text plus an optional fix spec.
+    """
+
+    __slots__ = ("id", "explanation", "risk_reason", "recommended_fix", "fix", "analysis")
+
+    def __init__(self, rule_id: Optional[str], data: Dict, default: Dict):
+        self.id = rule_id
+        self.explanation = data.get("explanation", default.get("explanation"))
+        self.risk_reason = data.get("risk_reason", default.get("risk_reason"))
+        self.recommended_fix = data.get("recommended_fix", default.get("recommended_fix"))
+        self.fix = data.get("fix")
+
+        # Built once and shared by every finding this rule matches
+        self.analysis = {
+            "explanation": self.explanation,
+            "risk_reason": self.risk_reason,
+            "recommended_fix": self.recommended_fix,
+            "auto_fix_possible": self.fix is not None
+        }
+
+
+class RuleEngine:
+    """
+    Data-driven rule matcher shared by Analyzer and Fixer.
+    A rule pack is compiled once into a tool rule ID lookup (exact
+    IDs plus globs) and a single keyword regex for messages.
+    Rule ID matches take precedence; otherwise the earliest rule in
+    the pack with a keyword in the message wins.
+    """
+
+    DEFAULT_PACK = Path(__file__).parent / "rulepacks" / "default.json"
+    CACHE_LIMIT = 100_000
+
+    _default = None
+
+    def __init__(self, pack: Dict):
+        default = pack.get("default", {})
+        self.fallback = Rule(None, {}, default)
+        self.rules = [
+            Rule(data["id"], data, default)
+            for data in pack.get("rules", [])
+        ]
+
+        self._exact_ids = {}
+        self._id_patterns = []
+        keyword_patterns = []
+        self._keyword_rules = {}
+
+        for index, data in enumerate(pack.get("rules", [])):
+            for rule_id in data.get("rule_ids", []):
+                if any(c in rule_id for c in "*?["):
+                    self._id_patterns.append((re.compile(fnmatch.translate(rule_id)), index))
+                else:
+                    self._exact_ids.setdefault(rule_id, index)
+
+            for keyword in data.get("keywords", []):
+                keyword = keyword.lower()
+                if keyword not in self._keyword_rules:
+                    self._keyword_rules[keyword] = index
+                    keyword_patterns.append(keyword)
+
+        # Alternatives ordered by rule priority, longest first within a
+        # rule; the lookahead reports a match at every start position
+        keyword_patterns.sort(key=lambda k: (self._keyword_rules[k], -len(k)))
+        self._keyword_matcher = (
+            re.compile("(?=(" + "|".join(re.escape(k) for k in keyword_patterns) + "))")
+            if keyword_patterns else None
+        )
+
+        # Canonical categories let different tools' IDs for the same
+        # weakness (e.g. trivy DS002 and checkov CKV_DOCKER_3) line up
+        self._categories = {
+            tool_rule_id: category
+            for category, tool_rule_ids in pack.get("categories", {}).items()
+            for tool_rule_id in tool_rule_ids
+        }
+
+        self._memo = {}
+
+    # -------------------------
+    # Loading
+    # -------------------------
+    @classmethod
+    def load(cls, path: str) -> "RuleEngine":
+        """
+        Loads a rule pack from JSON, or YAML when PyYAML is installed.
+        """
+        path = Path(path)
+        text = path.read_text(encoding="utf-8")
+
+        if path.suffix in (".yml", ".yaml"):
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError("PyYAML is required to load YAML rule packs")
+            return cls(yaml.safe_load(text))
+
+        return cls(json.loads(text))
+
+    @classmethod
+    def default(cls) -> "RuleEngine":
+        if cls._default is None:
+            cls._default = cls.load(cls.DEFAULT_PACK)
+        return cls._default
+
+    # -------------------------
+    # Matching
+    # -------------------------
+    def classify(self, rule_id: Optional[str], message: Optional[str]) -> Rule:
+        """
+        Returns the rule for a (tool rule ID, message) pair.
+        Results are memoized since large scans repeat a small set
+        of distinct rule/message combinations.
+        """
+        key = (rule_id, message)
+        rule = self._memo.get(key)
+
+        if rule is None:
+            rule = self._match(rule_id, message)
+            if len(self._memo) >= self.CACHE_LIMIT:
+                self._memo.clear()
+            self._memo[key] = rule
+
+        return rule
+
+    def classify_finding(self, finding) -> Rule:
+        return self.classify(finding.rule_id, finding.issue)
+
+    def category(self, rule_id: Optional[str], message: Optional[str]) -> Optional[str]:
+        """
+        Canonical, tool-independent category for a finding: an explicit
+        category mapping first, then the matched analysis rule.
+        """
+        if rule_id in self._categories:
+            return self._categories[rule_id]
+
+        return self.classify(rule_id, message).id
+
+    def _match(self, rule_id: Optional[str], message: Optional[str]) -> Rule:
+        if rule_id:
+            index = self._exact_ids.get(rule_id)
+            if index is not None:
+                return self.rules[index]
+
+            for pattern, index in self._id_patterns:
+                if pattern.match(rule_id):
+                    return self.rules[index]
+
+        if message and self._keyword_matcher:
+            indices = [
+                self._keyword_rules[m.group(1)]
+                for m in self._keyword_matcher.finditer(message.lower())
+            ]
+            if indices:
+                return self.rules[min(indices)]
+
+        return self.fallback
@@ -1,8 +1,25 @@
 import os
+import re
 import json
+import time
+import signal
+import asyncio
+import tempfile
+import threading
 import subprocess
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Callable
+
+from secureops.budget import Deadline, RuntimeHistory
+from secureops.cache import ScanCache
+from secureops.decoding import loads
+from secureops.finding import Finding
+from secureops.inventory import FileInventory
+from secureops.parser import Parser
+from secureops.profiler import Profiler, NULL_PROFILER
+from secureops.scheduler import ToolScheduler
+from secureops.secrets import SecretsScanner
+from secureops.semgrep_rules import SemgrepRulePack
 
 
 class ScannerOrchestrator:
@@ -11,10 +28,79 @@ class ScannerOrchestrator:
     Tracks metadata for reporting.
     """
 
-    def __init__(self, target_path: str):
+    # Tools in report order, with the languages that trigger them
+    TOOL_LANGUAGES = [
+        ("bandit", {"python"}),
+        ("semgrep", {"node", "go"}),
+        ("trivy", {"docker"}),
+        ("checkov", {"terraform"})
+    ]
+
+    TOOL_LANGUAGE_LABELS = {
+        "bandit": "python",
+        "semgrep": "multi",
+        "trivy": "docker",
+        "checkov": "terraform",
+        "secrets": "multi"
+    }
+
+    # Tools implemented in this package rather than spawned; they run
+    # over every inventoried file whatever the detected languages
+    IN_PROCESS_TOOLS = ("secrets",)
+
+    # Rule configuration each tool runs with; part of the cache key.
+    # semgrep uses the local rule pack hash instead when a snapshot exists
+    TOOL_RULE_CONFIGS = {
+        "bandit": "default",
+        "semgrep": "--config=auto",
+        "trivy": "config",
+        "checkov": "default",
+        "secrets": "builtin"
+    }
+
+    # Python is left to bandit; semgrep only sees JS/TS and Go sources
+    SEMGREP_EXTENSIONS = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".go")
+
+    # Byte budget for one scanner command line, well under ARG_MAX
+    # (and under the 32K command-line limit on Windows)
+    ARGV_LIMIT = 32000 if os.name == "nt" else 128 * 1024
+
+    _tool_versions = {}
+
+    def __init__(
+        self,
+        target_path: str,
+        jobs: int = 1,
+        cache: Optional[ScanCache] = None,
+        changed_files: Optional[List[Path]] = None,
+        diff_base: Optional[str] = None,
+        stream: bool = False,
+        semgrep_rules: Optional[str] = None,
+        profiler: Optional[Profiler] = None,
+        deadline: Optional[float] = None,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+        history: Optional[RuntimeHistory] = None,
+        secrets: bool = True
+    ):
         self.target_path = Path(target_path).resolve()
+        self.jobs = jobs
+        self.cache = cache
+        self.changed_files = changed_files
+        self.diff_base = diff_base
+        self.stream = stream
+        self.semgrep_rules = semgrep_rules
+        self.semgrep_pack = None
+        self.profiler = profiler or NULL_PROFILER
+        self.budget = Deadline(deadline)
+        self.tool_timeouts = tool_timeouts or {}
+        self.secrets = secrets
+        self.history = history or RuntimeHistory()
+        self.tool_order = []
+        self.tool_status: Dict[str, Dict] = {}
         self.detected_languages = set()
         self.results = []
+        self.inventory = None
+        self.files = []
         self.files_scanned = 0
 
     # -------------------------
@@ -22,26 +108,42 @@ class ScannerOrchestrator:
     # -------------------------
     def detect_languages(self) -> List[str]:
         """
-        Detects project languages and counts scanned files.
+        Detects project languages from the pruned file inventory.
+        In diff-scoped mode only the changed files are considered.
         """
-        for root, dirs, files in os.walk(self.target_path):
-            for file in files:
-                self.files_scanned += 1
+        self.inventory = FileInventory(self.target_path)
 
-                if file.endswith(".py"):
-                    self.detected_languages.add("python")
+        if self.changed_files is not None:
+            self.inventory.build_from(self.changed_files)
+        else:
+            self.inventory.build()
 
-                if file == "package.json":
-                    self.detected_languages.add("node")
+        self.files = self.inventory.files
 
-                if file == "go.mod":
-                    self.detected_languages.add("go")
+        for path in self.files:
+            file = path.name
+
+            if file.endswith(".py"):
+                self.detected_languages.add("python")
+
+            if file == "package.json":
+                self.detected_languages.add("node")
 
-                if file == "Dockerfile":
-                    self.detected_languages.add("docker")
+            if file == "go.mod":
+                self.detected_languages.add("go")
 
-                if file.endswith(".tf"):
-                    self.detected_languages.add("terraform")
+            if file == "Dockerfile":
+                self.detected_languages.add("docker")
+
+            if file.endswith(".tf"):
+                self.detected_languages.add("terraform")
+
+            # A changed source file counts even when its manifest is untouched
+            if self.changed_files is not None:
+                if path.suffix == ".go":
+                    self.detected_languages.add("go")
+                elif path.suffix in self.SEMGREP_EXTENSIONS:
+                    self.detected_languages.add("node")
 
         return list(self.detected_languages)
 
@@ -49,27 +151,473 @@ class ScannerOrchestrator:
     # Scanner Routing
     # -------------------------
     def run(self) -> List[Dict]:
-        languages = self.detect_languages()
+        tools = self._select_tools()
+        ordered = self._run_order(tools)
+
+        runners = {
+            tool: (lambda workers=None, tool=tool: self._run_tool(tool, workers))
+            for tool in tools
+        }
+
+        if self.jobs == 1:
+            outputs = [runners[tool]() for tool in ordered]
+        else:
+            outputs = ToolScheduler(self.jobs).run(ordered, runners)
+
+        # Keep report order stable regardless of run order
+        by_tool = dict(zip(ordered, outputs))
+        self.results = [result for tool in tools for result in by_tool[tool]]
+
+        if self.cache:
+            self.cache.evict()
+
+        return self.results
+
+    def _select_tools(self) -> List[str]:
+        with self.profiler.span("detect_languages", "scanner") as span:
+            languages = set(self.detect_languages())
+            if span:
+                span.attrs["files_indexed"] = len(self.files)
+
+        tools = [
+            tool for tool, triggers in self.TOOL_LANGUAGES
+            if triggers & languages
+        ]
+
+        if self.secrets and self.files:
+            tools.append("secrets")
 
-        if "python" in languages:
-            self.run_bandit()
+        # Count only the files some tool will actually analyze
+        self.files_scanned = len({
+            path for tool in tools for path in self._tool_files(tool)
+        })
 
-        if "node" in languages or "go" in languages:
-            self.run_semgrep()
+        return tools
 
-        if "docker" in languages:
-            self.run_trivy()
+    def _run_order(self, tools: List[str]) -> List[str]:
+        """
+        Under a deadline, tools expected to find the most per second
+        (from the runtime history) go first, so an exhausted budget cuts
+        the least valuable work. Otherwise lightest tools go first.
+        """
+        if self.budget.seconds is not None:
+            self.tool_order = self.history.order(tools)
+        else:
+            self.tool_order = sorted(tools, key=lambda t: ToolScheduler.TOOL_WEIGHTS.get(t, 1))
+        return self.tool_order
 
-        if "terraform" in languages:
-            self.run_checkov()
+    async def run_async(self, on_result: Callable[[str, Dict], None]) -> List[Dict]:
+        """
+        Runs the tools concurrently and hands every result entry to
+        `on_result` as soon as its invocation finishes, instead of after
+        the slowest tool. At most `jobs` tools run at once, lightest first
+        (or by value per second under a deadline), so the quickest results
+        arrive earliest. Each command runs on a worker thread through
+        _execute_command, timed into the tool's profiling span with the
+        reaped child's resource usage.
+        """
+        tools = self._select_tools()
+
+        scheduler = ToolScheduler(self.jobs)
+        allocation = scheduler.allocate(tools)
+        slots = asyncio.Semaphore(min(scheduler.jobs, len(tools)) or 1)
+        ordered = self._run_order(tools)
+
+        async def run_tool(tool: str) -> List[Dict]:
+            workers = allocation[tool] if self.jobs != 1 else None
+
+            if self.cache or tool in self.IN_PROCESS_TOOLS:
+                entries = await asyncio.to_thread(self._dispatch_tool, tool, workers)
+                for result in entries:
+                    on_result(tool, result)
+                return entries
+
+            targets = self._tool_targets(tool)
+            if not targets:
+                return []
+
+            print(f"[*] Running {self.TOOL_BANNERS[tool]}...")
+            entries = []
+            execute = self.profiler.timed(tool, self._execute_command, "tool", workers=workers or 1)
+
+            for cmd in self._tool_commands(tool, workers, targets):
+                result = self._tool_result(
+                    tool,
+                    [await asyncio.to_thread(execute, cmd)],
+                    [self._output_root(tool, cmd)]
+                )
+                if result:
+                    on_result(tool, result)
+                    entries.append(result)
+
+            return entries
+
+        async def run_one(tool: str) -> List[Dict]:
+            async with slots:
+                if self.budget.expired:
+                    self._tool_state(tool)["skipped"] = True
+                    return []
+
+                started = time.monotonic()
+                try:
+                    return await run_tool(tool)
+                finally:
+                    self._tool_state(tool)["seconds"] = round(time.monotonic() - started, 3)
+
+        outputs = await asyncio.gather(*(run_one(tool) for tool in ordered))
+
+        # Keep report order stable regardless of completion order
+        by_tool = dict(zip(ordered, outputs))
+        self.results = [result for tool in tools for result in by_tool[tool]]
+
+        if self.cache:
+            self.cache.evict()
 
         return self.results
 
+    def _run_tool(self, tool: str, workers: Optional[int] = None) -> List[Dict]:
+        if self.budget.expired:
+            self._tool_state(tool)["skipped"] = True
+            return []
+
+        started = time.monotonic()
+        try:
+            with self.profiler.span(tool, "tool", workers=workers or 1):
+                return self._dispatch_tool(tool, workers)
+        finally:
+            self._tool_state(tool)["seconds"] = round(time.monotonic() - started, 3)
+
+    def _dispatch_tool(self, tool: str, workers: Optional[int] = None) -> List[Dict]:
+        runner = getattr(self, f"run_{tool}")
+
+        if not self.cache:
+            targets = self._tool_targets(tool)
+            if not targets:
+                return []
+
+            output = runner(workers, targets=targets)
+            return [output] if output else []
+
+        return self._run_tool_cached(tool, runner, workers)
+
+    def _tool_targets(self, tool: str) -> List[Path]:
+        """
+        Explicit paths to hand to a tool, so it never walks files it has
+        no rules for: the tool's files from the inventory (only changed
+        ones in diff-scoped mode), or for checkov the Terraform module
+        directories that own them. Nested module directories are left
+        to checkov's recursion into their parent.
+        """
+        files = self._tool_files(tool)
+
+        if tool != "checkov":
+            return files
+
+        modules = sorted({f.parent for f in files})
+        selected = set()
+
+        for module in modules:
+            if not any(parent in selected for parent in module.parents):
+                selected.add(module)
+
+        return sorted(selected)
+
+    def _batched(self, fixed: List[str], groups: List[List[str]]) -> List[List[str]]:
+        """
+        Splits argument groups into command lines that each stay within
+        ARGV_LIMIT together with the fixed part of the command.
+        """
+        def size(args: List[str]) -> int:
+            # Each argument costs its bytes, a NUL and an argv pointer
+            return sum(len(os.fsencode(arg)) + 9 for arg in args)
+
+        fixed_size = size(fixed)
+        commands = []
+        batch = []
+        batch_size = fixed_size
+
+        for group in groups:
+            group_size = size(group)
+
+            if batch and batch_size + group_size > self.ARGV_LIMIT:
+                commands.append(fixed + batch)
+                batch = []
+                batch_size = fixed_size
+
+            batch.extend(group)
+            batch_size += group_size
+
+        if batch:
+            commands.append(fixed + batch)
+
+        return commands
+
+    # -------------------------
+    # Incremental Cache
+    # -------------------------
+    def _excluded_paths(self) -> List[str]:
+        """
+        Directories pruned by the inventory, relative to the target,
+        so whole-tree tool runs skip them too.
+        """
+        if not self.inventory:
+            return []
+
+        return [
+            str(path.relative_to(self.target_path))
+            for path in self.inventory.pruned
+        ]
+
+    def _tool_files(self, tool: str) -> List[Path]:
+        if tool == "bandit":
+            return [f for f in self.files if f.suffix == ".py"]
+        if tool == "semgrep":
+            return [f for f in self.files if f.suffix in self.SEMGREP_EXTENSIONS]
+        if tool == "trivy":
+            return [f for f in self.files if f.name == "Dockerfile"]
+        if tool == "checkov":
+            return [f for f in self.files if f.suffix == ".tf"]
+        if tool == "secrets":
+            return list(self.files)
+        return []
+
+    def _tool_version(self, tool: str) -> str:
+        if tool == "secrets":
+            return SecretsScanner.VERSION
+
+        if tool not in self._tool_versions:
+            try:
+                result = subprocess.run(
+                    [tool, "--version"],
+                    capture_output=True,
+                    text=True,
+                    check=False
+                )
+                lines = (result.stdout or result.stderr).strip().splitlines()
+                self._tool_versions[tool] = lines[0] if lines else "unknown"
+            except OSError:
+                self._tool_versions[tool] = "unknown"
+
+        return self._tool_versions[tool]
+
+    def _semgrep_pack(self) -> Optional[SemgrepRulePack]:
+        if self.semgrep_pack is None and self.semgrep_rules:
+            self.semgrep_pack = SemgrepRulePack.current(self.semgrep_rules)
+
+            if self.semgrep_pack is None:
+                print(
+                    f"[!] No semgrep rule snapshot in {self.semgrep_rules}; "
+                    "falling back to --config=auto (run `main.py rules update`)."
+                )
+                self.semgrep_rules = None
+
+        return self.semgrep_pack
+
+    def _rule_config(self, tool: str) -> str:
+        if tool == "semgrep":
+            pack = self._semgrep_pack()
+            if pack:
+                return f"pack:{pack.sha256}"
+
+        return self.TOOL_RULE_CONFIGS[tool]
+
+    def _run_tool_cached(self, tool: str, runner, workers: Optional[int]) -> List[Dict]:
+        """
+        Serves unchanged files from the cache and runs the tool only on
+        files whose content hash has no entry yet.
+        """
+        version = self._tool_version(tool)
+        rule_config = self._rule_config(tool)
+        language = self.TOOL_LANGUAGE_LABELS[tool]
+
+        cached_findings = []
+        changed = {}
+
+        for path in self._tool_files(tool):
+            try:
+                file_hash = ScanCache.hash_file(path)
+            except OSError:
+                continue
+
+            key = ScanCache.make_key(file_hash, tool, version, rule_config)
+            findings = self.cache.get(key)
+
+            if findings is None:
+                changed[path] = key
+            else:
+                for data in findings:
+                    data["file"] = str(path)
+                    cached_findings.append(Finding.from_dict(data))
+
+        results = []
+
+        if cached_findings:
+            results.append({
+                "tool": tool,
+                "language": language,
+                "findings": cached_findings
+            })
+
+        if not changed:
+            return results
+
+        output = runner(workers, targets=list(changed))
+        fresh_findings = Parser([output]).parse() if output else []
+
+        per_file = {path: [] for path in changed}
+        unmatched = 0
+        for finding in fresh_findings:
+            path = self._match_file(finding.file, changed)
+            if path is None:
+                unmatched += 1
+            else:
+                per_file[path].append(finding)
+
+        # Only store results when the tool actually produced output,
+        # otherwise a failed run would be cached as "no findings". A run
+        # cut short by a timeout may have missed findings, and findings
+        # not attributable to one file would be missing from some file's
+        # entry, so both are reported but not cached
+        if output and (unmatched or self._is_truncated(tool)):
+            results.append({
+                "tool": tool,
+                "language": language,
+                "findings": fresh_findings
+            })
+        elif output:
+            for path, key in changed.items():
+                self.cache.put(key, [finding.to_dict() for finding in per_file[path]])
+
+            results.append({
+                "tool": tool,
+                "language": language,
+                "findings": fresh_findings
+            })
+
+        return results
+
+    def _match_file(self, reported: Optional[str], candidates: Dict[Path, str]) -> Optional[Path]:
+        """
+        Maps a path as reported by a tool back to the scanned file.
+        Tools report absolute, target-relative or file-name-only paths.
+        A path matches a candidate exactly, relative to the target, or
+        as a whole-segment suffix of exactly one candidate; ambiguous
+        paths match nothing.
+        """
+        if not reported:
+            return None
+
+        path = Path(reported)
+        if path in candidates:
+            return path
+
+        relative = reported.lstrip("/")
+        if not relative:
+            return None
+
+        path = self.target_path / relative
+        if path in candidates:
+            return path
+
+        suffix = "/" + Path(relative).as_posix()
+        matches = [
+            candidate for candidate in candidates
+            if candidate.as_posix().endswith(suffix)
+        ]
+
+        return matches[0] if len(matches) == 1 else None
+
     # -------------------------
     # Tool Runners
     # -------------------------
-    def run_bandit(self):
-        print("[*] Running Bandit (Python)...")
+    TOOL_BANNERS = {
+        "bandit": "Bandit (Python)",
+        "semgrep": "Semgrep (Multi-language)",
+        "trivy": "Trivy (Dockerfile)",
+        "checkov": "Checkov (Terraform)",
+        "secrets": "built-in secrets scanner"
+    }
+
+    def run_bandit(
+        self,
+        workers: Optional[int] = None,
+        targets: Optional[List[Path]] = None
+    ) -> Optional[Dict]:
+        return self._run_commands("bandit", self._bandit_commands(workers, targets))
+
+    def run_semgrep(
+        self,
+        workers: Optional[int] = None,
+        targets: Optional[List[Path]] = None
+    ) -> Optional[Dict]:
+        return self._run_commands("semgrep", self._semgrep_commands(workers, targets))
+
+    def run_trivy(
+        self,
+        workers: Optional[int] = None,
+        targets: Optional[List[Path]] = None
+    ) -> Optional[Dict]:
+        return self._run_commands("trivy", self._trivy_commands(workers, targets))
+
+    def run_checkov(
+        self,
+        workers: Optional[int] = None,
+        targets: Optional[List[Path]] = None
+    ) -> Optional[Dict]:
+        return self._run_commands("checkov", self._checkov_commands(workers, targets))
+
+    def run_secrets(
+        self,
+        workers: Optional[int] = None,
+        targets: Optional[List[Path]] = None
+    ) -> Optional[Dict]:
+        print(f"[*] Running {self.TOOL_BANNERS['secrets']}...")
+
+        # Without a scheduler allocation the whole --jobs budget applies
+        # (0 = all cores)
+        findings = SecretsScanner(workers or self.jobs).scan(targets if targets is not None else self.files)
+
+        return {
+            "tool": "secrets",
+            "language": self.TOOL_LANGUAGE_LABELS["secrets"],
+            "findings": findings
+        }
+
+    def _run_commands(self, tool: str, commands: List[List[str]]) -> Optional[Dict]:
+        print(f"[*] Running {self.TOOL_BANNERS[tool]}...")
+        return self._tool_result(
+            tool,
+            [self._execute_command(cmd) for cmd in commands],
+            [self._output_root(tool, cmd) for cmd in commands]
+        )
+
+    @staticmethod
+    def _output_root(tool: str, cmd: List[str]) -> Optional[str]:
+        """
+        Directory a command's reported paths are relative to, for tools
+        that report them that way: trivy's Target is relative to the
+        directory it scanned, or the scanned file's own directory.
+        """
+        if tool != "trivy":
+            return None
+
+        scanned = Path(cmd[-1])
+        return str(scanned if scanned.is_dir() else scanned.parent)
+
+    def _tool_commands(
+        self,
+        tool: str,
+        workers: Optional[int] = None,
+        targets: Optional[List[Path]] = None
+    ) -> List[List[str]]:
+        return getattr(self, f"_{tool}_commands")(workers, targets)
+
+    def _bandit_commands(self, workers: Optional[int], targets: Optional[List[Path]]) -> List[List[str]]:
+        if targets:
+            return self._batched(
+                ["bandit", "-f", "json"],
+                [[str(t)] for t in targets]
+            )
 
         cmd = [
             "bandit",
@@ -79,93 +627,287 @@ class ScannerOrchestrator:
             "json"
         ]
 
-        output = self._execute_command(cmd)
-        if output:
-            self.results.append({
-                "tool": "bandit",
-                "language": "python",
-                "raw": output
-            })
+        excluded = [str(self.target_path / p) for p in self._excluded_paths()]
+        if excluded:
+            cmd.extend(["-x", ",".join(excluded)])
 
-    def run_semgrep(self):
-        print("[*] Running Semgrep (Multi-language)...")
+        return [cmd]
 
-        cmd = [
-            "semgrep",
-            "--config=auto",
-            "--json",
-            str(self.target_path)
-        ]
+    def _semgrep_commands(self, workers: Optional[int], targets: Optional[List[Path]]) -> List[List[str]]:
+        pack = self._semgrep_pack()
 
-        output = self._execute_command(cmd)
-        if output:
-            self.results.append({
-                "tool": "semgrep",
-                "language": "multi",
-                "raw": output
-            })
+        cmd = ["semgrep"]
+        cmd.extend(pack.config_args() if pack else ["--config=auto"])
+        cmd.append("--json")
 
-    def run_trivy(self):
-        print("[*] Running Trivy (Dockerfile)...")
+        if workers:
+            cmd.extend(["--jobs", str(workers)])
 
-        cmd = [
-            "trivy",
-            "config",
-            "--format",
-            "json",
-            str(self.target_path)
-        ]
+        if targets:
+            return self._batched(cmd, [[str(t)] for t in targets])
 
-        output = self._execute_command(cmd)
-        if output:
-            self.results.append({
-                "tool": "trivy",
-                "language": "docker",
-                "raw": output
-            })
+        cmd.append(str(self.target_path))
+        for excluded in self._excluded_paths():
+            cmd.extend(["--exclude", excluded])
 
-    def run_checkov(self):
-        print("[*] Running Checkov (Terraform)...")
+        return [cmd]
 
-        cmd = [
-            "checkov",
-            "-d",
-            str(self.target_path),
-            "--output",
-            "json"
+    def _trivy_commands(self, workers: Optional[int], targets: Optional[List[Path]]) -> List[List[str]]:
+        # trivy config accepts a single target per invocation
+        commands = []
+
+        for path in targets or [self.target_path]:
+            cmd = ["trivy", "config", "--format", "json"]
+
+            excluded = self._excluded_paths()
+            if not targets and excluded:
+                cmd.extend(["--skip-dirs", ",".join(excluded)])
+
+            # The scanned path goes last; _output_root() reads it
+            cmd.append(str(path))
+            commands.append(cmd)
+
+        return commands
+
+    def _checkov_commands(self, workers: Optional[int], targets: Optional[List[Path]]) -> List[List[str]]:
+        cmd = ["checkov", "--output", "json"]
+        for excluded in self._excluded_paths():
+            cmd.extend(["--skip-path", re.escape(excluded)])
+
+        if targets and all(t.is_dir() for t in targets):
+            return self._batched(cmd, [["-d", str(t)] for t in targets])
+        if targets:
+            return self._batched(cmd + ["-f"], [[str(t)] for t in targets])
+
+        return [cmd + ["-d", str(self.target_path)]]
+
+    def _tool_result(
+        self,
+        tool: str,
+        outputs: List,
+        roots: Optional[List[Optional[str]]] = None
+    ) -> Optional[Dict]:
+        """
+        Wraps tool output in a result entry: decoded JSON under "raw",
+        or spooled output files under "raw_paths" when streaming.
+        `roots` gives each output's _output_root(); the entry keeps them
+        under "roots", one per spooled file and then one per report.
+        """
+        pairs = [
+            (output, root)
+            for output, root in zip(outputs, roots or [None] * len(outputs))
+            if output
         ]
+        if not pairs:
+            return None
 
-        output = self._execute_command(cmd)
-        if output:
-            self.results.append({
-                "tool": "checkov",
-                "language": "terraform",
-                "raw": output
-            })
+        result = {
+            "tool": tool,
+            "language": self.TOOL_LANGUAGE_LABELS[tool]
+        }
+
+        # Spooled output: every output in stream mode, or the partial
+        # output of a command killed by a timeout
+        spooled = [(output, root) for output, root in pairs if isinstance(output, str)]
+        decoded = [(output, root) for output, root in pairs if not isinstance(output, str)]
+
+        report_roots = [root for _, root in spooled]
+        if spooled:
+            result["raw_paths"] = [output for output, _ in spooled]
+
+        if len(decoded) == 1 and not isinstance(decoded[0][0], list):
+            result["raw"] = decoded[0][0]
+            report_roots.append(decoded[0][1])
+        elif decoded:
+            # Several invocations (batches, or one per trivy target):
+            # Parser reads a list as one report per entry
+            reports = []
+            for output, root in decoded:
+                output = output if isinstance(output, list) else [output]
+                reports.extend(output)
+                report_roots.extend([root] * len(output))
+            result["raw"] = reports
+
+        if any(root is not None for root in report_roots):
+            result["roots"] = report_roots
+
+        return result
 
     # -------------------------
     # Metadata Getter
     # -------------------------
     def get_metadata(self) -> Dict:
-        return {
+        metadata = {
             "languages_detected": list(self.detected_languages),
             "files_scanned": self.files_scanned
         }
 
+        if self.cache:
+            metadata["cache"] = self.cache.get_metadata()
+
+        if self.semgrep_pack:
+            metadata["semgrep_rules"] = self.semgrep_pack.get_metadata()
+
+        if self.diff_base:
+            metadata["diff_base"] = self.diff_base
+
+        if self.inventory:
+            metadata["inventory"] = self.inventory.get_metadata()
+
+        if self.budget.seconds is not None or self.tool_timeouts:
+            metadata["deadline"] = {
+                "budget_seconds": self.budget.seconds,
+                "tool_timeouts": self.tool_timeouts,
+                "elapsed_seconds": round(self.budget.elapsed(), 3),
+                "tool_order": self.tool_order,
+                "complete": all(
+                    self._status(tool) == "complete" for tool in self.tool_status
+                ),
+                "tools": {
+                    tool: dict(state, status=self._status(tool))
+                    for tool, state in self.tool_status.items()
+                }
+            }
+
+        return metadata
+
+    # -------------------------
+    # Deadlines and Timeouts
+    # -------------------------
+    def _tool_state(self, tool: str) -> Dict:
+        if tool not in self.tool_status:
+            self.tool_status[tool] = {
+                "commands_run": 0,
+                "commands_timed_out": 0,
+                "commands_skipped": 0,
+                "paths_skipped": []
+            }
+        return self.tool_status[tool]
+
+    def _status(self, tool: str) -> str:
+        state = self._tool_state(tool)
+
+        if state.get("skipped") or (state["commands_skipped"] and not state["commands_run"]):
+            return "skipped"
+        if state["commands_timed_out"] or state["commands_skipped"]:
+            return "truncated"
+        return "complete"
+
+    def _is_truncated(self, tool: str) -> bool:
+        return self._status(tool) != "complete"
+
+    def _command_timeout(self, cmd: List[str]) -> Optional[float]:
+        """
+        Timeout for one command, or 0 if the budget is spent and the
+        command should be skipped (recording which paths it covered).
+        """
+        tool = Path(cmd[0]).name
+        timeout = self.budget.timeout(self.tool_timeouts.get(tool))
+        state = self._tool_state(tool)
+
+        if timeout is not None and timeout <= 0:
+            state["commands_skipped"] += 1
+            target = str(self.target_path)
+            state["paths_skipped"].extend(arg for arg in cmd[1:] if arg.startswith(target))
+            return 0
+
+        state["commands_run"] += 1
+        return timeout
+
+    def _record_timeout(self, cmd: List[str], timeout: float):
+        tool = Path(cmd[0]).name
+        self._tool_state(tool)["commands_timed_out"] += 1
+        print(f"[!] {tool} exceeded its {timeout:.1f}s budget; killed, keeping partial results.")
+
+    @staticmethod
+    def _kill_group(process: subprocess.Popen, killed: threading.Event):
+        """
+        Kills the scanner together with every process it started (the
+        command runs in its own session, so its group id is its pid).
+        """
+        killed.set()
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    @staticmethod
+    def _salvage(cmd: List[str], stdout: bytes) -> Optional[str]:
+        """
+        Spools the partial JSON of a killed command so Parser can
+        recover the complete findings written before the kill.
+        """
+        if not stdout:
+            return None
+
+        fd, spool_path = tempfile.mkstemp(prefix=f"secureops_{Path(cmd[0]).name}_", suffix=".json")
+        with os.fdopen(fd, "wb") as out:
+            out.write(stdout)
+        return spool_path
+
+    def record_history(self, findings_by_tool: Dict[str, int]):
+        """
+        Folds this scan's tool runtimes into the runtime history.
+        Cached scans are left out, since their runtimes only cover
+        changed files.
+        """
+        if self.cache:
+            return
+
+        for tool, state in self.tool_status.items():
+            status = self._status(tool)
+            if status == "skipped" or "seconds" not in state:
+                continue
+            self.history.record(
+                tool,
+                state["seconds"],
+                findings_by_tool.get(tool, 0),
+                complete=status == "complete"
+            )
+
+        self.history.save()
+
     # -------------------------
     # Safe Command Execution
     # -------------------------
-    def _execute_command(self, cmd: List[str]) -> Dict:
+    def _execute_command(self, cmd: List[str]):
+        timeout = self._command_timeout(cmd)
+        if timeout == 0:
+            return None
+
+        if self.stream:
+            return self._spool_command(cmd, timeout)
+
+        killed = threading.Event()
+        timer = None
+
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                check=False
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
 
-            if result.stdout:
-                return json.loads(result.stdout)
+            if timeout is not None:
+                timer = threading.Timer(timeout, self._kill_group, (process, killed))
+                timer.start()
+
+            with process.stdout:
+                stdout = process.stdout.read()
+            if timer:
+                timer.cancel()
+            self.profiler.record_child(self._reap(process), len(stdout))
+
+            if killed.is_set():
+                self._record_timeout(cmd, timeout)
+                return self._salvage(cmd, stdout)
+
+            if stdout:
+                return loads(stdout)
 
             return None
 
@@ -174,5 +916,70 @@ class ScannerOrchestrator:
             return None
 
         except Exception as e:
+            if timer:
+                timer.cancel()
             print(f"[!] Scanner execution error: {e}")
             return None
+
+    def _spool_command(self, cmd: List[str], timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Streams the tool's stdout straight to a temporary file instead of
+        holding it in memory. Returns the file path, or None if the tool
+        produced no output. Parser deletes the file once consumed; if the
+        tool was killed at its timeout, the complete findings written
+        before the kill are still recovered from the file.
+        """
+        fd, spool_path = tempfile.mkstemp(prefix=f"secureops_{cmd[0]}_", suffix=".json")
+        killed = threading.Event()
+        timer = None
+
+        try:
+            with os.fdopen(fd, "wb") as out:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=out,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+
+            if timeout is not None:
+                timer = threading.Timer(timeout, self._kill_group, (process, killed))
+                timer.start()
+
+            rusage = self._reap(process)
+            if timer:
+                timer.cancel()
+            self.profiler.record_child(rusage, os.path.getsize(spool_path))
+
+            if killed.is_set():
+                self._record_timeout(cmd, timeout)
+
+            if os.path.getsize(spool_path) > 0:
+                return spool_path
+
+        except Exception as e:
+            if timer:
+                timer.cancel()
+            print(f"[!] Scanner execution error: {e}")
+
+        os.unlink(spool_path)
+        return None
+
+    @staticmethod
+    def _reap(process: subprocess.Popen):
+        """
+        Waits for a scanner with wait4 so its own CPU time and peak RSS
+        can be attributed to the tool's profiling span. Where wait4 is
+        unavailable (Windows) there is no rusage to report.
+        """
+        if not hasattr(os, "wait4"):
+            process.wait()
+            return None
+
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return rusage
+        except ChildProcessError:
+            process.wait()
+            return None
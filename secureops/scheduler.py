@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Callable, Any
+
+
+class ToolScheduler:
+    """
+    Runs scanner tools concurrently within a fixed core budget.
+    Cores are split between tools by weight and results are
+    returned in the order the tools were submitted.
+    """
+
+    # Relative cost of each tool; heavier tools receive more cores
+    TOOL_WEIGHTS = {
+        "bandit": 1,
+        "semgrep": 3,
+        "trivy": 1,
+        "checkov": 2,
+        "secrets": 1
+    }
+
+    def __init__(self, jobs: int):
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        self.jobs = jobs
+
+    # -------------------------
+    # Core Allocation
+    # -------------------------
+    def allocate(self, tools: List[str]) -> Dict[str, int]:
+        """
+        Splits the core budget between tools. Every tool gets at least
+        one core; spare cores go to the heaviest tools first.
+        """
+        if not tools:
+            return {}
+
+        allocation = {tool: 1 for tool in tools}
+        spare = self.jobs - len(tools)
+
+        if spare <= 0:
+            return allocation
+
+        weights = {tool: self.TOOL_WEIGHTS.get(tool, 1) for tool in tools}
+        total_weight = sum(weights.values())
+
+        for tool in tools:
+            share = (spare * weights[tool]) // total_weight
+            allocation[tool] += share
+
+        # Hand out cores lost to rounding, heaviest tools first
+        remaining = self.jobs - sum(allocation.values())
+        for tool in sorted(tools, key=lambda t: -weights[t]):
+            if remaining <= 0:
+                break
+            allocation[tool] += 1
+            remaining -= 1
+
+        return allocation
+
+    # -------------------------
+    # Execution
+    # -------------------------
+    def run(
+        self,
+        tools: List[str],
+        runners: Dict[str, Callable[[int], Any]]
+    ) -> List[Any]:
+        """
+        Starts each tool's runner with its core allocation and collects
+        results in submission order so reports stay deterministic.
+        """
+        if not tools:
+            return []
+
+        allocation = self.allocate(tools)
+        max_workers = min(self.jobs, len(tools))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(runners[tool], allocation[tool])
+                for tool in tools
+            ]
+            return [future.result() for future in futures]
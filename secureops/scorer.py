@@ -1,4 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional
+
+from secureops.finding import Finding
 
 
 class Scorer:
@@ -13,10 +15,24 @@ class Scorer:
         "LOW": 1
     }
 
-    def __init__(self, findings: List[Dict]):
-        self.findings = findings
+    def __init__(self, findings: Optional[List[Finding]] = None, rollup=None):
+        """
+        `rollup` is an optional secureops.rollup.RiskTree kept in step
+        with the totals for per-directory and per-owner scores.
+        """
+        self.findings = findings or []
+        self.rollup = rollup
+        self.total = 0
+        self.total_weight = 0
+        self.breakdown = {
+            "CRITICAL": 0,
+            "HIGH": 0,
+            "MEDIUM": 0,
+            "LOW": 0
+        }
 
-    def normalize_severity(self, severity: str) -> str:
+    @staticmethod
+    def normalize_severity(severity: str) -> str:
         if not severity:
             return "LOW"
 
@@ -33,7 +49,8 @@ class Scorer:
 
         return "LOW"
 
-    def calculate_grade(self, score: float) -> str:
+    @staticmethod
+    def calculate_grade(score: float) -> str:
         if score <= 2:
             return "A"
         elif score <= 4:
@@ -45,10 +62,65 @@ class Scorer:
         else:
             return "F"
 
-    def score(self) -> Dict:
-        total = len(self.findings)
-
-        if total == 0:
+    # -------------------------
+    # Incremental Scoring
+    # -------------------------
+    def add(self, finding: Finding) -> Finding:
+        """
+        Normalizes one finding's severity and folds it into the totals.
+        """
+        normalized = self.normalize_severity(finding.severity)
+        finding.severity = normalized
+
+        self.total += 1
+        self.breakdown[normalized] += 1
+        self.total_weight += self.SEVERITY_MAP[normalized]
+
+        if self.rollup is not None:
+            self.rollup.add(finding, normalized)
+
+        return finding
+
+    def remove(self, finding: Finding) -> Finding:
+        """
+        Takes a previously added finding back out of the totals, e.g.
+        when an incremental scan finds it fixed.
+        """
+        normalized = self.normalize_severity(finding.severity)
+
+        self.total -= 1
+        self.breakdown[normalized] -= 1
+        self.total_weight -= self.SEVERITY_MAP[normalized]
+
+        if self.rollup is not None:
+            self.rollup.remove(finding, normalized)
+
+        return finding
+
+    def rescore(self, finding: Finding, previous_severity: str) -> Finding:
+        """
+        Updates the totals for a finding already added whose severity
+        has since changed (e.g. raised by a duplicate from another tool).
+        """
+        normalized = self.normalize_severity(finding.severity)
+        finding.severity = normalized
+
+        self.breakdown[previous_severity] -= 1
+        self.breakdown[normalized] += 1
+        self.total_weight += self.SEVERITY_MAP[normalized] - self.SEVERITY_MAP[previous_severity]
+
+        if self.rollup is not None:
+            self.rollup.remove(finding, previous_severity)
+            self.rollup.add(finding, normalized)
+
+        return finding
+
+    def iter_score(self, findings: Iterable[Finding]) -> Iterator[Finding]:
+        for finding in findings:
+            yield self.add(finding)
+
+    def summary(self) -> Dict:
+        if self.total == 0:
             return {
                 "total_findings": 0,
                 "severity_breakdown": {},
@@ -56,28 +128,23 @@ class Scorer:
                 "risk_grade": "A"
             }
 
-        breakdown = {
-            "CRITICAL": 0,
-            "HIGH": 0,
-            "MEDIUM": 0,
-            "LOW": 0
-        }
-
-        total_weight = 0
-
-        for finding in self.findings:
-            normalized = self.normalize_severity(finding.get("severity"))
-            finding["severity"] = normalized
-
-            breakdown[normalized] += 1
-            total_weight += self.SEVERITY_MAP[normalized]
-
-        risk_score = round(total_weight / total, 2)
+        risk_score = round(self.total_weight / self.total, 2)
         risk_grade = self.calculate_grade(risk_score)
 
-        return {
-            "total_findings": total,
-            "severity_breakdown": breakdown,
+        summary = {
+            "total_findings": self.total,
+            "severity_breakdown": dict(self.breakdown),
             "risk_score": risk_score,
             "risk_grade": risk_grade
         }
+
+        if self.rollup is not None:
+            summary["rollup"] = self.rollup.summary()
+
+        return summary
+
+    def score(self) -> Dict:
+        for finding in self.findings:
+            self.add(finding)
+
+        return self.summary()
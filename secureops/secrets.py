@@ -0,0 +1,195 @@
+import os
+import re
+import math
+import mmap
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+
+from secureops.finding import Finding
+
+
+# (rule name, severity, pattern). A pattern's named group holds the
+# value checked against ENTROPY_THRESHOLDS and PLACEHOLDER; patterns
+# without one are specific enough alone
+SECRET_PATTERNS = [
+    ("aws-access-key-id", "HIGH", rb"\b(?:AKIA|ASIA|AGPA|AIDA|AROA|ANPA)[0-9A-Z]{16}\b"),
+    ("aws-secret-access-key", "CRITICAL",
+     rb"(?i)aws.{0,20}?(?:secret|sk).{0,20}?['\"=:\s]\s*['\"]?(?P<aws>[A-Za-z0-9/+=]{40})(?![A-Za-z0-9/+=])"),
+    ("private-key", "CRITICAL", rb"-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP |ENCRYPTED )?PRIVATE KEY(?: BLOCK)?-----"),
+    ("github-token", "HIGH", rb"\b(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9]{36}\b|\bgithub_pat_[A-Za-z0-9_]{82}\b"),
+    ("gitlab-token", "HIGH", rb"\bglpat-[A-Za-z0-9_\-]{20}\b"),
+    ("slack-token", "HIGH", rb"\bxox[abposr]-[A-Za-z0-9-]{10,72}\b"),
+    ("slack-webhook", "MEDIUM", rb"https://hooks\.slack\.com/services/T[A-Za-z0-9_]+/B[A-Za-z0-9_]+/[A-Za-z0-9_]+"),
+    ("stripe-key", "HIGH", rb"\b(?:sk|rk)_live_[A-Za-z0-9]{24,99}\b"),
+    ("google-api-key", "HIGH", rb"\bAIza[0-9A-Za-z_\-]{35}\b"),
+    ("jwt", "MEDIUM", rb"\beyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\b"),
+    ("connection-string-password", "HIGH",
+     rb"\b[a-z][a-z0-9+.-]{1,20}://[^\s:/@'\"]{1,64}:(?P<url>[^\s:/@'\"]{6,128})@[^\s'\"]+"),
+    ("terraform-variable-default", "HIGH",
+     rb"variable\s+\"[^\"]*(?i:password|secret|token|api_key|access_key)[^\"]*\"\s*\{[^}]{0,200}?"
+     rb"default\s*=\s*\"(?P<hcl>[^\"$]{8,200})\""),
+    ("generic-secret", "HIGH",
+     rb"(?i)(?:password|passwd|pwd|secret|api[_-]?key|access[_-]?key|auth[_-]?token|token|private[_-]?key|client[_-]?secret)"
+     rb"[\w.-]{0,20}['\"]?\s*(?::=|=>|[:=])\s*['\"]?(?P<generic>[^\s'\"`,;)}{]{8,200})")
+]
+
+# Minimum Shannon entropy (bits per character) of each rule's value group
+ENTROPY_THRESHOLDS = {
+    "aws": 3.5,
+    "url": 2.5,
+    "hcl": 3.0,
+    "generic": 3.5
+}
+
+# Values that are references or placeholders, not secrets
+PLACEHOLDER = re.compile(
+    rb"(?i)^(?:\$\{|\$\(|\{\{|<|%\(|process\.env|os\.(?:getenv|environ)|env\(|getenv|"
+    rb".*(?:example|changeme|placeholder|dummy|redacted|your[_-]|xxxx|\*\*\*\*))"
+)
+
+
+def _compile() -> Tuple["re.Pattern", Dict[str, Tuple[str, str, Optional[str]]]]:
+    """
+    One alternation over every pattern, so each file is scanned in a
+    single pass. Group r<N> identifies the rule that matched.
+    """
+    parts = []
+    rules = {}
+
+    for index, (name, severity, pattern) in enumerate(SECRET_PATTERNS):
+        flags = b""
+        if pattern.startswith(b"(?i)"):
+            flags, pattern = b"(?i:", pattern[4:]
+
+        value_group = next(iter(re.compile(pattern).groupindex), None)
+        body = flags + pattern + b")" if flags else pattern
+        parts.append(b"(?P<r%d>" % index + body + b")")
+        rules[f"r{index}"] = (name, severity, value_group)
+
+    return re.compile(b"|".join(parts)), rules
+
+
+SECRETS_REGEX, SECRET_RULES = _compile()
+
+
+def shannon_entropy(value: bytes) -> float:
+    if not value:
+        return 0.0
+
+    length = len(value)
+    return -sum(
+        count / length * math.log2(count / length)
+        for count in Counter(value).values()
+    )
+
+
+def scan_file(path: str, max_bytes: int) -> List[Tuple[str, int, str, str]]:
+    """
+    Scans one file through a read-only mmap. Binary files (a NUL byte
+    in the first 8 KiB), empty files and files above max_bytes are
+    skipped. Returns (path, line, rule, severity) tuples.
+    """
+    results = []
+
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size > max_bytes:
+                return results
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if b"\0" in data[:8192]:
+                    return results
+
+                line = 1
+                counted = 0
+
+                for match in SECRETS_REGEX.finditer(data):
+                    name, severity, value_group = SECRET_RULES[match.lastgroup]
+
+                    # A keyword match whose value is itself a known token
+                    # format (key = "AKIA...") is reported as that token
+                    if value_group == "generic":
+                        inner = SECRETS_REGEX.search(match.group(value_group))
+                        if inner and SECRET_RULES[inner.lastgroup][2] is None:
+                            name, severity, value_group = SECRET_RULES[inner.lastgroup]
+
+                    if value_group:
+                        value = match.group(value_group)
+                        if PLACEHOLDER.match(value):
+                            continue
+                        if shannon_entropy(value) < ENTROPY_THRESHOLDS[value_group]:
+                            continue
+
+                    start = match.start()
+                    line += data[counted:start].count(b"\n")
+                    counted = start
+
+                    results.append((path, line, name, severity))
+
+    except (OSError, ValueError):
+        pass
+
+    return results
+
+
+def _scan_chunk(paths: List[str], max_bytes: int) -> List[Tuple[str, int, str, str]]:
+    results = []
+    for path in paths:
+        results.extend(scan_file(path, max_bytes))
+    return results
+
+
+class SecretsScanner:
+    """
+    Built-in secrets detector.
+    Runs in-process over the file inventory with one precompiled
+    multi-pattern regex, Shannon-entropy checks on generic matches, and
+    mmap reads, fanned out over a process pool for larger inventories.
+    Emits normalized findings directly (tool "secrets"), so no external
+    scanner is needed. Secret values never appear in the findings.
+    """
+
+    VERSION = "secureops-secrets 1"
+
+    # Files larger than this are skipped (minified bundles, data dumps)
+    MAX_BYTES = 2 * 1024 * 1024
+
+    # Below this many files the pool's startup costs more than it saves
+    POOL_THRESHOLD = 256
+    CHUNK_SIZE = 64
+
+    def __init__(self, workers: Optional[int] = None, max_bytes: int = MAX_BYTES):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_bytes = max_bytes
+
+    def scan(self, files: List[Path]) -> List[Finding]:
+        paths = [str(path) for path in files]
+
+        if len(paths) < self.POOL_THRESHOLD or self.workers == 1:
+            raw = _scan_chunk(paths, self.max_bytes)
+        else:
+            chunks = [paths[i:i + self.CHUNK_SIZE] for i in range(0, len(paths), self.CHUNK_SIZE)]
+            raw = []
+
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(_scan_chunk, chunk, self.max_bytes) for chunk in chunks]
+                for future in as_completed(futures):
+                    raw.extend(future.result())
+
+            raw.sort()
+
+        return [
+            Finding(
+                file=path,
+                line=line,
+                issue=f"Hardcoded secret detected ({name.replace('-', ' ')})",
+                severity=severity,
+                rule_id=f"secrets.hardcoded-secret.{name}",
+                tool="secrets",
+                language="multi"
+            )
+            for path, line, name, severity in raw
+        ]
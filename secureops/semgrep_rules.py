@@ -0,0 +1,198 @@
+import json
+import shutil
+import hashlib
+import tempfile
+import urllib.request
+from pathlib import Path
+from datetime import datetime, UTC
+from typing import List, Dict, Optional
+
+
+class SemgrepRulePack:
+    """
+    Offline snapshot of semgrep rules.
+    Rules are fetched from the registry (or copied from a local file or
+    directory) once into a content-addressed version directory, so scans
+    run semgrep against a local config instead of resolving
+    `--config=auto` on every invocation. The pack hash goes into report
+    metadata and the scan cache key.
+    """
+
+    DEFAULT_DIR = ".secureops_rules/semgrep"
+    DEFAULT_SOURCE = "p/default"
+    REGISTRY_URL = "https://semgrep.dev/c/"
+    RULE_SUFFIXES = (".yml", ".yaml", ".json")
+
+    # Packs resolved in this process, keyed by pack root
+    _loaded = {}
+
+    def __init__(self, root: Path, version: str, manifest: Dict):
+        self.root = root
+        self.version = version
+        self.path = root / version
+        self.manifest = manifest
+        self.sha256 = manifest["sha256"]
+
+    # -------------------------
+    # Loading
+    # -------------------------
+    @classmethod
+    def current(cls, root: str = DEFAULT_DIR) -> Optional["SemgrepRulePack"]:
+        """
+        The active snapshot under `root`, verified once per process.
+        Returns None when no usable snapshot exists.
+        """
+        root = Path(root).resolve()
+
+        if root in cls._loaded:
+            return cls._loaded[root]
+
+        pack = None
+
+        try:
+            version = (root / "CURRENT").read_text().strip()
+            pack = cls.open(root, version)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"[!] Ignoring semgrep rule pack in {root}: {e}")
+
+        cls._loaded[root] = pack
+        return pack
+
+    @classmethod
+    def open(cls, root: Path, version: str) -> "SemgrepRulePack":
+        path = root / version
+
+        with open(path / "manifest.json") as f:
+            manifest = json.load(f)
+
+        digest = cls._hash_rules(path)
+        if digest != manifest.get("sha256"):
+            raise ValueError(f"rule pack {version} does not match its manifest hash")
+
+        return cls(root, version, manifest)
+
+    @classmethod
+    def _rule_files(cls, path: Path) -> List[Path]:
+        return sorted(
+            p for p in path.rglob("*")
+            if p.is_file() and p.suffix in cls.RULE_SUFFIXES and p.name != "manifest.json"
+        )
+
+    @classmethod
+    def _hash_rules(cls, path: Path) -> str:
+        digest = hashlib.sha256()
+
+        for file in cls._rule_files(path):
+            digest.update(file.relative_to(path).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(file.read_bytes())
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def config_args(self) -> List[str]:
+        return ["--config", str(self.path), "--metrics=off"]
+
+    def get_metadata(self) -> Dict:
+        return {
+            "version": self.version,
+            "sha256": self.sha256,
+            "source": self.manifest.get("source"),
+            "created_at": self.manifest.get("created_at"),
+            "path": str(self.path)
+        }
+
+    # -------------------------
+    # Snapshots
+    # -------------------------
+    @classmethod
+    def snapshot(
+        cls,
+        root: str = DEFAULT_DIR,
+        source: str = DEFAULT_SOURCE,
+        timeout: float = 60
+    ) -> "SemgrepRulePack":
+        """
+        Stores the rules from `source` as a new version and makes it
+        current. `source` is a local rule file or directory, or a
+        registry config such as p/default. Identical rules reuse the
+        existing version directory.
+        """
+        root = Path(root).resolve()
+        root.mkdir(parents=True, exist_ok=True)
+
+        staging = Path(tempfile.mkdtemp(prefix=".staging_", dir=root))
+
+        try:
+            local = Path(source)
+
+            if local.is_dir():
+                for file in cls._rule_files(local):
+                    dest = staging / file.relative_to(local)
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(file, dest)
+            elif local.is_file():
+                shutil.copyfile(local, staging / f"rules{local.suffix or '.yml'}")
+            else:
+                url = cls.REGISTRY_URL + source.lstrip("/")
+                with urllib.request.urlopen(url, timeout=timeout) as response:
+                    (staging / "rules.yml").write_bytes(response.read())
+
+            if not cls._rule_files(staging):
+                raise ValueError(f"no rule files found in {source}")
+
+            digest = cls._hash_rules(staging)
+            version = digest[:12]
+            path = root / version
+
+            manifest = {
+                "version": version,
+                "sha256": digest,
+                "source": source,
+                "created_at": datetime.now(UTC).isoformat()
+            }
+
+            if path.exists():
+                shutil.rmtree(staging)
+            else:
+                with open(staging / "manifest.json", "w") as f:
+                    json.dump(manifest, f, indent=2)
+                staging.rename(path)
+
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        cls.activate(root, version)
+        return cls.open(root, version)
+
+    @classmethod
+    def activate(cls, root: Path, version: str):
+        """
+        Points CURRENT at an existing version.
+        """
+        root = Path(root).resolve()
+
+        if not (root / version / "manifest.json").is_file():
+            raise ValueError(f"unknown rule pack version: {version}")
+
+        tmp_path = root / "CURRENT.tmp"
+        tmp_path.write_text(version + "\n")
+        tmp_path.replace(root / "CURRENT")
+
+        cls._loaded.pop(root, None)
+
+    @classmethod
+    def versions(cls, root: str = DEFAULT_DIR) -> List[Dict]:
+        root = Path(root).resolve()
+        versions = []
+
+        for manifest_path in sorted(root.glob("*/manifest.json")):
+            try:
+                with open(manifest_path) as f:
+                    versions.append(json.load(f))
+            except (OSError, json.JSONDecodeError):
+                continue
+
+        return sorted(versions, key=lambda m: m.get("created_at", ""))
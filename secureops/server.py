@@ -0,0 +1,431 @@
+import os
+import json
+import time
+import socket
+import hashlib
+import argparse
+import itertools
+import threading
+import contextlib
+from pathlib import Path
+from collections import OrderedDict
+from datetime import datetime, UTC
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+from secureops.batch import cached_engine
+from secureops.gitdiff import merge_base
+from secureops.inventory import FileInventory
+from secureops.pipeline import run_scan
+
+
+def scan_job(target: str, args: argparse.Namespace, report_dir: Optional[str]) -> Dict:
+    """
+    Runs one server scan inside a pool worker. Console output is
+    discarded; the findings come back in the result.
+    """
+    with open(os.devnull, "w") as sink, \
+            contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        result = run_scan(
+            target,
+            args,
+            cached_engine(args.rules),
+            report_dir=report_dir or "reports",
+            keep_findings=True
+        )
+
+    if result is None:
+        return {"summary": None, "metadata": {}, "report_paths": [], "findings": []}
+
+    return {
+        "summary": result["score_data"],
+        "metadata": result["metadata"],
+        "report_paths": result["report_paths"],
+        "findings": result["findings"]
+    }
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+class ScanJob:
+    """
+    One queued scan of a tree state. Every request for the same state
+    while it is queued or running waits on the same job.
+    """
+
+    def __init__(self, job_id: str, target: str, key: str):
+        self.id = job_id
+        self.target = target
+        self.key = key
+        self.status = "queued"
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.requests = 1
+        self.future: Optional[Future] = None
+        self.done = threading.Event()
+
+    @property
+    def state(self) -> str:
+        if self.status == "queued" and self.future is not None and self.future.running():
+            return "running"
+        return self.status
+
+    @property
+    def cacheable(self) -> bool:
+        if self.status != "done":
+            return False
+
+        # A scan cut short by a deadline may have missed findings
+        deadline = self.result["metadata"].get("deadline") or {}
+        return deadline.get("complete", True)
+
+    def to_dict(self, findings: bool = True) -> Dict:
+        data = {
+            "job": self.id,
+            "status": self.state,
+            "target": self.target,
+            "tree_state": self.key,
+            "submitted_at": datetime.fromtimestamp(self.submitted_at, UTC).isoformat(),
+            "requests": self.requests
+        }
+
+        if self.finished_at is not None:
+            data["duration_seconds"] = round(self.finished_at - self.submitted_at, 3)
+
+        if self.error is not None:
+            data["error"] = self.error
+
+        if self.result is not None:
+            data["summary"] = self.result["summary"]
+            data["metadata"] = self.result["metadata"]
+            data["report_paths"] = self.result["report_paths"]
+            if findings:
+                data["findings"] = self.result["findings"]
+
+        return data
+
+
+class ScanServer:
+    """
+    Long-running scan service behind `main.py serve`.
+    Scans run on a process pool started once, whose workers inherit the
+    server's imports and loaded rule engine and keep their scanner
+    version cache between jobs. Requests are keyed by tree state (the
+    target, the size and mtime of every inventoried file, the diff base
+    commit and the rule files); identical in-flight requests share one
+    job, and recent results are served from an LRU cache without
+    scanning.
+    """
+
+    # Finished jobs kept addressable by id beyond those in the LRU cache
+    MAX_JOBS = 256
+
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        workers: Optional[int] = None,
+        cache_entries: int = 64,
+        report_dir: Optional[str] = None
+    ):
+        self.args = args
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_entries = cache_entries
+        self.report_dir = Path(report_dir) if report_dir else None
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.results: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self.inflight: Dict[str, ScanJob] = {}
+        self.jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.pool_lock = threading.Lock()
+        self.started = time.time()
+        self.counts = {"requests": 0, "cache_hits": 0, "joined": 0, "scans": 0, "errors": 0}
+        self._ids = itertools.count(1)
+
+        # Options are fixed for the server's lifetime; hash them once
+        options = json.dumps(vars(args), sort_keys=True, default=str)
+        self.options_digest = hashlib.sha256(options.encode()).hexdigest()
+
+    # -------------------------
+    # Worker Pool
+    # -------------------------
+    def start(self):
+        """
+        Loads the rule engine and starts every worker up front, so the
+        first request does not pay for either.
+        """
+        cached_engine(self.args.rules)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        for future in [self.pool.submit(_warm) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, job: ScanJob) -> Future:
+        report_dir = str(self.report_dir / job.id) if self.report_dir else None
+        pool = self.pool
+
+        try:
+            return pool.submit(scan_job, job.target, self.args, report_dir)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); replace the pool
+            # unless another request already has
+            with self.pool_lock:
+                if self.pool is pool:
+                    print("[!] Worker pool broken, restarting it")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self.pool.submit(scan_job, job.target, self.args, report_dir)
+
+    # -------------------------
+    # Tree State
+    # -------------------------
+    def tree_state(self, target: str) -> str:
+        """
+        Digest of everything a scan result depends on. File contents are
+        represented by size and mtime, so a repeat request costs one
+        inventory walk and a stat per file.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{self.options_digest}\0{target}\0".encode())
+
+        diff_base = self.args.since or ("HEAD" if self.args.changed_only else None)
+        if diff_base:
+            digest.update(f"{merge_base(target, diff_base)}\0".encode())
+
+        for path in (self.args.rules, self.args.semgrep_rules, self.args.codeowners):
+            if path:
+                digest.update(self._stat(Path(path)))
+
+        for path in FileInventory(target).build().files:
+            digest.update(f"{path}\0".encode())
+            digest.update(self._stat(path))
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _stat(path: Path) -> bytes:
+        try:
+            stat = path.stat()
+        except OSError:
+            return b"-\n"
+        return f"{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+
+    # -------------------------
+    # Jobs
+    # -------------------------
+    def submit(self, target: str, refresh: bool = False):
+        """
+        Returns (job, source): the cached job for this tree state
+        ("cache"), the queued or running job for it ("joined"), or a
+        newly queued job ("queued").
+        """
+        target = str(Path(target).resolve())
+        key = self.tree_state(target)
+
+        with self.lock:
+            self.counts["requests"] += 1
+
+            if not refresh and key in self.results:
+                self.results.move_to_end(key)
+                self.counts["cache_hits"] += 1
+                return self.results[key], "cache"
+
+            if key in self.inflight:
+                job = self.inflight[key]
+                job.requests += 1
+                self.counts["joined"] += 1
+                return job, "joined"
+
+            job = ScanJob(str(next(self._ids)), target, key)
+            self.inflight[key] = job
+            self._remember(job)
+            self.counts["scans"] += 1
+
+        # Requests joining meanwhile wait on job.done, not the future
+        try:
+            job.future = self._submit(job)
+        except Exception as e:
+            job.future = Future()
+            job.future.set_exception(e)
+
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        return job, "queued"
+
+    def _finish(self, job: ScanJob, future: Future):
+        try:
+            job.result = future.result()
+            job.status = "done"
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = "error"
+
+        job.finished_at = time.time()
+
+        with self.lock:
+            self.inflight.pop(job.key, None)
+
+            if job.status == "error":
+                self.counts["errors"] += 1
+                print(f"[!] Job {job.id} failed for {job.target}: {job.error}")
+            elif job.cacheable:
+                self.results[job.key] = job
+                self.results.move_to_end(job.key)
+                while len(self.results) > self.cache_entries:
+                    self.results.popitem(last=False)
+
+        job.done.set()
+
+    def _remember(self, job: ScanJob):
+        self.jobs[job.id] = job
+
+        # Drop the oldest finished jobs; queued and running ones stay
+        for job_id in list(self.jobs):
+            if len(self.jobs) <= self.MAX_JOBS:
+                break
+            if self.jobs[job_id].done.is_set():
+                del self.jobs[job_id]
+
+    def job(self, job_id: str) -> Optional[ScanJob]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def status(self) -> Dict:
+        with self.lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "workers": self.workers,
+                "queued": sum(job.state == "queued" for job in self.inflight.values()),
+                "running": sum(job.state == "running" for job in self.inflight.values()),
+                "cached_results": len(self.results),
+                "cache_entries": self.cache_entries,
+                **self.counts
+            }
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API:
+        POST /scan      {"path": DIR, "wait": true, "timeout": SECONDS, "refresh": false}
+        GET  /jobs/ID   status of a job, with its findings once done
+        GET  /health    server status and counters
+    """
+
+    server_version = "SecureOps"
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        # Headers and body go out as separate writes; without this the
+        # body waits on a delayed ACK
+        self.disable_nagle_algorithm = self.request.family != socket.AF_UNIX
+        super().setup()
+
+    def _send(self, status: int, body: Dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _status_code(job: ScanJob) -> int:
+        if not job.done.is_set():
+            return 202
+        return 500 if job.status == "error" else 200
+
+    def log_message(self, format: str, *args):
+        print(f"[*] {self.command} {self.path}: {format % args}")
+
+    def log_request(self, code="-", size="-"):
+        if self.server.verbose:
+            super().log_request(code, size)
+
+    def do_GET(self):
+        scan_server = self.server.scan_server
+
+        if self.path == "/health":
+            self._send(200, scan_server.status())
+            return
+
+        if self.path.startswith("/jobs/"):
+            job = scan_server.job(self.path[len("/jobs/"):])
+            if job is None:
+                self._send(404, {"error": "unknown job"})
+            else:
+                self._send(self._status_code(job), job.to_dict())
+            return
+
+        self._send(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/scan":
+            self._send(404, {"error": f"unknown path {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            target = request["path"]
+            timeout = request.get("timeout")
+            timeout = float(timeout) if timeout is not None else None
+        except (ValueError, TypeError, KeyError) as e:
+            self._send(400, {"error": f"bad request: {e}"})
+            return
+
+        if not isinstance(target, str) or not os.path.isdir(target):
+            self._send(400, {"error": f"not a directory: {target}"})
+            return
+
+        job, source = self.server.scan_server.submit(target, refresh=bool(request.get("refresh")))
+
+        if request.get("wait", True):
+            job.done.wait(timeout)
+
+        body = job.to_dict()
+        body["source"] = source
+        self._send(self._status_code(job), body)
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """
+    HTTP over a Unix socket, for clients that should not open a port.
+    """
+
+    daemon_threads = True
+
+    def server_bind(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.server_address)
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.server_address)
+
+
+def make_http_server(
+    scan_server: ScanServer,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+    verbose: bool = False
+):
+    if socket_path:
+        httpd = UnixHTTPServer(socket_path, ScanRequestHandler)
+    else:
+        httpd = ThreadingHTTPServer((host, port), ScanRequestHandler)
+
+    httpd.scan_server = scan_server
+    httpd.verbose = verbose
+    return httpd
@@ -0,0 +1,426 @@
+import os
+import json
+import time
+import shutil
+import socket
+import multiprocessing
+from pathlib import Path
+from datetime import datetime, UTC
+from typing import List, Dict, Optional, Tuple
+
+from secureops.cache import ScanCache
+from secureops.dedup import Deduplicator
+from secureops.finding import Finding
+from secureops.inventory import FileInventory
+from secureops.parser import Parser
+from secureops.scanner import ScannerOrchestrator
+
+
+# Files that make their directory a project root
+PROJECT_MARKERS = {
+    "package.json",
+    "go.mod",
+    "Dockerfile",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg"
+}
+
+
+def plan_shards(inventory: FileInventory, secrets: bool = False) -> List[Dict]:
+    """
+    Splits an inventory into per-project shards. Every directory holding
+    a project marker (or a Terraform file) is a shard root; each scannable
+    file belongs to its deepest enclosing root, and files outside every
+    project fall into a shard for the target itself. With `secrets`,
+    every inventoried file is scannable, since .env, YAML and JSON files
+    no analyzer claims are what the secrets scanner reads. Largest shards
+    come first so workers finish at about the same time.
+    """
+    root = inventory.root
+    project_roots = {root}
+
+    for path in inventory.files:
+        if path.name in PROJECT_MARKERS or path.suffix == ".tf":
+            project_roots.add(path.parent)
+
+    shards = {}
+
+    for path in inventory.files:
+        if (
+            not secrets
+            and path.name not in PROJECT_MARKERS
+            and FileInventory.classify(path) is None
+        ):
+            continue
+
+        directory = path.parent
+        while directory not in project_roots:
+            directory = directory.parent
+
+        shards.setdefault(directory, []).append(path.relative_to(root).as_posix())
+
+    planned = [
+        {
+            "root": directory.relative_to(root).as_posix(),
+            "files": files
+        }
+        for directory, files in shards.items()
+    ]
+
+    return sorted(planned, key=lambda shard: (-len(shard["files"]), shard["root"]))
+
+
+class ShardQueue:
+    """
+    File-based work queue for one sharded scan.
+    Shards move pending/ -> claimed/ -> done/ by atomic rename, so any
+    number of processes or machines sharing the directory can drain it
+    without a coordinator or locks. Claims older than the lease are
+    returned to pending/ in case their worker died.
+    """
+
+    STATES = ("pending", "claimed", "done")
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._plan = None
+
+    @classmethod
+    def create(cls, queue_dir: str, target_path: Path, options: Dict) -> "ShardQueue":
+        run_id = f"{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}_{socket.gethostname()}_{os.getpid()}"
+        queue = cls(Path(queue_dir) / run_id)
+
+        for state in cls.STATES:
+            (queue.path / state).mkdir(parents=True)
+
+        queue._plan = {
+            "target": str(target_path),
+            "created_at": datetime.now(UTC).isoformat(),
+            "options": options,
+            "shards": 0
+        }
+        return queue
+
+    @classmethod
+    def runs(cls, queue_dir: str) -> List["ShardQueue"]:
+        """
+        Queues under `queue_dir`, or `queue_dir` itself if it is one.
+        """
+        queue_dir = Path(queue_dir)
+
+        if (queue_dir / "plan.json").is_file():
+            return [cls(queue_dir)]
+
+        return [cls(path.parent) for path in sorted(queue_dir.glob("*/plan.json"))]
+
+    @property
+    def plan(self) -> Dict:
+        if self._plan is None:
+            with open(self.path / "plan.json") as f:
+                self._plan = json.load(f)
+        return self._plan
+
+    def _write_json(self, path: Path, data: Dict):
+        tmp_path = self.path / f".{path.name}.{socket.gethostname()}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    # -------------------------
+    # Producer
+    # -------------------------
+    def enqueue(self, shards: List[Dict]):
+        width = len(str(len(shards)))
+
+        for index, shard in enumerate(shards):
+            name = f"{index:0{width}d}.json"
+            self._write_json(self.path / "pending" / name, dict(shard, id=index))
+
+        # The plan is written last; workers ignore queues without one
+        self._plan["shards"] = len(shards)
+        self._write_json(self.path / "plan.json", self._plan)
+
+    def requeue_stale(self, lease_seconds: float) -> int:
+        now = time.time()
+        requeued = 0
+
+        for path in (self.path / "claimed").iterdir():
+            try:
+                if now - path.stat().st_mtime > lease_seconds:
+                    os.rename(path, self.path / "pending" / path.name)
+                    requeued += 1
+            except OSError:
+                continue
+
+        return requeued
+
+    def progress(self) -> Dict[str, int]:
+        return {
+            state: sum(1 for name in os.listdir(self.path / state) if name.endswith(".json"))
+            for state in self.STATES
+        }
+
+    def is_complete(self) -> bool:
+        return self.progress()["done"] >= self.plan["shards"]
+
+    def results(self) -> List[Dict]:
+        results = []
+
+        for path in sorted((self.path / "done").glob("*.json")):
+            with open(path) as f:
+                results.append(json.load(f))
+
+        return results
+
+    def remove(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    # -------------------------
+    # Consumer
+    # -------------------------
+    def claim(self) -> Optional[Tuple[str, Dict]]:
+        for name in sorted(os.listdir(self.path / "pending")):
+            if not name.endswith(".json"):
+                continue
+
+            claimed = self.path / "claimed" / name
+
+            try:
+                os.rename(self.path / "pending" / name, claimed)
+            except FileNotFoundError:
+                # Another worker got there first
+                continue
+
+            # The claim time starts the lease
+            os.utime(claimed)
+
+            with open(claimed) as f:
+                return name, json.load(f)
+
+        return None
+
+    def complete(self, name: str, result: Dict):
+        self._write_json(self.path / "done" / name, result)
+
+        try:
+            os.unlink(self.path / "claimed" / name)
+        except FileNotFoundError:
+            pass
+
+
+# -------------------------
+# Workers
+# -------------------------
+def scan_shard(target_path: Path, shard: Dict, options: Dict) -> Dict:
+    """
+    Runs every applicable tool on one shard's files and returns its
+    parsed (not yet deduplicated) findings grouped by tool. Paths are
+    written relative to the target, since a remote worker's checkout
+    may live elsewhere than the coordinator's.
+    """
+    cache = None
+    if options.get("cache_dir"):
+        cache = ScanCache(
+            options["cache_dir"],
+            max_bytes=options.get("cache_max_bytes", 512 * 1024 * 1024),
+            max_age_days=options.get("cache_max_age", 30)
+        )
+
+    orchestrator = ScannerOrchestrator(
+        target_path,
+        jobs=options.get("jobs", 1),
+        cache=cache,
+        changed_files=[target_path / file for file in shard["files"]],
+        stream=options.get("stream", False),
+        semgrep_rules=options.get("semgrep_rules"),
+        secrets=options.get("secrets", True)
+    )
+
+    started = time.time()
+    grouped = {}
+    paths = Deduplicator(str(target_path))
+
+    for finding in Parser(orchestrator.run()).iter_parse():
+        if finding.file:
+            finding.file = paths.normalize_path(finding.file)
+        entry = grouped.setdefault(finding.tool, {
+            "tool": finding.tool,
+            "language": finding.language,
+            "findings": []
+        })
+        entry["findings"].append(finding.to_dict())
+
+    return {
+        "id": shard["id"],
+        "root": shard["root"],
+        "worker": f"{socket.gethostname()}:{os.getpid()}",
+        "duration_seconds": round(time.time() - started, 2),
+        "tools_used": [result["tool"] for result in orchestrator.results],
+        "metadata": orchestrator.get_metadata(),
+        "results": list(grouped.values())
+    }
+
+
+def drain_queue(queue_dir: str, target_path: Optional[str] = None) -> int:
+    """
+    Claims and scans shards from every queue under `queue_dir` until
+    none are pending. `target_path` overrides the planned target, for
+    workers whose checkout lives elsewhere. Returns shards completed.
+    """
+    completed = 0
+
+    for queue in ShardQueue.runs(queue_dir):
+        try:
+            plan = queue.plan
+        except (OSError, json.JSONDecodeError):
+            continue
+
+        target = Path(target_path or plan["target"]).resolve()
+
+        while True:
+            claimed = queue.claim()
+            if claimed is None:
+                break
+
+            name, shard = claimed
+            print(f"[*] Shard {shard['id']}: {shard['root'] or '.'} ({len(shard['files'])} files)")
+
+            try:
+                result = scan_shard(target, shard, plan["options"])
+            except Exception as e:
+                print(f"[!] Shard {shard['id']} failed: {e}")
+                result = {
+                    "id": shard["id"],
+                    "root": shard["root"],
+                    "worker": f"{socket.gethostname()}:{os.getpid()}",
+                    "error": str(e),
+                    "results": []
+                }
+
+            queue.complete(name, result)
+            completed += 1
+
+    return completed
+
+
+class ShardedScanner:
+    """
+    Drop-in replacement for ScannerOrchestrator in sharded mode.
+    Plans per-project shards, queues them under `queue_dir`, drains the
+    queue with local worker processes (other machines may join with
+    `main.py worker`), then merges the shard results.
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        target_path: str,
+        queue_dir: str,
+        workers: int = 1,
+        lease_seconds: float = 3600,
+        options: Optional[Dict] = None
+    ):
+        self.target_path = Path(target_path).resolve()
+        self.queue_dir = queue_dir
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self.options = options or {}
+        self.inventory = None
+        self.shard_results = []
+        self.results = []
+
+    def run(self) -> List[Dict]:
+        self.inventory = FileInventory(self.target_path).build()
+        shards = plan_shards(self.inventory, secrets=self.options.get("secrets", True))
+
+        if not shards:
+            return []
+
+        queue = ShardQueue.create(self.queue_dir, self.target_path, self.options)
+        queue.enqueue(shards)
+        print(f"[*] Queued {len(shards)} shard(s) in {queue.path}")
+
+        processes = [
+            multiprocessing.Process(target=drain_queue, args=(str(queue.path),))
+            for _ in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        last_done = -1
+        while not queue.is_complete():
+            queue.requeue_stale(self.lease_seconds)
+
+            progress = queue.progress()
+            if progress["done"] != last_done:
+                last_done = progress["done"]
+                print(f"[*] Shards done: {last_done}/{len(shards)}")
+
+            # Finish leftover work ourselves if every local worker has exited
+            if processes and not any(p.is_alive() for p in processes) and progress["pending"]:
+                drain_queue(str(queue.path))
+                continue
+
+            time.sleep(self.POLL_SECONDS)
+
+        for process in processes:
+            process.join()
+
+        self.shard_results = queue.results()
+        queue.remove()
+
+        self.results = []
+        for shard in self.shard_results:
+            for result in shard["results"]:
+                self.results.append({
+                    "tool": result["tool"],
+                    "language": result["language"],
+                    "findings": [self._finding(data) for data in result["findings"]]
+                })
+
+        return self.results
+
+    def _finding(self, data: Dict) -> Finding:
+        # Shard paths are target-relative; re-root them on this checkout
+        if data.get("file"):
+            data["file"] = str(self.target_path / data["file"])
+        return Finding.from_dict(data)
+
+    def get_metadata(self) -> Dict:
+        languages = set()
+        files_scanned = 0
+        semgrep_rules = None
+
+        for shard in self.shard_results:
+            metadata = shard.get("metadata") or {}
+            languages.update(metadata.get("languages_detected", []))
+            files_scanned += metadata.get("files_scanned", 0)
+            semgrep_rules = semgrep_rules or metadata.get("semgrep_rules")
+
+        metadata = {
+            "languages_detected": sorted(languages),
+            "files_scanned": files_scanned,
+            "shards": {
+                "total": len(self.shard_results),
+                "local_workers": self.workers,
+                "workers": sorted({shard["worker"] for shard in self.shard_results}),
+                "failed": [
+                    {"root": shard["root"], "error": shard["error"]}
+                    for shard in self.shard_results
+                    if "error" in shard
+                ],
+                "shard_seconds": round(
+                    sum(shard.get("duration_seconds", 0) for shard in self.shard_results), 2
+                )
+            }
+        }
+
+        if semgrep_rules:
+            metadata["semgrep_rules"] = semgrep_rules
+
+        if self.inventory:
+            metadata["inventory"] = self.inventory.get_metadata()
+
+        return metadata
@@ -0,0 +1,317 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta, UTC
+from typing import List, Dict, Optional
+
+from secureops.finding import Finding
+
+
+class FindingStore:
+    """
+    SQLite-backed history of scans and findings.
+    Each scan is bulk-inserted in a single transaction; indexes on
+    fingerprint, file, severity, tool and scan id keep queries fast
+    without reparsing old JSON reports. First and last sightings are
+    tracked per match key, which leaves out the line, so an edit above
+    a finding does not reset its age; the line is kept per scan.
+    """
+
+    BATCH_SIZE = 5000
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS scans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            target TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            completed_at TEXT,
+            total_findings INTEGER,
+            risk_score REAL,
+            risk_grade TEXT,
+            metadata TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS findings (
+            scan_id INTEGER NOT NULL REFERENCES scans(id),
+            fingerprint TEXT,
+            file TEXT,
+            line INTEGER,
+            severity TEXT,
+            tool TEXT,
+            tools TEXT,
+            rule_id TEXT,
+            issue TEXT,
+            language TEXT,
+            match_key TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS match_keys (
+            target TEXT NOT NULL,
+            match_key TEXT NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            first_scan_id INTEGER NOT NULL,
+            last_scan_id INTEGER NOT NULL,
+            PRIMARY KEY (target, match_key)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_findings_scan ON findings(scan_id);
+        CREATE INDEX IF NOT EXISTS idx_findings_fingerprint ON findings(fingerprint);
+        CREATE INDEX IF NOT EXISTS idx_findings_file ON findings(file);
+        CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity);
+        CREATE INDEX IF NOT EXISTS idx_findings_tool ON findings(tool);
+        CREATE INDEX IF NOT EXISTS idx_scans_target ON scans(target, id);
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self.conn.executescript(self.SCHEMA)
+
+        self.scan_id = None
+        self.target = None
+        self.started_at = None
+        self._pending = []
+
+    def _migrate(self):
+        # Stores created before match keys: add the column; their
+        # fingerprint-keyed sightings are left unused
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(findings)")]
+        if columns and "match_key" not in columns:
+            self.conn.execute("ALTER TABLE findings ADD COLUMN match_key TEXT")
+
+    # -------------------------
+    # Ingestion
+    # -------------------------
+    def begin_scan(self, target: str, started_at: str) -> int:
+        self.conn.execute("BEGIN")
+
+        cursor = self.conn.execute(
+            "INSERT INTO scans (target, started_at) VALUES (?, ?)",
+            (target, started_at)
+        )
+
+        self.scan_id = cursor.lastrowid
+        self.target = target
+        self.started_at = started_at
+        return self.scan_id
+
+    def add(self, finding: Finding, file: Optional[str] = None):
+        """
+        Queues one finding; `file` overrides the stored path, e.g. with
+        the target-relative path used for fingerprints.
+        """
+        self._pending.append((
+            self.scan_id,
+            finding.fingerprint,
+            file if file is not None else finding.file,
+            finding.line,
+            finding.severity,
+            finding.tool,
+            ",".join(finding.tools or [finding.tool]),
+            finding.rule_id,
+            finding.issue,
+            finding.language,
+            finding.match_key
+        ))
+
+        if len(self._pending) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        self.conn.executemany(
+            "INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._pending
+        )
+
+        self.conn.executemany(
+            """
+            INSERT INTO match_keys
+                (target, match_key, first_seen, last_seen, first_scan_id, last_scan_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (target, match_key) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                last_scan_id = excluded.last_scan_id
+            """,
+            [
+                (self.target, row[10], self.started_at, self.started_at, self.scan_id, self.scan_id)
+                for row in self._pending
+                if row[10]
+            ]
+        )
+
+        self._pending = []
+
+    def finish_scan(self, score_data: Dict, metadata: Dict):
+        self._flush()
+
+        self.conn.execute(
+            """
+            UPDATE scans SET
+                completed_at = ?, total_findings = ?, risk_score = ?,
+                risk_grade = ?, metadata = ?
+            WHERE id = ?
+            """,
+            (
+                metadata.get("scan_completed_at"),
+                score_data.get("total_findings"),
+                score_data.get("risk_score"),
+                score_data.get("risk_grade"),
+                json.dumps(metadata),
+                self.scan_id
+            )
+        )
+
+        self.conn.execute("COMMIT")
+
+    def close(self):
+        self.conn.close()
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def latest_scan_id(self, target: Optional[str] = None) -> Optional[int]:
+        if target:
+            row = self.conn.execute(
+                "SELECT MAX(id) FROM scans WHERE target = ? AND completed_at IS NOT NULL",
+                (target,)
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT MAX(id) FROM scans WHERE completed_at IS NOT NULL"
+            ).fetchone()
+
+        return row[0]
+
+    @staticmethod
+    def _filters(
+        severity: Optional[List[str]],
+        path_prefix: Optional[str],
+        tool: Optional[str],
+        rule_id: Optional[str]
+    ):
+        clauses = []
+        params = []
+
+        if severity:
+            clauses.append(f"f.severity IN ({','.join('?' * len(severity))})")
+            params.extend(s.upper() for s in severity)
+
+        if path_prefix:
+            # Range scan instead of LIKE so the file index is used
+            prefix = path_prefix.rstrip("/") + "/"
+            clauses.append("(f.file = ? OR (f.file >= ? AND f.file < ?))")
+            params.extend([path_prefix.rstrip("/"), prefix, prefix[:-1] + "0"])
+
+        if tool:
+            clauses.append("(f.tool = ? OR ',' || f.tools || ',' LIKE ?)")
+            params.extend([tool, f"%,{tool},%"])
+
+        if rule_id:
+            clauses.append("f.rule_id = ?")
+            params.append(rule_id)
+
+        return clauses, params
+
+    def query(
+        self,
+        scan_id: Optional[int] = None,
+        target: Optional[str] = None,
+        severity: Optional[List[str]] = None,
+        path_prefix: Optional[str] = None,
+        tool: Optional[str] = None,
+        rule_id: Optional[str] = None,
+        min_age_days: Optional[float] = None,
+        limit: int = 1000
+    ) -> List[Dict]:
+        """
+        Findings from one scan (the latest by default) with the time
+        each was first seen, by match key, for that scan's target.
+        """
+        if scan_id is None:
+            scan_id = self.latest_scan_id(target)
+            if scan_id is None:
+                return []
+
+        clauses, params = self._filters(severity, path_prefix, tool, rule_id)
+        clauses.insert(0, "f.scan_id = ?")
+        params.insert(0, scan_id)
+
+        if min_age_days is not None:
+            cutoff = (datetime.now(UTC) - timedelta(days=min_age_days)).isoformat()
+            clauses.append("mk.first_seen <= ?")
+            params.append(cutoff)
+
+        sql = f"""
+            SELECT f.fingerprint, f.match_key, f.file, f.line, f.severity, f.tool,
+                   f.tools, f.rule_id, f.issue, mk.first_seen, mk.last_seen
+            FROM findings f
+            JOIN scans s ON s.id = f.scan_id
+            LEFT JOIN match_keys mk
+                ON mk.target = s.target AND mk.match_key = f.match_key
+            WHERE {' AND '.join(clauses)}
+            ORDER BY f.file, f.line
+            LIMIT ?
+        """
+        params.append(limit)
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def trend(
+        self,
+        target: Optional[str] = None,
+        severity: Optional[List[str]] = None,
+        path_prefix: Optional[str] = None,
+        tool: Optional[str] = None,
+        rule_id: Optional[str] = None,
+        last: int = 20
+    ) -> List[Dict]:
+        """
+        Per-scan finding counts by severity for the most recent scans.
+        """
+        clauses, params = self._filters(severity, path_prefix, tool, rule_id)
+
+        scan_clause = "completed_at IS NOT NULL"
+        scan_params = []
+        if target:
+            scan_clause += " AND target = ?"
+            scan_params.append(target)
+
+        sql = f"""
+            WITH recent AS (
+                SELECT id, target, started_at, risk_score, risk_grade FROM scans
+                WHERE {scan_clause}
+                ORDER BY id DESC LIMIT ?
+            )
+            SELECT r.id AS scan_id, r.target, r.started_at, r.risk_score, r.risk_grade,
+                   f.severity, COUNT(f.scan_id) AS count
+            FROM recent r
+            LEFT JOIN findings f ON f.scan_id = r.id
+                {'AND ' + ' AND '.join(clauses) if clauses else ''}
+            GROUP BY r.id, f.severity
+            ORDER BY r.id
+        """
+
+        trend = {}
+        for row in self.conn.execute(sql, scan_params + [last] + params):
+            entry = trend.setdefault(row["scan_id"], {
+                "scan_id": row["scan_id"],
+                "target": row["target"],
+                "started_at": row["started_at"],
+                "risk_score": row["risk_score"],
+                "risk_grade": row["risk_grade"],
+                "total": 0,
+                "severity_breakdown": {}
+            })
+
+            if row["severity"]:
+                entry["severity_breakdown"][row["severity"]] = row["count"]
+                entry["total"] += row["count"]
+
+        return list(trend.values())
@@ -0,0 +1,243 @@
+import os
+import re
+import json
+from typing import Dict, List, Iterator, Optional, Tuple, TextIO
+
+from secureops.decoding import orjson
+
+
+class JsonArrayStream:
+    """
+    Incrementally yields the elements of one array inside a JSON document
+    without loading the document. The array is addressed by the chain of
+    object keys leading to it; arrays along the way are transparent, so
+    ("results", "failed_checks") also matches inside a top-level list.
+    Memory use is bounded by the size of the largest single element.
+    With orjson installed, the complete object elements in each buffer
+    are decoded with one orjson call.
+    """
+
+    _STRUCTURAL = re.compile(r'[{}\[\],:"]')
+    _STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+    _WHITESPACE = re.compile(r'[\s,]*')
+    _NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+    # What follows the "}" ending a run of object elements
+    _RUN_BOUNDARY = re.compile(r'\s*(?:,\s*\{|\])')
+
+    # Failed run decodes before the stream falls back to element-wise
+    # decoding for good (elements holding arrays of objects)
+    MAX_RUN_FAILURES = 3
+
+    def __init__(self, fp: TextIO, path: Tuple[str, ...], chunk_size: int = 64 * 1024):
+        self.fp = fp
+        self.path = tuple(path)
+        self.chunk_size = chunk_size
+        self.truncated = False
+        self._decoder = json.JSONDecoder()
+        self._run_failures = 0 if orjson is not None else self.MAX_RUN_FAILURES
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int = 0) -> bool:
+        """
+        Drops consumed text and appends the next chunk.
+        Returns False once the input is exhausted.
+        """
+        if self._eof:
+            return False
+
+        data = self.fp.read(max(size, self.chunk_size))
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+
+        if not data:
+            self._eof = True
+            return False
+
+        return True
+
+    def __iter__(self) -> Iterator[Dict]:
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self) -> Iterator[List[Dict]]:
+        """
+        Yields the array's elements a buffer's worth at a time.
+        """
+        stack = []
+        keys = []
+        expect_key = False
+
+        while True:
+            match = self._STRUCTURAL.search(self._buf, self._pos)
+            if not match:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    return
+                continue
+
+            char = match.group()
+            self._pos = match.end()
+
+            if char == '"':
+                tail = self._STRING_TAIL.match(self._buf, self._pos)
+                if not tail:
+                    # String continues in the next chunk
+                    self._pos = match.start()
+                    if not self._fill():
+                        self.truncated = True
+                        return
+                    continue
+
+                self._pos = tail.end()
+                if expect_key:
+                    keys[-1] = json.loads(self._buf[match.start():self._pos])
+
+            elif char == "{":
+                stack.append("{")
+                keys.append(None)
+                expect_key = True
+
+            elif char == "[":
+                if stack and stack[-1] == "{" and tuple(keys) == self.path:
+                    yield from self._batches()
+                    if self.truncated:
+                        return
+                else:
+                    stack.append("[")
+                expect_key = False
+
+            elif char == "}":
+                if stack:
+                    stack.pop()
+                    keys.pop()
+                expect_key = False
+
+            elif char == "]":
+                if stack:
+                    stack.pop()
+                expect_key = False
+
+            elif char == ",":
+                expect_key = bool(stack) and stack[-1] == "{"
+
+            elif char == ":":
+                expect_key = False
+
+    def _batches(self) -> Iterator[List[Dict]]:
+        """
+        Decodes array elements until the closing bracket, a buffer's
+        worth at a time.
+        """
+        while True:
+            batch, state = self._decode_buffered()
+
+            if batch:
+                yield batch
+
+            if state == "end":
+                return
+
+            # Element spans the chunk boundary; grow the read size with
+            # the buffered element so large elements stay linear. A number
+            # at the very end of the input is complete once EOF is known
+            if not self._fill(len(self._buf) - self._pos) and state != "number":
+                self.truncated = True
+                return
+
+    def _decode_buffered(self) -> Tuple[List, str]:
+        """
+        Decodes the complete elements in the buffer. Returns them with
+        "end" at the closing bracket, or "fill" or "number" when more
+        input is needed.
+        """
+        batch = self._decode_run() or []
+
+        while True:
+            self._pos = self._WHITESPACE.match(self._buf, self._pos).end()
+
+            if self._pos >= len(self._buf):
+                return batch, "fill"
+
+            if self._buf[self._pos] == "]":
+                self._pos += 1
+                return batch, "end"
+
+            try:
+                item, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                return batch, "fill"
+
+            # A number cut off at a chunk boundary still decodes; make
+            # sure the character after it is buffered before accepting it
+            if isinstance(item, (int, float)) and not isinstance(item, bool) and not self._eof:
+                if end == len(self._buf) or self._buf[end] in self._NUMBER_CHARS:
+                    return batch, "number"
+
+            self._pos = end
+            batch.append(item)
+
+    def _decode_run(self) -> Optional[List]:
+        """
+        Decodes the buffered elements up to the last "}" followed by
+        another object or the closing bracket in one orjson call. That
+        "}" may close a nested object instead; the run then does not
+        parse, since it starts at an element and must balance, and the
+        elements are decoded one at a time.
+        """
+        if self._run_failures >= self.MAX_RUN_FAILURES:
+            return None
+
+        buf = self._buf
+        self._pos = self._WHITESPACE.match(buf, self._pos).end()
+        if not buf.startswith("{", self._pos):
+            return None
+
+        end = len(buf)
+
+        while True:
+            end = buf.rfind("}", self._pos, end)
+            if end < 0:
+                return None
+            if self._RUN_BOUNDARY.match(buf, end + 1):
+                break
+
+        try:
+            items = orjson.loads("[" + buf[self._pos:end + 1] + "]")
+        except orjson.JSONDecodeError:
+            self._run_failures += 1
+            return None
+
+        self._pos = end + 1
+        return items
+
+
+def iter_json_file(path: str, key_path: Tuple[str, ...], remove: bool = False) -> Iterator[Dict]:
+    """
+    Yields the elements of the array at key_path in a JSON file,
+    optionally deleting the file once it has been consumed.
+    """
+    for batch in iter_json_batches(path, key_path, remove):
+        yield from batch
+
+
+def iter_json_batches(
+    path: str,
+    key_path: Tuple[str, ...],
+    remove: bool = False
+) -> Iterator[List[Dict]]:
+    """
+    iter_json_file, one buffer's worth of elements at a time.
+    """
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            yield from JsonArrayStream(f, key_path).batches()
+    finally:
+        if remove:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
@@ -0,0 +1,252 @@
+import gzip
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from urllib.parse import quote
+from typing import Dict, List, Optional, TextIO
+
+from secureops.dedup import Deduplicator
+from secureops.finding import Finding
+
+
+class ReportWriter(ABC):
+    """
+    Base class for streaming report writers.
+    Findings are written as they are produced; metadata and summary,
+    which are only known at the end, go into a trailer or sidecar.
+    """
+
+    extension = ""
+
+    def __init__(
+        self,
+        base_path: Path,
+        compress: bool = False,
+        pretty: bool = False,
+        target_path: Optional[str] = None
+    ):
+        self.path = base_path.with_suffix(self.extension + (".gz" if compress else ""))
+        self.target_path = Path(target_path).resolve() if target_path else None
+        self.compress = compress
+        self.indent = 4 if pretty else None
+        self.count = 0
+        self._file = None
+
+    def _open(self, path: Path) -> TextIO:
+        if self.compress:
+            return gzip.open(path, "wt", encoding="utf-8")
+        return open(path, "w", encoding="utf-8")
+
+    def _dumps(self, value, depth: int = 0) -> str:
+        """
+        Serializes a value nested `depth` levels deep, so pretty output
+        lines up with the surrounding hand-written structure.
+        """
+        if self.indent is None:
+            return json.dumps(value, separators=(",", ":"))
+
+        text = json.dumps(value, indent=self.indent)
+        return text.replace("\n", "\n" + " " * (self.indent * depth))
+
+    def _newline(self, depth: int) -> str:
+        return "" if self.indent is None else "\n" + " " * (self.indent * depth)
+
+    def _separator(self) -> str:
+        return ":" if self.indent is None else ": "
+
+    @abstractmethod
+    def open(self, header: Dict):
+        ...
+
+    @abstractmethod
+    def write(self, finding: Dict):
+        ...
+
+    @abstractmethod
+    def close(self, metadata: Dict, summary: Dict) -> List[str]:
+        ...
+
+
+class JsonWriter(ReportWriter):
+    """
+    Single JSON document: header fields, the findings array,
+    then metadata and summary as a trailer.
+    """
+
+    extension = ".json"
+
+    def open(self, header: Dict):
+        self._file = self._open(self.path)
+        self._file.write("{")
+
+        for key, value in header.items():
+            self._file.write(f"{self._newline(1)}{json.dumps(key)}{self._separator()}{self._dumps(value, 1)},")
+
+        self._file.write(f"{self._newline(1)}\"findings\"{self._separator()}[")
+
+    def write(self, finding: Dict):
+        if self.count:
+            self._file.write(",")
+        self._file.write(self._newline(2) + self._dumps(finding, 2))
+        self.count += 1
+
+    def close(self, metadata: Dict, summary: Dict) -> List[str]:
+        if self.count:
+            self._file.write(self._newline(1))
+        self._file.write("],")
+
+        trailer = [("metadata", metadata), ("summary", summary)]
+        for index, (key, value) in enumerate(trailer):
+            comma = "," if index < len(trailer) - 1 else ""
+            self._file.write(f"{self._newline(1)}{json.dumps(key)}{self._separator()}{self._dumps(value, 1)}{comma}")
+
+        self._file.write(self._newline(0) + "}\n")
+        self._file.close()
+        return [str(self.path)]
+
+
+class NdjsonWriter(ReportWriter):
+    """
+    One finding per line. Header, metadata and summary go to a
+    `.summary.json` sidecar next to the findings file.
+    """
+
+    extension = ".ndjson"
+
+    def open(self, header: Dict):
+        self.header = header
+        self._file = self._open(self.path)
+
+    def write(self, finding: Dict):
+        self._file.write(json.dumps(finding, separators=(",", ":")))
+        self._file.write("\n")
+        self.count += 1
+
+    def close(self, metadata: Dict, summary: Dict) -> List[str]:
+        self._file.close()
+
+        sidecar_name = self.path.name.split(".")[0] + ".summary.json"
+        sidecar = self.path.with_name(sidecar_name)
+        sidecar_data = dict(self.header)
+        sidecar_data.update({
+            "findings_file": self.path.name,
+            "metadata": metadata,
+            "summary": summary
+        })
+
+        with open(sidecar, "w", encoding="utf-8") as f:
+            json.dump(sidecar_data, f, indent=self.indent)
+
+        return [str(self.path), str(sidecar)]
+
+
+class SarifWriter(ReportWriter):
+    """
+    SARIF 2.1.0 log with a single run. Results are streamed; scan
+    metadata and summary are written as run properties at the end.
+    Files under the scan target are located relative to %SRCROOT%,
+    anything else by file:// URI.
+    """
+
+    SRCROOT = "%SRCROOT%"
+
+    extension = ".sarif"
+
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+    LEVELS = {
+        "CRITICAL": "error",
+        "HIGH": "error",
+        "MEDIUM": "warning",
+        "LOW": "note"
+    }
+
+    def open(self, header: Dict):
+        self.header = header
+        self._file = self._open(self.path)
+        self._paths = Deduplicator(str(self.target_path)) if self.target_path else None
+
+        tool = {
+            "driver": {
+                "name": "SecureOps AI",
+                "informationUri": "https://github.com/Nagul-7/SecureOps-AI"
+            }
+        }
+
+        base_ids = ""
+        if self.target_path:
+            roots = {self.SRCROOT: {"uri": self.target_path.as_uri() + "/"}}
+            base_ids = f'"originalUriBaseIds":{json.dumps(roots)},'
+
+        self._file.write(
+            "{" + f'"$schema":{json.dumps(self.SCHEMA)},"version":"2.1.0",'
+            f'"runs":[{{"tool":{json.dumps(tool)},{base_ids}"results":['
+        )
+
+    def write(self, finding: Dict):
+        result = {
+            "ruleId": finding.get("rule_id") or finding.get("tool"),
+            "level": self.LEVELS.get(finding.get("severity"), "warning"),
+            "message": {"text": finding.get("issue") or ""},
+            "locations": [self._location(finding)],
+            "properties": {
+                key: finding[key]
+                for key in ("tool", "language", "severity", "recommended_fix", "auto_fix_possible")
+                if key in finding
+            }
+        }
+
+        if self.count:
+            self._file.write(",")
+        self._file.write(self._newline(1) + self._dumps(result, 1))
+        self.count += 1
+
+    def _artifact(self, file: Optional[str]) -> Dict:
+        if not file:
+            return {"uri": "unknown"}
+
+        path = Path(file)
+
+        if self._paths:
+            # A leading-slash path that does not exist is relative to the
+            # tool's scan root, as normalize_path() treats it
+            if (
+                not path.is_absolute()
+                or path.is_relative_to(self.target_path)
+                or not path.exists()
+            ):
+                relative = self._paths.normalize_path(file)
+                return {"uri": quote(relative), "uriBaseId": self.SRCROOT}
+
+        if path.is_absolute():
+            return {"uri": path.as_uri()}
+
+        return {"uri": quote(path.as_posix())}
+
+    def _location(self, finding: Dict) -> Dict:
+        physical = {"artifactLocation": self._artifact(finding.get("file"))}
+
+        line = finding.get("line")
+        if isinstance(line, int) and line > 0:
+            physical["region"] = {"startLine": line}
+
+        return {"physicalLocation": physical}
+
+    def close(self, metadata: Dict, summary: Dict) -> List[str]:
+        properties = dict(self.header)
+        properties.update({"metadata": metadata, "summary": summary})
+
+        self._file.write(f'],"properties":{json.dumps(properties)}}}]}}\n')
+        self._file.close()
+        return [str(self.path)]
+
+
+WRITERS = {
+    "json": JsonWriter,
+    "ndjson": NdjsonWriter,
+    "sarif": SarifWriter
+}
+
+
+def serialize(finding) -> Dict:
+    return finding.to_dict() if isinstance(finding, Finding) else finding
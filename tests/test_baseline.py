@@ -0,0 +1,86 @@
+import gzip
+import json
+
+from secureops.baseline import Baseline
+from secureops.finding import Finding
+
+
+def finding(fingerprint, match_key, severity="HIGH", line=1):
+    result = Finding("app.py", line, "issue", severity, "B105", "bandit", "python")
+    result.fingerprint = fingerprint
+    result.match_key = match_key
+    return result
+
+
+def entry(match_key, line=1, severity="HIGH"):
+    return {"file": "app.py", "line": line, "rule_id": "B105", "severity": severity, "match_key": match_key}
+
+
+def test_match_prefers_own_fingerprint():
+    baseline = Baseline({"fp1": entry("k", line=1), "fp2": entry("k", line=2)})
+
+    assert baseline._match(finding("fp2", "k")) == "fp2"
+
+
+def test_match_falls_back_to_first_unclaimed_match_key():
+    baseline = Baseline({"fp2": entry("k", line=9), "fp1": entry("k", line=3)})
+
+    # Shifted findings get new fingerprints; entries are taken in file order
+    shifted = finding("moved1", "k", line=4)
+    assert baseline.classify(shifted) == "existing"
+    assert baseline.seen == {"fp1"}
+
+    assert baseline._match(finding("moved2", "k", line=10)) == "fp2"
+    assert baseline._match(finding("other", "different")) is None
+
+
+def test_claimed_entry_never_matches_twice():
+    baseline = Baseline({"fp1": entry("k")})
+
+    first = finding("fp1", "k")
+    duplicate = finding("fp1", "k")
+
+    assert baseline.classify(first) == "existing"
+    assert baseline._match(duplicate) is None
+    assert baseline.classify(duplicate) == "new"
+    assert duplicate.baseline == "new"
+
+
+def test_n_copies_cover_at_most_n_findings():
+    baseline = Baseline({"fp1": entry("k", line=1), "fp2": entry("k", line=2)})
+
+    results = [baseline.classify(finding(f"moved{n}", "k", line=n + 10)) for n in range(3)]
+
+    assert results == ["existing", "existing", "new"]
+    assert baseline.counts == {"new": 1, "existing": 2}
+    assert baseline.fixed() == []
+
+
+def test_blocking_respects_fail_on_and_fixed_lists_unclaimed():
+    baseline = Baseline({"gone": entry("old")}, fail_on="HIGH")
+
+    baseline.classify(finding("low", "a", severity="LOW"))
+    high = finding("high", "b", severity="HIGH")
+    baseline.classify(high)
+
+    assert baseline.blocking == [high]
+    assert baseline.failed
+    assert baseline.fixed() == [dict(entry("old"), fingerprint="gone")]
+
+
+def test_write_and_load_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    findings = [
+        {"fingerprint": "fp1", "file": "app.py", "line": 1, "rule_id": "B105", "severity": "HIGH", "match_key": "k", "issue": "x"},
+        {"fingerprint": "fp1", "file": "app.py", "line": 1, "rule_id": "B105", "severity": "HIGH", "match_key": "k"},
+        {"file": "no_fingerprint.py"}
+    ]
+
+    assert Baseline.write(findings, str(path)) == 1
+    assert Baseline.load(str(path)).entries == {"fp1": entry("k")}
+
+    # Reports, gzipped or as NDJSON, load the same way
+    report = tmp_path / "report.ndjson.gz"
+    with gzip.open(report, "wt") as f:
+        f.write(json.dumps(findings[0]) + "\n\n")
+    assert Baseline.load(str(report)).entries == {"fp1": entry("k")}
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from secureops.dedup import Deduplicator
+from secureops.parser import Parser
+
+
+@pytest.fixture
+def modules(tmp_path):
+    # Two modules with identically named files, as checkov and trivy
+    # report them relative to each module
+    for module in ("a", "b"):
+        for name in ("infra/main.tf", "svc/Dockerfile"):
+            path = tmp_path / module / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"# {module}/{name}\n")
+    return tmp_path
+
+
+def checkov_result(root: Path, *modules: str):
+    return {
+        "tool": "checkov",
+        "language": "terraform",
+        "raw": [
+            {
+                "results": {
+                    "failed_checks": [{
+                        "check_id": "CKV_AWS_20",
+                        "check_name": "S3 bucket is public",
+                        "file_path": "/main.tf",
+                        "file_abs_path": str(root / module / "infra/main.tf"),
+                        "file_line_range": [1, 3]
+                    }]
+                }
+            }
+            for module in modules
+        ]
+    }
+
+
+def trivy_result(root: Path, *modules: str):
+    return {
+        "tool": "trivy",
+        "language": "docker",
+        "roots": [str(root / module / "svc") for module in modules],
+        "raw": [
+            {
+                "Results": [{
+                    "Target": "Dockerfile",
+                    "Misconfigurations": [{
+                        "ID": "DS002",
+                        "Title": "Image user should not be root",
+                        "Severity": "HIGH",
+                        "StartLine": 1
+                    }]
+                }]
+            }
+            for module in modules
+        ]
+    }
+
+
+def test_normalize_path_forms(modules):
+    dedup = Deduplicator(str(modules))
+
+    assert dedup.normalize_path(str(modules / "a/infra/main.tf")) == "a/infra/main.tf"
+    assert dedup.normalize_path("a/infra/main.tf") == "a/infra/main.tf"
+    assert dedup.normalize_path("/a/infra/main.tf") == "a/infra/main.tf"
+    assert dedup.normalize_path("/missing.tf") == "missing.tf"
+    assert dedup.normalize_path(None) == ""
+
+
+def test_checkov_modules_stay_apart(modules):
+    findings = Parser([checkov_result(modules, "a", "b")]).parse()
+    dedup = Deduplicator(str(modules))
+
+    assert [dedup.normalize_path(f.file) for f in findings] == ["a/infra/main.tf", "b/infra/main.tf"]
+    assert len(dedup.dedupe(findings)) == 2
+
+
+def test_trivy_targets_rerooted_on_scanned_directory(modules):
+    findings = Parser([trivy_result(modules, "a", "b")]).parse()
+    dedup = Deduplicator(str(modules))
+
+    assert [dedup.normalize_path(f.file) for f in findings] == ["a/svc/Dockerfile", "b/svc/Dockerfile"]
+    assert len(dedup.dedupe(findings)) == 2
+
+
+def test_match_key_survives_a_line_shift(modules):
+    finding = Parser([checkov_result(modules, "a")]).parse()[0]
+    assert Deduplicator(str(modules)).merge(finding) is None
+
+    # A line inserted above moves the finding down by one
+    path = modules / "a/infra/main.tf"
+    path.write_text("\n" + path.read_text())
+    shifted = Parser([checkov_result(modules, "a")]).parse()[0]
+    shifted.line += 1
+    assert Deduplicator(str(modules)).merge(shifted) is None
+
+    assert finding.fingerprint != shifted.fingerprint
+    assert finding.match_key == shifted.match_key
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from secureops.fixer import Fixer
+from secureops.patch import FilePatch
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Backups go under BACKUP_ROOT in the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def change(path, line_fixes):
+    patch = FilePatch(path)
+    applied, _ = patch.compute(line_fixes, Fixer._apply_fix)
+    return {"path": str(path), "patch": patch, "fixes": applied}
+
+
+def debug_off():
+    return {1: [{"type": "replace", "old": "True", "new": "False"}]}
+
+
+def test_commit_writes_all_files_and_rollback_restores_them(workdir):
+    first = workdir / "a.py"
+    second = workdir / "b.py"
+    first.write_text("DEBUG = True\n")
+    second.write_text("DEBUG = True\n")
+
+    fixer = Fixer([], workers=2)
+    fixer._commit([change(first, debug_off()), change(second, debug_off())])
+
+    assert first.read_text() == second.read_text() == "DEBUG = False\n"
+    assert fixer.stats["files_modified"] == 2
+
+    manifest = json.loads((fixer.run_dir / "manifest.json").read_text())
+    assert [entry["path"] for entry in manifest["files"]] == [str(first), str(second)]
+
+    # Also accepts the bare run id
+    assert Fixer.rollback(fixer.run_dir.name) == 2
+    assert first.read_text() == second.read_text() == "DEBUG = True\n"
+
+
+def test_failed_write_rolls_back_the_whole_run(workdir):
+    written = workdir / "a.py"
+    stale = workdir / "b.py"
+    written.write_text("DEBUG = True\n")
+    stale.write_text("DEBUG = True\n")
+
+    changes = [change(written, debug_off()), change(stale, debug_off())]
+    # Changed after the fixes were computed, so its write is refused
+    stale.write_text("DEBUG = True  # edited\n")
+
+    fixer = Fixer([], workers=2)
+    fixer.stats["fixes_applied"] = 2
+    fixer._commit(changes)
+
+    assert written.read_text() == "DEBUG = True\n"
+    assert stale.read_text() == "DEBUG = True  # edited\n"
+    assert fixer.stats["files_modified"] == 0
+    assert fixer.stats["fixes_applied"] == 0
+    assert fixer.stats["fixes_skipped"] == 2
+
+
+@pytest.mark.parametrize("fix, line, expected", [
+    ({"type": "replace_line", "line": "x = 2"}, "x = 1", "x = 2"),
+    ({"type": "replace", "old": "md5", "new": "sha256"}, "h = md5(data)", "h = sha256(data)"),
+    ({"type": "replace_value"}, 'api_key = "abc123"', 'api_key = os.getenv("API_KEY")'),
+    ({"type": "replace_value"}, "    self.token: str = 'x'  # note", "    self.token: str = os.getenv(\"TOKEN\")  # note"),
+    ({"type": "replace_value"}, "print('no assignment')", "print('no assignment')"),
+    ({"type": "unknown"}, "x = 1", "x = 1"),
+    (None, "x = 1", "x = 1")
+])
+def test_apply_fix(fix, line, expected):
+    assert Fixer._apply_fix(fix, line) == expected
@@ -0,0 +1,81 @@
+import pytest
+
+from secureops.fixer import Fixer
+from secureops.patch import FilePatch, UTF8_BOM
+
+
+def replace(old: str, new: str):
+    return {"type": "replace", "old": old, "new": new}
+
+
+def test_compute_and_write_minimal_edits(tmp_path):
+    path = tmp_path / "app.py"
+    path.write_bytes(b"import os\nDEBUG = True\nx = 1\n")
+
+    patch = FilePatch(path)
+    applied, skipped = patch.compute({2: [replace("True", "False"), replace("absent", "")]}, Fixer._apply_fix)
+
+    assert (applied, skipped) == (1, 1)
+    assert patch.edits == [(18, 21, b"Fals")]
+    assert path.read_bytes() == b"import os\nDEBUG = True\nx = 1\n"
+
+    patch.write()
+    assert path.read_bytes() == b"import os\nDEBUG = False\nx = 1\n"
+
+
+def test_write_keeps_crlf_bom_and_missing_final_newline(tmp_path):
+    path = tmp_path / "settings.py"
+    path.write_bytes(UTF8_BOM + b"DEBUG = True\r\nHOST = '0.0.0.0'")
+
+    patch = FilePatch(path)
+    patch.compute({1: [replace("True", "False")], 2: [replace("0.0.0.0", "127.0.0.1")]}, Fixer._apply_fix)
+    patch.write()
+
+    assert path.read_bytes() == UTF8_BOM + b"DEBUG = False\r\nHOST = '127.0.0.1'"
+
+
+def test_diff_shows_only_changed_lines_with_context(tmp_path):
+    path = tmp_path / "app.py"
+    path.write_text("".join(f"line{n}\n" for n in range(1, 11)))
+
+    patch = FilePatch(path)
+    patch.compute({5: [{"type": "replace_line", "line": "fixed"}]}, Fixer._apply_fix)
+
+    assert patch.diff("app.py") == [
+        "--- a/app.py",
+        "+++ b/app.py",
+        "@@ -2,7 +2,7 @@",
+        " line2",
+        " line3",
+        " line4",
+        "-line5",
+        "+fixed",
+        " line6",
+        " line7",
+        " line8"
+    ]
+
+
+def test_lines_past_the_end_are_ignored(tmp_path):
+    path = tmp_path / "app.py"
+    path.write_text("x = 1\n")
+
+    patch = FilePatch(path)
+
+    assert patch.compute({3: [replace("1", "2")]}, Fixer._apply_fix) == (0, 0)
+    assert patch.edits == []
+
+
+def test_write_refuses_a_file_changed_since_compute(tmp_path):
+    path = tmp_path / "app.py"
+    path.write_text("DEBUG = True\n")
+
+    patch = FilePatch(path)
+    patch.compute({1: [replace("True", "False")]}, Fixer._apply_fix)
+    path.write_text("DEBUG = True  # edited\n")
+
+    with pytest.raises(RuntimeError, match="changed since fixes were computed"):
+        patch.write()
+
+    assert path.read_text() == "DEBUG = True  # edited\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["app.py"]
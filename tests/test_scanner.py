@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from secureops.scanner import ScannerOrchestrator
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    return ScannerOrchestrator(str(tmp_path), secrets=False)
+
+
+def candidates(root: Path, *names: str):
+    return {root / name: f"key:{name}" for name in names}
+
+
+def test_match_file_exact_and_target_relative(orchestrator, tmp_path):
+    files = candidates(tmp_path, "app/main.py", "web/app.js")
+
+    assert orchestrator._match_file(str(tmp_path / "app/main.py"), files) == tmp_path / "app/main.py"
+    assert orchestrator._match_file("app/main.py", files) == tmp_path / "app/main.py"
+    assert orchestrator._match_file("/web/app.js", files) == tmp_path / "web/app.js"
+
+
+def test_match_file_requires_segment_boundary(orchestrator, tmp_path):
+    files = candidates(tmp_path, "pkg/ba.py")
+
+    assert orchestrator._match_file("a.py", files) is None
+    assert orchestrator._match_file("ba.py", files) == tmp_path / "pkg/ba.py"
+
+
+def test_match_file_ambiguous_suffix_matches_nothing(orchestrator, tmp_path):
+    files = candidates(tmp_path, "a/infra/main.tf", "b/infra/main.tf")
+
+    assert orchestrator._match_file("/main.tf", files) is None
+    assert orchestrator._match_file("infra/main.tf", files) is None
+    assert orchestrator._match_file("b/infra/main.tf", files) == tmp_path / "b/infra/main.tf"
+
+
+def test_match_file_empty_or_unknown(orchestrator, tmp_path):
+    files = candidates(tmp_path, "app.py")
+
+    assert orchestrator._match_file(None, files) is None
+    assert orchestrator._match_file("", files) is None
+    assert orchestrator._match_file("/", files) is None
+    assert orchestrator._match_file("other.py", files) is None
@@ -0,0 +1,83 @@
+import io
+import json
+import os
+
+import pytest
+
+from secureops.streaming import JsonArrayStream, iter_json_batches, iter_json_file
+
+
+def stream(text: str, path, chunk_size: int, element_wise: bool = False) -> JsonArrayStream:
+    items = JsonArrayStream(io.StringIO(text), path, chunk_size=chunk_size)
+    if element_wise:
+        # As without orjson: every element decoded on its own
+        items._run_failures = items.MAX_RUN_FAILURES
+    return items
+
+
+@pytest.fixture(params=[1, 4, 7, 64 * 1024], ids=lambda size: f"chunk{size}")
+def chunk_size(request):
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=["runs", "element_wise"])
+def element_wise(request):
+    return request.param
+
+
+def test_yields_array_at_key_path(chunk_size, element_wise):
+    report = {
+        "version": "1.0",
+        "errors": [{"skip": "[not this]"}],
+        "results": [
+            {"a": 1, "s": "quote \" and brace }"},
+            {"a": [2, {"b": 3}], "nested": {"results": [9]}},
+            "plain",
+            4.5e-1,
+            None
+        ],
+        "after": {"results": ["ignored"]}
+    }
+    items = stream(json.dumps(report), ("results",), chunk_size, element_wise)
+
+    assert list(items) == report["results"]
+    assert not items.truncated
+
+
+def test_arrays_along_the_key_path_are_transparent(chunk_size, element_wise):
+    text = '[{"results":{"failed_checks":[{"x":1}]}},{"results":{"failed_checks":[{"x":2},3]}}]'
+    items = stream(text, ("results", "failed_checks"), chunk_size, element_wise)
+
+    assert list(items) == [{"x": 1}, {"x": 2}, 3]
+
+
+def test_missing_or_empty_array(chunk_size):
+    assert list(stream('{"results": []}', ("results",), chunk_size)) == []
+    assert list(stream('{"other": [1, 2]}', ("results",), chunk_size)) == []
+    assert list(stream('{"results": {"failed_checks": null}}', ("results", "failed_checks"), chunk_size)) == []
+
+
+def test_truncated_document_keeps_complete_elements(chunk_size, element_wise):
+    text = '{"results": [{"a": 1}, {"a": [2, {"b": 3}]}, {"a": "x]}"'
+    items = stream(text, ("results",), chunk_size, element_wise)
+
+    assert list(items) == [{"a": 1}, {"a": [2, {"b": 3}]}]
+    assert items.truncated
+
+
+def test_iter_json_batches_removes_spooled_file(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_text(json.dumps({"results": [{"n": n} for n in range(100)]}))
+
+    batches = list(iter_json_batches(str(path), ("results",), remove=True))
+
+    assert [item["n"] for batch in batches for item in batch] == list(range(100))
+    assert not os.path.exists(path)
+
+
+def test_iter_json_file_keeps_file_by_default(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_text('{"results": [1, 2]}')
+
+    assert list(iter_json_file(str(path), ("results",))) == [1, 2]
+    assert path.exists()